@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from fnmatch import fnmatch
+from typing import Any, Iterable, Optional
+
+from app.recorder import snapshot_channels
+
+FIRING = "firing"
+RESOLVED = "resolved"
+# A firing rule whose metric stopped reporting for duration_s (sensor gone)
+STALE = "stale"
+
+
+@dataclass(frozen=True)
+class AlertRule:
+    """
+    Fires when `metric` stays beyond `threshold` for `duration_s` seconds and
+    resolves once it comes back past the hysteresis band.
+
+    metric is a snapshot channel name ("cpu", "gpu", "ram", "temp:<label>",
+    "fan:<label>") or an fnmatch pattern such as "temp:*", which uses the
+    worst matching channel.
+    """
+    name: str
+    metric: str
+    threshold: float
+    duration_s: float = 0.0
+    hysteresis: float = 0.0
+    above: bool = True  # False: fire when the value drops below threshold
+
+
+@dataclass(frozen=True)
+class AlertEvent:
+    rule: str
+    state: str  # FIRING, RESOLVED or STALE
+    metric: str
+    value: float
+    threshold: float
+    timestamp: float
+
+    @property
+    def message(self) -> str:
+        if self.state == FIRING:
+            return f"{self.rule}: {self.metric} = {self.value:.1f} (limit {self.threshold:g})"
+        if self.state == STALE:
+            return f"{self.rule}: cleared, no readings from {self.metric}"
+        return f"{self.rule}: back to normal ({self.metric} = {self.value:.1f})"
+
+
+def parse_rules(raw: Any) -> list[AlertRule]:
+    """
+    Build rules from the config.json "alerts" list, skipping malformed entries.
+    """
+    rules: list[AlertRule] = []
+    if not isinstance(raw, list):
+        return rules
+    for item in raw:
+        if not isinstance(item, dict):
+            continue
+        metric = item.get("metric")
+        try:
+            threshold = float(item["threshold"])
+            duration = max(0.0, float(item.get("duration_s", 0.0)))
+            hysteresis = max(0.0, float(item.get("hysteresis", 0.0)))
+        except (KeyError, TypeError, ValueError):
+            continue
+        if not isinstance(metric, str) or not metric:
+            continue
+        name = str(item.get("name") or metric)
+        above = str(item.get("direction", "above")).lower() != "below"
+        rules.append(AlertRule(name, metric, threshold, duration, hysteresis, above))
+    return rules
+
+
+class _RuleState:
+    __slots__ = ("rule", "columns", "pending_since", "firing", "last_reading")
+
+    def __init__(self, rule: AlertRule) -> None:
+        self.rule = rule
+        self.columns: tuple[int, ...] = ()
+        self.pending_since: Optional[float] = None
+        self.firing = False
+        self.last_reading: Optional[float] = None
+
+
+class AlertEngine:
+    """
+    Evaluates every rule against each snapshot in O(rules): only the current
+    pending/firing state per rule is kept, history is never rescanned.
+    Runs on the sensor hub thread.
+    """
+
+    def __init__(self, rules: Iterable[AlertRule] = ()) -> None:
+        self._states = [_RuleState(r) for r in rules]
+        self._channels: tuple[str, ...] = ()
+
+    @property
+    def rules(self) -> list[AlertRule]:
+        return [s.rule for s in self._states]
+
+    def active(self) -> list[str]:
+        return [s.rule.name for s in self._states if s.firing]
+
+    def _bind(self, channels: tuple[str, ...]) -> None:
+        # Channel -> column matching is redone only when the sensor set changes
+        self._channels = channels
+        for st in self._states:
+            st.columns = tuple(i for i, c in enumerate(channels) if fnmatch(c, st.rule.metric))
+
+    def evaluate(self, snap) -> list[AlertEvent]:
+        channels, values = snapshot_channels(snap)
+        if channels != self._channels:
+            self._bind(channels)
+
+        events: list[AlertEvent] = []
+        ts = snap.timestamp
+        for st in self._states:
+            rule = st.rule
+            # NaN (no reading) compares false and is skipped
+            readings = [values[i] for i in st.columns if values[i] == values[i]]
+            if not readings:
+                st.pending_since = None
+                if st.firing and (st.last_reading is None or ts - st.last_reading >= rule.duration_s):
+                    st.firing = False
+                    events.append(AlertEvent(rule.name, STALE, rule.metric, math.nan, rule.threshold, ts))
+                continue
+            st.last_reading = ts
+            value = max(readings) if rule.above else min(readings)
+
+            if st.firing:
+                cleared = value < rule.threshold - rule.hysteresis if rule.above else value > rule.threshold + rule.hysteresis
+                if cleared:
+                    st.firing = False
+                    st.pending_since = None
+                    events.append(AlertEvent(rule.name, RESOLVED, rule.metric, value, rule.threshold, ts))
+                continue
+
+            beyond = value > rule.threshold if rule.above else value < rule.threshold
+            if not beyond:
+                st.pending_since = None
+                continue
+            if st.pending_since is None:
+                st.pending_since = ts
+            if ts - st.pending_since >= rule.duration_s:
+                st.firing = True
+                events.append(AlertEvent(rule.name, FIRING, rule.metric, value, rule.threshold, ts))
+        return events
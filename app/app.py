@@ -8,20 +8,46 @@ import os
 from pathlib import Path
 from PySide6.QtWidgets import QApplication
 
+from app.alerts import parse_rules
 from app.config import load_config, save_config
+from app.log_store import LogStore
+from app.logger import LOGS_DIR, get_logger
 from app.screens import get_screen_geometry
+from app.sensors import SensorHub, SensorSampler, get_sensor_hub, set_sensor_hub
+from app.state import get_state_store
 from app.window import MainWindow
+from app.window_style import apply_state_style
 from ui.launcher import LaunchDialog
 
 
+def _arg_value(args: List[str], flag: str) -> str | None:
+    # Supports "--flag value" and "--flag=value"
+    for i, a in enumerate(args):
+        if a == flag and i + 1 < len(args):
+            return args[i + 1]
+        if a.startswith(flag + "="):
+            return a[len(flag) + 1:]
+    return None
+
+
 def run_app(argv: List[str] | None = None) -> int:
     args = argv if argv is not None else sys.argv[1:]
 
+    # --replay FILE|synthetic [--speed N]: play metrics back instead of sampling
+    replay = _arg_value(args, "--replay")
+    try:
+        speed = float(_arg_value(args, "--speed") or 1.0)
+    except ValueError:
+        speed = 1.0
+    speed = max(0.01, speed)
+
     # Create Qt app first (needed for dialogs)
     app = QApplication(sys.argv)
     app.setStyle("Fusion")
     # Use a reasonable default system font size for consistent UI scaling
     app.setFont(QFont("Segoe UI", 14))
+    # State colours (ok/warn/alert) are resolved from one app-wide sheet
+    apply_state_style(app)
 
     # Optionally set app icon if available at assets/icon.ico
     project_root = Path(__file__).resolve().parents[1]
@@ -47,8 +73,42 @@ def run_app(argv: List[str] | None = None) -> int:
         cfg = dlg.apply_to_config()
         save_config(cfg)
 
+    # One sampler thread feeds every metric widget
+    if replay:
+        from app.replay import open_replay
+
+        try:
+            sampler = open_replay(replay)
+        except (OSError, ValueError) as e:
+            print(f"Cannot replay {replay}: {e}", file=sys.stderr)
+            return 2
+        # One recorded sample per tick, ticking `speed` times faster
+        set_sensor_hub(SensorHub(interval_ms=max(1, round(1000 / speed)), sampler_factory=lambda: sampler))
+    elif "--collector" in args:
+        from app.collector import CollectorSampler
+
+        # Sensors are read in a separate process; the hub only polls shared memory,
+        # so a hung driver can't stall it
+        set_sensor_hub(SensorHub(
+            interval_ms=250, sampler_factory=lambda: CollectorSampler(io_filters=cfg.io_filters)
+        ))
+    else:
+        set_sensor_hub(SensorHub(sampler_factory=lambda: SensorSampler(io_filters=cfg.io_filters)))
+    # Log pipeline: batched to the UI, everything to compressed, indexed history on its own thread
+    logger = get_logger()
+    logger.start(file_sink=LogStore(LOGS_DIR))
+    # Widget state is written in the background; the last changes go out on
+    # quit, before the logger stops
+    app.aboutToQuit.connect(get_state_store().close)
+    app.aboutToQuit.connect(logger.close)
+
+    hub = get_sensor_hub()
+    hub.set_alert_rules(parse_rules(cfg.alerts))
+    app.aboutToQuit.connect(hub.stop)
+
     geom = get_screen_geometry(cfg.display_index)
-    win = MainWindow(geom, cfg)
+    win = MainWindow(geom, cfg, record_metrics=not replay)
+    hub.start()
     win.show()
 
     return app.exec()
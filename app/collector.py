@@ -0,0 +1,301 @@
+from __future__ import annotations
+
+import math
+import multiprocessing
+import struct
+import time
+from multiprocessing import shared_memory
+from typing import Optional
+
+from app.gpu import GpuReading
+from app.io_rates import DeviceRate, IoRates
+from app.logger import get_logger
+from app.processes import ProcessInfo, TopProcesses
+from app.sensors import SensorSampler, SensorSnapshot
+
+# Shared block layout (little endian, fixed size):
+#   0   u64 sequence   written by the collector; odd while a write is in progress
+#   8   u32 top_n      written by the dashboard: processes wanted (0 = none)
+#   16  body           one snapshot, BODY below
+MAX_CORES = 256
+MAX_SENSORS = 32
+MAX_PROCESSES = 16
+_LABEL = 24  # bytes per sensor / process name
+
+_SEQ = struct.Struct("<Q")
+_TOP_N = struct.Struct("<I")
+_TOP_N_OFFSET = 8
+_BODY_OFFSET = 16
+BODY = struct.Struct(
+    "<d4f4d"            # timestamp, cpu %, ram GB, ram %, cpu MHz; net rx/tx, disk read/write
+    "3B16s4f"           # has_net, has_disk, has_gpu; gpu source, load, vram used/total, temp
+    "5H"                # core, temperature, fan, by-cpu and by-rss process counts
+    f"{MAX_CORES}f"
+    + f"{_LABEL}sf" * (2 * MAX_SENSORS)
+    + f"I{_LABEL}sfQ" * (2 * MAX_PROCESSES)
+)
+SIZE = _BODY_OFFSET + BODY.size
+
+_NAN = math.nan
+
+
+def _opt(v: Optional[float]) -> float:
+    return _NAN if v is None else float(v)
+
+
+def _unopt(v: float) -> Optional[float]:
+    return None if math.isnan(v) else v
+
+
+def _label(text: str) -> bytes:
+    return text.encode("utf-8")[:_LABEL]
+
+
+def _unlabel(raw: bytes) -> str:
+    return raw.rstrip(b"\0").decode("utf-8", "ignore")
+
+
+def encode_snapshot(snap: SensorSnapshot) -> list:
+    """Flatten a snapshot into BODY's field order (lists are truncated to fit)."""
+    gpu = snap.gpu
+    io = snap.io
+    cores = snap.cpu_per_core[:MAX_CORES]
+    temps = snap.temperatures[:MAX_SENSORS]
+    fans = snap.fans[:MAX_SENSORS]
+    by_cpu = snap.processes.by_cpu[:MAX_PROCESSES]
+    by_rss = snap.processes.by_rss[:MAX_PROCESSES]
+
+    out: list = [
+        snap.timestamp, snap.cpu_percent, snap.ram_used_gb, snap.ram_percent, _opt(snap.cpu_freq_mhz),
+        io.net_rx_bps, io.net_tx_bps, io.disk_read_bps, io.disk_write_bps,
+        bool(io.net), bool(io.disk), gpu is not None,
+        _label(gpu.source) if gpu else b"",
+        _opt(gpu.load_percent) if gpu else _NAN,
+        _opt(gpu.vram_used_mb) if gpu else _NAN,
+        _opt(gpu.vram_total_mb) if gpu else _NAN,
+        _opt(gpu.temp_c) if gpu else _NAN,
+        len(cores), len(temps), len(fans), len(by_cpu), len(by_rss),
+    ]
+    out.extend(cores)
+    out.extend([0.0] * (MAX_CORES - len(cores)))
+    for readings in (temps, fans):
+        for label, value in readings:
+            out += (_label(label), value)
+        out.extend((b"", 0.0) * (MAX_SENSORS - len(readings)))
+    for procs in (by_cpu, by_rss):
+        for p in procs:
+            out += (p.pid, _label(p.name), p.cpu_percent, p.rss_bytes)
+        out.extend((0, b"", 0.0, 0) * (MAX_PROCESSES - len(procs)))
+    return out
+
+
+def decode_snapshot(values: tuple) -> SensorSnapshot:
+    (ts, cpu, ram_gb, ram_pct, freq, rx, tx, rd, wr, has_net, has_disk, has_gpu,
+     gpu_source, gpu_load, vram_used, vram_total, gpu_temp,
+     n_cores, n_temps, n_fans, n_by_cpu, n_by_rss) = values[:22]
+    pos = 22
+    cores = tuple(values[pos:pos + n_cores])
+    pos += MAX_CORES
+
+    def readings(count: int) -> tuple[tuple[str, float], ...]:
+        return tuple((_unlabel(values[pos + 2 * i]), values[pos + 2 * i + 1]) for i in range(count))
+
+    temps = readings(n_temps)
+    pos += 2 * MAX_SENSORS
+    fans = readings(n_fans)
+    pos += 2 * MAX_SENSORS
+
+    def processes(count: int) -> tuple[ProcessInfo, ...]:
+        rows = []
+        for i in range(count):
+            pid, name, pct, rss = values[pos + 4 * i:pos + 4 * i + 4]
+            rows.append(ProcessInfo(pid, _unlabel(name), pct, rss))
+        return tuple(rows)
+
+    by_cpu = processes(n_by_cpu)
+    pos += 4 * MAX_PROCESSES
+    by_rss = processes(n_by_rss)
+
+    # Per-device rates are collapsed to one total per family
+    io = IoRates(
+        net=(DeviceRate("total", rx, tx),) if has_net else (),
+        disk=(DeviceRate("total", rd, wr),) if has_disk else (),
+    )
+    gpu = None
+    if has_gpu:
+        gpu = GpuReading(_unlabel(gpu_source), _unopt(gpu_load), _unopt(vram_used), _unopt(vram_total), _unopt(gpu_temp))
+    return SensorSnapshot(
+        timestamp=ts,
+        cpu_percent=cpu,
+        cpu_per_core=cores,
+        ram_used_gb=round(ram_gb, 1),
+        ram_percent=ram_pct,
+        cpu_freq_mhz=_unopt(freq),
+        temperatures=temps,
+        fans=fans,
+        gpu=gpu,
+        io=io,
+        processes=TopProcesses(by_cpu, by_rss),
+    )
+
+
+class SnapshotWriter:
+    """
+    Single writer side of the seqlock: bump the sequence to odd, write the
+    body, bump it back to even.
+    """
+
+    def __init__(self, buf: memoryview) -> None:
+        self._buf = buf
+        # Continue from what a previous collector left (odd = it died mid-write)
+        self._seq = _SEQ.unpack_from(buf, 0)[0]
+        self._seq += self._seq & 1
+
+    def requested_top_n(self) -> int:
+        return _TOP_N.unpack_from(self._buf, _TOP_N_OFFSET)[0]
+
+    def write(self, snap: SensorSnapshot) -> None:
+        self._seq += 1
+        _SEQ.pack_into(self._buf, 0, self._seq)
+        BODY.pack_into(self._buf, _BODY_OFFSET, *encode_snapshot(snap))
+        self._seq += 1
+        _SEQ.pack_into(self._buf, 0, self._seq)
+
+
+class SnapshotReader:
+    """
+    Lock-free reader side: copy the body and keep it only if the sequence
+    was even and unchanged across the copy.
+    """
+
+    RETRIES = 100
+
+    def __init__(self, buf: memoryview) -> None:
+        self._buf = buf
+        self._seq = 0
+
+    @property
+    def sequence(self) -> int:
+        return _SEQ.unpack_from(self._buf, 0)[0]
+
+    def request_top_n(self, top_n: int) -> None:
+        _TOP_N.pack_into(self._buf, _TOP_N_OFFSET, top_n)
+
+    def read(self) -> Optional[SensorSnapshot]:
+        """The newest snapshot, or None if nothing new was published."""
+        for _ in range(self.RETRIES):
+            before = _SEQ.unpack_from(self._buf, 0)[0]
+            if before & 1:
+                continue
+            if before == self._seq:
+                return None
+            body = bytes(self._buf[_BODY_OFFSET:_BODY_OFFSET + BODY.size])
+            if _SEQ.unpack_from(self._buf, 0)[0] == before:
+                self._seq = before
+                return decode_snapshot(BODY.unpack(body))
+        return None
+
+
+def collector_main(shm_name: str, interval_s: float, io_filters: Optional[dict] = None) -> None:
+    """Entry point of the collector process."""
+    # Attaching re-registers the block with the dashboard's resource tracker,
+    # which is a no-op; only the dashboard unlinks it
+    shm = shared_memory.SharedMemory(name=shm_name)
+    writer = SnapshotWriter(shm.buf)
+    sampler = SensorSampler(io_filters=io_filters)
+    parent = multiprocessing.parent_process()
+    top_n = 0
+    try:
+        while parent is None or parent.is_alive():
+            started = time.monotonic()
+            wanted = writer.requested_top_n()
+            if wanted and wanted != top_n:
+                sampler.enable_processes(wanted)
+                top_n = wanted
+            try:
+                writer.write(sampler.sample())
+            except Exception:
+                pass
+            time.sleep(max(0.0, interval_s - (time.monotonic() - started)))
+    finally:
+        sampler.close()
+        shm.close()
+
+
+class CollectorSampler:
+    """
+    SensorHub sampler that reads snapshots published by a collector process.
+    sample() never blocks on a sensor: it returns None until the collector
+    publishes something new. A collector that exits, or stops publishing for
+    stale_after_s (hung driver), is killed and started again.
+    """
+
+    def __init__(
+        self, interval_ms: int = 1000, stale_after_s: float = 10.0, target=collector_main,
+        io_filters: Optional[dict] = None,
+    ) -> None:
+        self._interval_s = interval_ms / 1000.0
+        self._io_filters = io_filters
+        self._stale_after_s = stale_after_s
+        self._target = target
+        self._shm: Optional[shared_memory.SharedMemory] = shared_memory.SharedMemory(create=True, size=SIZE)
+        self._shm.buf[:SIZE] = bytes(SIZE)
+        self._reader = SnapshotReader(self._shm.buf)
+        # spawn: never fork a process that is running Qt threads
+        self._ctx = multiprocessing.get_context("spawn")
+        self._proc: Optional[multiprocessing.process.BaseProcess] = None
+        self.restarts = 0
+        self._start()
+
+    @property
+    def pid(self) -> Optional[int]:
+        return self._proc.pid if self._proc is not None else None
+
+    def _start(self) -> None:
+        self._proc = self._ctx.Process(
+            target=self._target, args=(self._shm.name, self._interval_s, self._io_filters), name="sensor-collector", daemon=True
+        )
+        self._proc.start()
+        self._last_change = time.monotonic()
+        self._last_seq = self._reader.sequence
+
+    def _kill(self) -> None:
+        if self._proc is None:
+            return
+        if self._proc.is_alive():
+            self._proc.terminate()
+            self._proc.join(1.0)
+            if self._proc.is_alive():
+                self._proc.kill()
+        self._proc.join(1.0)
+        self._proc = None
+
+    def _supervise(self) -> None:
+        now = time.monotonic()
+        seq = self._reader.sequence
+        if seq != self._last_seq:
+            self._last_seq = seq
+            self._last_change = now
+        hung = now - self._last_change > self._stale_after_s
+        if self._proc is None or not self._proc.is_alive() or hung:
+            if self._proc is not None:
+                # Runs on the sensor thread; the logger queue is thread-safe
+                reason = "hung" if hung and self._proc.is_alive() else "exited"
+                get_logger().warning("collector", f"sensor process {reason}, restarting")
+            self._kill()
+            self.restarts += 1
+            self._start()
+
+    def enable_processes(self, top_n: int) -> None:
+        self._reader.request_top_n(top_n)
+
+    def sample(self) -> Optional[SensorSnapshot]:
+        self._supervise()
+        return self._reader.read()
+
+    def close(self) -> None:
+        self._kill()
+        if self._shm is not None:
+            self._shm.close()
+            self._shm.unlink()
+            self._shm = None
@@ -10,6 +10,7 @@ CONFIG_PATH = Path(__file__).resolve().parents[1] / "config.json"
 # Slot-based layout (6 vertical slots for single-column layout)
 SLOTS: list[str] = ["slot_1", "slot_2", "slot_3", "slot_4", "slot_5", "slot_6"]
 
+# Every type must have a spec in ui.registry (checked when that is imported)
 WIDGET_TYPES: list[str] = [
     "university",
     "metrics",
@@ -34,6 +35,8 @@ WIDGET_TYPES: list[str] = [
     "focus_music",
     "github_notifications",
     "fan_speed",
+    "cpu_cores",
+    "top_processes",
 ]
 
 DEFAULT_LAYOUT: dict[str, str] = {
@@ -89,12 +92,40 @@ PRESETS: dict[str, dict[str, str]] = {
     },
 }
 
+# Threshold alert rules (see app/alerts.py). metric is a snapshot channel
+# ("cpu", "gpu", "ram", "temp:<label>", "fan:<label>") or a pattern like "temp:*".
+DEFAULT_ALERTS: list[dict[str, Any]] = [
+    {"name": "Overheating", "metric": "temp:*", "threshold": 85.0, "duration_s": 30.0, "hysteresis": 5.0},
+]
+
+# What each metrics tile shows: the raw reading, its EMA ("smoothed"), or the
+# mean / 95th percentile over the last STATS_WINDOW_SECONDS
+METRIC_DISPLAY_MODES: tuple[str, ...] = ("raw", "smoothed", "mean", "p95")
+DEFAULT_METRIC_DISPLAY: dict[str, str] = {"cpu": "smoothed", "gpu": "smoothed", "ram": "raw"}
+
+# Lines kept by the logs panel before the oldest are dropped
+DEFAULT_LOG_MAX_LINES = 5000
+
+# Devices counted by the network / disk rates (see app/io_rates.py): fnmatch
+# globs, an empty include list means every device that is not excluded. The
+# excludes match io_rates.DEFAULT_NIC_EXCLUDE / DEFAULT_DISK_EXCLUDE.
+DEFAULT_IO_FILTERS: dict[str, list[str]] = {
+    "net_include": [],
+    "net_exclude": ["lo", "lo0", "Loopback*"],
+    "disk_include": [],
+    "disk_exclude": ["loop*", "ram*", "zram*"],
+}
+
 
 @dataclass
 class AppConfig:
     display_index: int = -1  # -1 means "not chosen yet"
     layout: dict[str, str] = None  # type: ignore[assignment]
     widget_order: list[str] = None
+    alerts: list[dict[str, Any]] = None
+    metric_display: dict[str, str] = None
+    log_max_lines: int = DEFAULT_LOG_MAX_LINES
+    io_filters: dict[str, list[str]] = None
 
 
 def _normalise_layout(layout: Any) -> dict[str, str]:
@@ -134,16 +165,45 @@ def _normalise_order(order: Any) -> list[str]:
     return cleaned
 
 
+def _normalise_alerts(alerts: Any) -> list[dict[str, Any]]:
+    # Missing key: defaults. Entries are validated again by alerts.parse_rules()
+    if not isinstance(alerts, list):
+        return [dict(a) for a in DEFAULT_ALERTS]
+    return [a for a in alerts if isinstance(a, dict)]
+
+
+def _normalise_metric_display(display: Any) -> dict[str, str]:
+    merged = dict(DEFAULT_METRIC_DISPLAY)
+    if isinstance(display, dict):
+        for k in DEFAULT_METRIC_DISPLAY:
+            v = display.get(k)
+            if isinstance(v, str) and v in METRIC_DISPLAY_MODES:
+                merged[k] = v
+    return merged
+
+
+def _normalise_io_filters(filters: Any) -> dict[str, list[str]]:
+    merged = {k: list(v) for k, v in DEFAULT_IO_FILTERS.items()}
+    if isinstance(filters, dict):
+        for k in DEFAULT_IO_FILTERS:
+            v = filters.get(k)
+            if isinstance(v, list):
+                merged[k] = [p for p in v if isinstance(p, str)]
+    return merged
+
+
 def load_config() -> AppConfig:
     if not CONFIG_PATH.exists():
-        cfg = AppConfig(display_index=-1, layout=dict(DEFAULT_LAYOUT))
+        cfg = AppConfig(display_index=-1, layout=dict(DEFAULT_LAYOUT), alerts=_normalise_alerts(None),
+                        metric_display=dict(DEFAULT_METRIC_DISPLAY), io_filters=_normalise_io_filters(None))
         save_config(cfg)
         return cfg
 
     try:
         data = json.loads(CONFIG_PATH.read_text(encoding="utf-8"))
     except Exception:
-        cfg = AppConfig(display_index=-1, layout=dict(DEFAULT_LAYOUT))
+        cfg = AppConfig(display_index=-1, layout=dict(DEFAULT_LAYOUT), alerts=_normalise_alerts(None),
+                        metric_display=dict(DEFAULT_METRIC_DISPLAY), io_filters=_normalise_io_filters(None))
         save_config(cfg)
         return cfg
 
@@ -155,7 +215,18 @@ def load_config() -> AppConfig:
 
     layout = _normalise_layout(data.get("layout") if isinstance(data, dict) else None)
     order = _normalise_order(data.get("widget_order") if isinstance(data, dict) else None)
-    return AppConfig(display_index=display_index, layout=layout, widget_order=order)
+    alerts = _normalise_alerts(data.get("alerts") if isinstance(data, dict) else None)
+    metric_display = _normalise_metric_display(data.get("metric_display") if isinstance(data, dict) else None)
+    io_filters = _normalise_io_filters(data.get("io_filters") if isinstance(data, dict) else None)
+    log_max_lines = DEFAULT_LOG_MAX_LINES
+    if isinstance(data, dict):
+        lm = data.get("log_max_lines")
+        if isinstance(lm, int) and not isinstance(lm, bool) and lm > 0:
+            log_max_lines = lm
+    return AppConfig(
+        display_index=display_index, layout=layout, widget_order=order, alerts=alerts, metric_display=metric_display,
+        log_max_lines=log_max_lines, io_filters=io_filters,
+    )
 
 
 def save_config(cfg: AppConfig) -> None:
@@ -165,5 +236,11 @@ def save_config(cfg: AppConfig) -> None:
         payload["layout"] = dict(DEFAULT_LAYOUT)
     if not isinstance(payload.get("widget_order"), list):
         payload["widget_order"] = [w for w in WIDGET_TYPES if w != "blank"]
+    if not isinstance(payload.get("alerts"), list):
+        payload["alerts"] = _normalise_alerts(None)
+    if not isinstance(payload.get("metric_display"), dict):
+        payload["metric_display"] = dict(DEFAULT_METRIC_DISPLAY)
+    if not isinstance(payload.get("io_filters"), dict):
+        payload["io_filters"] = _normalise_io_filters(None)
 
     CONFIG_PATH.write_text(json.dumps(payload, indent=2), encoding="utf-8")
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Callable, Optional, Sequence
+
+import psutil
+
+
+@dataclass(frozen=True)
+class CpuLoad:
+    """
+    CPU utilisation (0-100) since the previous sample.
+    """
+    total: float = 0.0
+    per_core: tuple[float, ...] = ()
+
+
+def _busy_total(times: Any) -> tuple[float, float]:
+    total = float(sum(times))
+    # guest time is already counted in user/nice on Linux
+    total -= getattr(times, "guest", 0.0) + getattr(times, "guest_nice", 0.0)
+    idle = times.idle + getattr(times, "iowait", 0.0)
+    return total - idle, total
+
+
+def _percent(busy: float, total: float) -> float:
+    if total <= 0.0:
+        return 0.0
+    return max(0.0, min(100.0, 100.0 * busy / total))
+
+
+class CpuLoadEngine:
+    """
+    Non-blocking CPU load: keeps the previous per-core cpu_times snapshot and
+    computes utilisation from the deltas, so no call ever sleeps.
+
+    The first sample is measured against boot (all counters zero), which gives
+    the since-boot average instead of a meaningless 0%.
+    """
+
+    def __init__(self, reader: Optional[Callable[[], Sequence[Any]]] = None) -> None:
+        self._reader = reader or (lambda: psutil.cpu_times(percpu=True))
+        self._prev: Optional[list[tuple[float, float]]] = None
+
+    def sample(self) -> CpuLoad:
+        return self.update(self._reader())
+
+    def update(self, per_core_times: Sequence[Any]) -> CpuLoad:
+        current = [_busy_total(t) for t in per_core_times]
+
+        prev = self._prev
+        if prev is None or len(prev) != len(current):
+            # First sample or CPU hotplug: measure from zero
+            prev = [(0.0, 0.0)] * len(current)
+        self._prev = current
+
+        per_core: list[float] = []
+        busy_sum = 0.0
+        total_sum = 0.0
+        for (busy, total), (prev_busy, prev_total) in zip(current, prev):
+            d_busy = busy - prev_busy
+            d_total = total - prev_total
+            per_core.append(_percent(d_busy, d_total))
+            busy_sum += d_busy
+            total_sum += d_total
+
+        return CpuLoad(total=_percent(busy_sum, total_sum), per_core=tuple(per_core))
+
+    def reset(self) -> None:
+        self._prev = None
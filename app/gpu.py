@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import shutil
+import subprocess
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+SYSFS_ROOT = Path("/sys")
+
+
+@dataclass(frozen=True)
+class GpuReading:
+    """
+    One GPU sample. Fields a provider cannot supply are None.
+    """
+    source: str
+    load_percent: float
+    vram_used_mb: Optional[float] = None
+    vram_total_mb: Optional[float] = None
+    temp_c: Optional[float] = None
+
+
+class GpuProvider(ABC):
+    """
+    Base class for GPU load sources. read() runs on the sampler thread
+    and returns None when the source stops answering.
+    """
+    name = "gpu"
+
+    @abstractmethod
+    def read(self) -> Optional[GpuReading]:
+        ...
+
+
+def _read_number(path: Path) -> Optional[float]:
+    try:
+        return float(path.read_text(encoding="ascii").strip())
+    except (OSError, ValueError):
+        return None
+
+
+class SysfsGpuProvider(GpuProvider):
+    """
+    Linux DRM devices exposing gpu_busy_percent (amdgpu and friends).
+    VRAM comes from mem_info_vram_*, temperature from the device's hwmon.
+    """
+
+    def __init__(self, device_dir: Path) -> None:
+        self.device_dir = device_dir
+        self.name = f"sysfs:{device_dir.parent.name}"
+        self._busy = device_dir / "gpu_busy_percent"
+        self._vram_used = device_dir / "mem_info_vram_used"
+        self._vram_total = device_dir / "mem_info_vram_total"
+        # hwmon directory is fixed once the driver is loaded, resolve it now
+        temps = sorted(device_dir.glob("hwmon/hwmon*/temp1_input"))
+        self._temp = temps[0] if temps else None
+
+    def read(self) -> Optional[GpuReading]:
+        busy = _read_number(self._busy)
+        if busy is None:
+            return None
+        used = _read_number(self._vram_used)
+        total = _read_number(self._vram_total)
+        temp = _read_number(self._temp) if self._temp is not None else None
+        return GpuReading(
+            source=self.name,
+            load_percent=busy,
+            vram_used_mb=used / (1024**2) if used is not None else None,
+            vram_total_mb=total / (1024**2) if total is not None else None,
+            temp_c=temp / 1000.0 if temp is not None else None,
+        )
+
+
+class NvidiaSmiProvider(GpuProvider):
+    """
+    Optional provider that shells out to nvidia-smi (or a compatible command).
+    """
+    QUERY = "utilization.gpu,memory.used,memory.total,temperature.gpu"
+
+    def __init__(self, command: str = "nvidia-smi", timeout: float = 2.0) -> None:
+        self.command = command
+        self.timeout = timeout
+        self.name = f"cmd:{Path(command).name}"
+
+    def read(self) -> Optional[GpuReading]:
+        try:
+            out = subprocess.run(
+                [self.command, f"--query-gpu={self.QUERY}", "--format=csv,noheader,nounits"],
+                capture_output=True,
+                text=True,
+                timeout=self.timeout,
+                check=True,
+            ).stdout
+        except (OSError, subprocess.SubprocessError):
+            return None
+        return self.parse(out, self.name)
+
+    @staticmethod
+    def parse(output: str, source: str = "cmd") -> Optional[GpuReading]:
+        # First GPU only: "37, 1024, 8192, 55"
+        lines = [ln for ln in output.splitlines() if ln.strip()]
+        if not lines:
+            return None
+        fields = [f.strip() for f in lines[0].split(",")]
+
+        def num(i: int) -> Optional[float]:
+            try:
+                return float(fields[i])
+            except (IndexError, ValueError):
+                return None
+
+        load = num(0)
+        if load is None:
+            return None
+        return GpuReading(source=source, load_percent=load, vram_used_mb=num(1), vram_total_mb=num(2), temp_c=num(3))
+
+
+def probe_gpu_providers(sysfs_root: Path = SYSFS_ROOT, allow_commands: bool = True) -> list[GpuProvider]:
+    """
+    Return every provider that produced a reading, best first.
+    """
+    found: list[GpuProvider] = []
+
+    seen: set[Path] = set()
+    for busy in sorted(sysfs_root.glob("class/drm/card*/device/gpu_busy_percent")):
+        # Connector entries (card0-DP-1) can link back to the same device
+        device = busy.parent.resolve()
+        if device in seen:
+            continue
+        seen.add(device)
+        provider = SysfsGpuProvider(busy.parent)
+        if provider.read() is not None:
+            found.append(provider)
+
+    if allow_commands and shutil.which("nvidia-smi"):
+        provider = NvidiaSmiProvider()
+        if provider.read() is not None:
+            found.append(provider)
+
+    return found
+
+
+class GpuMonitor:
+    """
+    Probes once, then reads the first working provider. A provider that fails
+    MAX_FAILURES reads in a row is dropped in favour of the next one; with
+    none left every read returns None.
+    """
+    MAX_FAILURES = 3
+
+    def __init__(self, providers: Optional[list[GpuProvider]] = None) -> None:
+        self._providers = probe_gpu_providers() if providers is None else list(providers)
+        self._failures = 0
+
+    @property
+    def provider(self) -> Optional[GpuProvider]:
+        return self._providers[0] if self._providers else None
+
+    def read(self) -> Optional[GpuReading]:
+        if not self._providers:
+            return None
+        reading = self._providers[0].read()
+        if reading is not None:
+            self._failures = 0
+            return reading
+        self._failures += 1
+        if self._failures >= self.MAX_FAILURES:
+            self._providers.pop(0)
+            self._failures = 0
+        return None
@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import math
+import time
+from array import array
+from dataclasses import dataclass
+from typing import Optional
+
+# (bucket size in seconds, span in seconds)
+DEFAULT_TIERS: tuple[tuple[float, float], ...] = (
+    (1.0, 10 * 60),           # 1 s for 10 min
+    (10.0, 6 * 60 * 60),      # 10 s for 6 h
+    (60.0, 7 * 24 * 60 * 60), # 1 min for 7 days
+)
+
+
+@dataclass(frozen=True)
+class WindowStats:
+    minimum: float
+    maximum: float
+    mean: float
+    count: int
+
+
+class _Tier:
+    """
+    Fixed-size ring of time buckets. Every slot holds the aggregate of all
+    samples falling into one bucket; the newest slot is updated in place
+    until a sample for the next bucket arrives.
+    """
+
+    def __init__(self, step: float, span: float) -> None:
+        self.step = step
+        self.capacity = max(1, int(math.ceil(span / step)))
+        # Preallocated up front; nothing grows after construction
+        self.times = array("d", [0.0]) * self.capacity
+        self.sums = array("d", [0.0]) * self.capacity
+        self.counts = array("I", [0]) * self.capacity
+        self.mins = array("f", [0.0]) * self.capacity
+        self.maxs = array("f", [0.0]) * self.capacity
+        self.head = -1  # physical index of newest slot
+        self.count = 0
+        self._bucket = -1
+
+    def add(self, ts: float, value: float) -> None:
+        bucket = int(ts // self.step)
+        # Same bucket (or the clock stepped backwards): fold into newest slot
+        if bucket <= self._bucket and self.count:
+            i = self.head
+            self.sums[i] += value
+            self.counts[i] += 1
+            if value < self.mins[i]:
+                self.mins[i] = value
+            if value > self.maxs[i]:
+                self.maxs[i] = value
+            return
+
+        self._bucket = bucket
+        self.head = (self.head + 1) % self.capacity
+        if self.count < self.capacity:
+            self.count += 1
+        i = self.head
+        self.times[i] = bucket * self.step
+        self.sums[i] = value
+        self.counts[i] = 1
+        self.mins[i] = value
+        self.maxs[i] = value
+
+    def _physical(self, logical: int) -> int:
+        # logical 0 is the oldest retained slot
+        return (self.head - self.count + 1 + logical) % self.capacity
+
+    def _first_since(self, since: float) -> int:
+        # Binary search in logical (time-ordered) space for the first slot after since
+        lo, hi = 0, self.count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.times[self._physical(mid)] <= since:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def _slices(self, column: array, since: float) -> list[array]:
+        start = self._first_since(since)
+        n = self.count - start
+        if n <= 0:
+            return []
+        a = self._physical(start)
+        b = a + n
+        if b <= self.capacity:
+            return [column[a:b]]
+        return [column[a:], column[: b - self.capacity]]
+
+    def stats(self, since: float) -> Optional[WindowStats]:
+        counts = self._slices(self.counts, since)
+        total = sum(sum(c) for c in counts)
+        if not total:
+            return None
+        return WindowStats(
+            minimum=min(min(m) for m in self._slices(self.mins, since)),
+            maximum=max(max(m) for m in self._slices(self.maxs, since)),
+            mean=sum(sum(s) for s in self._slices(self.sums, since)) / total,
+            count=total,
+        )
+
+    def means(self, since: float) -> list[float]:
+        sums = [v for part in self._slices(self.sums, since) for v in part]
+        counts = [v for part in self._slices(self.counts, since) for v in part]
+        return [s / c for s, c in zip(sums, counts)]
+
+
+class MetricHistory:
+    """
+    Bounded multi-resolution history for one metric.
+    Each sample is folded into every tier (O(tiers)), so memory is fixed at
+    construction no matter how long the dashboard runs.
+    """
+
+    def __init__(self, tiers: tuple[tuple[float, float], ...] = DEFAULT_TIERS) -> None:
+        self._tiers = [_Tier(step, span) for step, span in tiers]
+        self._latest: Optional[float] = None
+        self._latest_ts = 0.0
+
+    @property
+    def latest(self) -> Optional[float]:
+        return self._latest
+
+    def add(self, value: float, timestamp: Optional[float] = None) -> None:
+        ts = time.time() if timestamp is None else timestamp
+        v = float(value)
+        for tier in self._tiers:
+            tier.add(ts, v)
+        self._latest = v
+        self._latest_ts = ts
+
+    def _tier_for(self, window_s: float) -> _Tier:
+        # Finest tier that covers the whole window
+        for tier in self._tiers:
+            if tier.capacity * tier.step >= window_s:
+                return tier
+        return self._tiers[-1]
+
+    def values(self, window_s: float, now: Optional[float] = None) -> list[float]:
+        """Bucket means over the last window_s seconds, oldest first."""
+        tier = self._tier_for(window_s)
+        end = self._latest_ts if now is None else now
+        return tier.means(end - window_s)
+
+    def window_stats(self, window_s: float, now: Optional[float] = None) -> Optional[WindowStats]:
+        tier = self._tier_for(window_s)
+        end = self._latest_ts if now is None else now
+        return tier.stats(end - window_s)
+
+
+class HistoryStore:
+    """
+    Named MetricHistory instances, created on first use.
+    """
+
+    def __init__(self, tiers: tuple[tuple[float, float], ...] = DEFAULT_TIERS) -> None:
+        self._tiers = tiers
+        self._series: dict[str, MetricHistory] = {}
+
+    def record(self, name: str, value: float, timestamp: Optional[float] = None) -> None:
+        self.series(name).add(value, timestamp)
+
+    def series(self, name: str) -> MetricHistory:
+        hist = self._series.get(name)
+        if hist is None:
+            hist = MetricHistory(self._tiers)
+            self._series[name] = hist
+        return hist
+
+    def names(self) -> list[str]:
+        return list(self._series)
@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import errno
+import os
+from dataclasses import dataclass
+from fnmatch import fnmatch
+from pathlib import Path
+from typing import Optional, Sequence
+
+HWMON_ROOT = Path("/sys/class/hwmon")
+
+# Reads a failing sensor is skipped for, doubling per failure up to this
+MAX_BACKOFF = 64
+
+# The device (or the whole chip) went away: only a rescan helps
+_GONE = (errno.ENODEV, errno.ENOENT)
+
+
+@dataclass(frozen=True)
+class HwmonSensor:
+    kind: str   # "temp" or "fan"
+    chip: str   # hwmon "name" file, e.g. "k10temp"; "name hwmonN" when two chips share it
+    label: str  # tempN_label if present, else "chip kindN", e.g. "nct6775 fan2"
+    path: Path  # the *_input file
+
+
+@dataclass(frozen=True)
+class HwmonReadings:
+    temperatures: tuple[tuple[str, float], ...] = ()  # (label, celsius)
+    fans: tuple[tuple[str, float], ...] = ()          # (label, rpm)
+
+
+def _read_text(path: Path) -> str:
+    try:
+        return path.read_text(encoding="utf-8").strip()
+    except OSError:
+        return ""
+
+
+def _input_index(path: Path, kind: str) -> int:
+    # temp12_input -> 12, so temp2 sorts before temp10
+    digits = path.name[len(kind):-len("_input")]
+    return int(digits) if digits.isdigit() else 0
+
+
+def discover_sensors(root: Path = HWMON_ROOT) -> list[HwmonSensor]:
+    """
+    Walk the hwmon tree once and list every temperature and fan input.
+    """
+    sensors: list[HwmonSensor] = []
+    if not root.is_dir():
+        return sensors
+
+    chip_dirs = sorted(root.iterdir())
+    names = [_read_text(d / "name") or d.name for d in chip_dirs]
+    for chip_dir, name in zip(chip_dirs, names):
+        # Two NVMe drives both report "nvme": keep them apart
+        chip = f"{name} {chip_dir.name}" if names.count(name) > 1 else name
+        for kind in ("temp", "fan"):
+            inputs = sorted(chip_dir.glob(f"{kind}*_input"), key=lambda p: _input_index(p, kind))
+            for inp in inputs:
+                label_file = inp.with_name(inp.name.replace("_input", "_label"))
+                label = _read_text(label_file) or f"{chip} {kind}{_input_index(inp, kind)}"
+                sensors.append(HwmonSensor(kind=kind, chip=chip, label=label, path=inp))
+    return sensors
+
+
+def default_selection(sensors: Sequence[HwmonSensor]) -> list[HwmonSensor]:
+    """
+    First temperature per chip (what the dashboard always showed) plus every fan.
+    """
+    chosen: list[HwmonSensor] = []
+    seen_chips: set[str] = set()
+    for s in sensors:
+        if s.kind == "fan":
+            chosen.append(s)
+        elif s.chip not in seen_chips:
+            seen_chips.add(s.chip)
+            chosen.append(s)
+    return chosen
+
+
+class HwmonReader:
+    """
+    Discovers hwmon sensors once, keeps their *_input files open and reads
+    them with os.pread each tick. The tree is only walked again when the
+    set of hwmon devices changes (hotplug) or a device has gone away
+    (ENODEV/ENOENT). Any other failed read (EAGAIN, "N/A") only backs that
+    sensor off for 1, 2, 4... reads, up to MAX_BACKOFF.
+
+    patterns: optional fnmatch patterns matched against "chip/label"; when
+    given they replace the default selection.
+    """
+
+    def __init__(self, root: Path = HWMON_ROOT, patterns: Optional[Sequence[str]] = None) -> None:
+        self.root = root
+        self._patterns = tuple(patterns) if patterns else ()
+        self._devices: Optional[frozenset[str]] = None
+        self._open: list[tuple[HwmonSensor, int]] = []
+        # Index into _open -> (reads left to skip, current back-off)
+        self._backoff: dict[int, tuple[int, int]] = {}
+        self._stale = True
+
+    @property
+    def sensors(self) -> list[HwmonSensor]:
+        return [s for s, _ in self._open]
+
+    def available(self) -> bool:
+        return self.root.is_dir()
+
+    def _select(self, sensors: list[HwmonSensor]) -> list[HwmonSensor]:
+        if not self._patterns:
+            return default_selection(sensors)
+        return [s for s in sensors if any(fnmatch(f"{s.chip}/{s.label}", p) for p in self._patterns)]
+
+    def _rescan(self, devices: frozenset[str]) -> None:
+        self.close()
+        self._backoff = {}
+        self._devices = devices
+        for sensor in self._select(discover_sensors(self.root)):
+            try:
+                fd = os.open(sensor.path, os.O_RDONLY)
+            except OSError:
+                continue
+            self._open.append((sensor, fd))
+        self._stale = False
+
+    def _check_hotplug(self) -> None:
+        try:
+            devices = frozenset(os.listdir(self.root))
+        except OSError:
+            devices = frozenset()
+        if self._stale or devices != self._devices:
+            self._rescan(devices)
+
+    def read(self) -> HwmonReadings:
+        self._check_hotplug()
+
+        temps: list[tuple[str, float]] = []
+        fans: list[tuple[str, float]] = []
+        for i, (sensor, fd) in enumerate(self._open):
+            if i in self._backoff:
+                left, delay = self._backoff[i]
+                if left > 0:
+                    self._backoff[i] = (left - 1, delay)
+                    continue
+            try:
+                raw = os.pread(fd, 32, 0)
+                value = int(raw.strip() or b"0")
+            except OSError as e:
+                if e.errno in _GONE:
+                    # Device went away: rediscover next tick
+                    self._stale = True
+                else:
+                    self._back_off(i)
+                continue
+            except ValueError:
+                self._back_off(i)
+                continue
+            self._backoff.pop(i, None)
+            if sensor.kind == "temp":
+                temps.append((sensor.label, value / 1000.0))
+            else:
+                fans.append((sensor.label, float(value)))
+        return HwmonReadings(temperatures=tuple(temps), fans=tuple(fans))
+
+    def _back_off(self, index: int) -> None:
+        delay = min(self._backoff[index][1] * 2, MAX_BACKOFF) if index in self._backoff else 1
+        self._backoff[index] = (delay, delay)
+
+    def close(self) -> None:
+        for _, fd in self._open:
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+        self._open = []
@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import re
+import sys
+import time
+from dataclasses import dataclass
+from fnmatch import fnmatch
+from typing import Any, Callable, Mapping, Optional, Sequence
+
+import psutil
+
+# Loopback and virtual block devices are noise on a case display
+DEFAULT_NIC_EXCLUDE: tuple[str, ...] = ("lo", "lo0", "Loopback*")
+DEFAULT_DISK_EXCLUDE: tuple[str, ...] = ("loop*", "ram*", "zram*")
+
+# Linux lists partitions (sda1, nvme0n1p2) next to their disk; counting both
+# doubles the total. Other platforms only report whole disks.
+_SKIP_PARTITIONS = sys.platform.startswith("linux")
+_PARTITION_RE = re.compile(r"^(?:(?:sd|vd|xvd|hd)[a-z]+\d+|(?:nvme\d+n\d+|mmcblk\d+)p\d+)$")
+
+
+@dataclass(frozen=True)
+class DeviceRate:
+    name: str
+    in_bps: float   # received / read bytes per second
+    out_bps: float  # sent / written bytes per second
+
+
+@dataclass(frozen=True)
+class IoRates:
+    net: tuple[DeviceRate, ...] = ()
+    disk: tuple[DeviceRate, ...] = ()
+
+    @property
+    def net_rx_bps(self) -> float:
+        return sum(d.in_bps for d in self.net)
+
+    @property
+    def net_tx_bps(self) -> float:
+        return sum(d.out_bps for d in self.net)
+
+    @property
+    def disk_read_bps(self) -> float:
+        return sum(d.in_bps for d in self.disk)
+
+    @property
+    def disk_write_bps(self) -> float:
+        return sum(d.out_bps for d in self.disk)
+
+
+def _selected(
+    names: Sequence[str], include: Sequence[str], exclude: Sequence[str], skip_partitions: bool = False
+) -> tuple[str, ...]:
+    out: list[str] = []
+    for name in sorted(names):
+        if include and not any(fnmatch(name, p) for p in include):
+            continue
+        if any(fnmatch(name, p) for p in exclude):
+            continue
+        if skip_partitions and _PARTITION_RE.match(name):
+            continue
+        out.append(name)
+    return tuple(out)
+
+
+class _CounterRates:
+    """
+    Delta rates for one family of per-device counters. The include/exclude
+    matching is only redone when the set of device names changes.
+    """
+
+    def __init__(
+        self, in_field: str, out_field: str, include: Sequence[str], exclude: Sequence[str], skip_partitions: bool = False
+    ) -> None:
+        self._skip_partitions = skip_partitions
+        self._in_field = in_field
+        self._out_field = out_field
+        self._include = tuple(include)
+        self._exclude = tuple(exclude)
+        self._names_key: Optional[frozenset[str]] = None
+        self._selected: tuple[str, ...] = ()
+        self._prev: dict[str, tuple[int, int]] = {}
+        self._prev_ts: Optional[float] = None
+
+    def update(self, counters: Mapping[str, Any], ts: float) -> tuple[DeviceRate, ...]:
+        key = frozenset(counters)
+        if key != self._names_key:
+            self._names_key = key
+            self._selected = _selected(list(counters), self._include, self._exclude, self._skip_partitions)
+
+        current: dict[str, tuple[int, int]] = {}
+        for name in self._selected:
+            c = counters[name]
+            current[name] = (getattr(c, self._in_field), getattr(c, self._out_field))
+
+        prev, prev_ts = self._prev, self._prev_ts
+        self._prev, self._prev_ts = current, ts
+        if prev_ts is None or ts <= prev_ts:
+            return ()
+
+        dt = ts - prev_ts
+        rates = []
+        for name, (cur_in, cur_out) in current.items():
+            last = prev.get(name)
+            if last is None:
+                continue
+            # Counters can reset (driver reload, wrap): report 0 for that tick
+            rates.append(DeviceRate(name, max(0, cur_in - last[0]) / dt, max(0, cur_out - last[1]) / dt))
+        return tuple(rates)
+
+
+class IoRateSampler:
+    """
+    Network and disk throughput computed from counter deltas between samples.
+    include/exclude take fnmatch patterns (e.g. nic_include=("eth*", "wlan*")).
+    """
+
+    def __init__(
+        self,
+        nic_include: Sequence[str] = (),
+        nic_exclude: Sequence[str] = DEFAULT_NIC_EXCLUDE,
+        disk_include: Sequence[str] = (),
+        disk_exclude: Sequence[str] = DEFAULT_DISK_EXCLUDE,
+        net_reader: Optional[Callable[[], Mapping[str, Any]]] = None,
+        disk_reader: Optional[Callable[[], Mapping[str, Any]]] = None,
+    ) -> None:
+        self._net = _CounterRates("bytes_recv", "bytes_sent", nic_include, nic_exclude)
+        self._disk = _CounterRates("read_bytes", "write_bytes", disk_include, disk_exclude, skip_partitions=_SKIP_PARTITIONS)
+        self._net_reader = net_reader or (lambda: psutil.net_io_counters(pernic=True))
+        self._disk_reader = disk_reader or (lambda: psutil.disk_io_counters(perdisk=True))
+
+    @classmethod
+    def from_filters(cls, filters: Optional[Mapping[str, Sequence[str]]], **kwargs: Any) -> "IoRateSampler":
+        """Build from config.io_filters; missing keys keep the defaults."""
+        filters = filters or {}
+        return cls(
+            nic_include=filters.get("net_include", ()),
+            nic_exclude=filters.get("net_exclude", DEFAULT_NIC_EXCLUDE),
+            disk_include=filters.get("disk_include", ()),
+            disk_exclude=filters.get("disk_exclude", DEFAULT_DISK_EXCLUDE),
+            **kwargs,
+        )
+
+    def sample(self, ts: Optional[float] = None) -> IoRates:
+        now = time.monotonic() if ts is None else ts
+        try:
+            net = self._net.update(self._net_reader() or {}, now)
+        except Exception:
+            net = ()
+        try:
+            disk = self._disk.update(self._disk_reader() or {}, now)
+        except Exception:
+            disk = ()
+        return IoRates(net=net, disk=disk)
+
+
+def format_rate(bps: float) -> str:
+    for unit in ("B/s", "KB/s", "MB/s"):
+        if bps < 1024.0:
+            return f"{bps:.0f} {unit}" if unit == "B/s" else f"{bps:.1f} {unit}"
+        bps /= 1024.0
+    return f"{bps:.1f} GB/s"
@@ -0,0 +1,326 @@
+from __future__ import annotations
+
+import bisect
+import queue
+import struct
+import sys
+import threading
+import zlib
+from pathlib import Path
+from typing import Iterable, Optional
+
+from app.logger import LogRecord
+
+# The live segment is plain text, one record per line:
+#   <unix ts>\t<level>\t<source>\t<message>   (\\, \t and \n escaped)
+ACTIVE_NAME = "current.log"
+# On rotation it becomes <first ts in ms>.lgz: independently zlib-compressed
+# blocks of BLOCK_RECORDS lines, plus <first ts in ms>.idx, a sparse index
+# with the first timestamp, offset and length of every block:
+#   header: magic "CSLI", u32 block count, f64 first ts, f64 last ts
+#   entries: f64 first ts, u64 offset, u32 compressed length
+SEGMENT_SUFFIX = ".lgz"
+INDEX_SUFFIX = ".idx"
+BLOCK_RECORDS = 256
+_IDX_MAGIC = b"CSLI"
+_IDX_HEAD = struct.Struct("<4sIdd")
+_IDX_ENTRY = struct.Struct("<dQI")
+
+
+def _escape(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("\t", "\\t").replace("\n", "\\n")
+
+
+def _unescape(text: str) -> str:
+    if "\\" not in text:
+        return text
+    out: list[str] = []
+    it = iter(text)
+    for ch in it:
+        if ch == "\\":
+            nxt = next(it, "")
+            out.append({"t": "\t", "n": "\n"}.get(nxt, nxt))
+        else:
+            out.append(ch)
+    return "".join(out)
+
+
+def encode_record(rec: LogRecord) -> str:
+    return f"{rec.timestamp:.3f}\t{rec.level}\t{_escape(rec.source)}\t{_escape(rec.message)}\n"
+
+
+def decode_record(line: str) -> Optional[LogRecord]:
+    """Parse one stored line; None for a torn or foreign line."""
+    parts = line.rstrip("\n").split("\t", 3)
+    if len(parts) != 4:
+        return None
+    try:
+        return LogRecord(float(parts[0]), int(parts[1]), _unescape(parts[2]), _unescape(parts[3]))
+    except ValueError:
+        return None
+
+
+def _decode_lines(lines: Iterable[str]) -> list[LogRecord]:
+    return [rec for rec in map(decode_record, lines) if rec is not None]
+
+
+class Segment:
+    """A compressed, immutable segment and its sparse block index."""
+
+    def __init__(self, path: Path, first_ts: float, last_ts: float,
+                 blocks: list[tuple[float, int, int]]) -> None:
+        self.path = path
+        self.first_ts = first_ts
+        self.last_ts = last_ts
+        self.blocks = blocks
+        self._firsts = [b[0] for b in blocks]
+
+    @classmethod
+    def open(cls, index_path: Path) -> "Segment":
+        raw = index_path.read_bytes()
+        magic, count, first_ts, last_ts = _IDX_HEAD.unpack_from(raw, 0)
+        if magic != _IDX_MAGIC:
+            raise ValueError("not a log segment index")
+        blocks = [_IDX_ENTRY.unpack_from(raw, _IDX_HEAD.size + i * _IDX_ENTRY.size) for i in range(count)]
+        return cls(index_path.with_suffix(SEGMENT_SUFFIX), first_ts, last_ts, blocks)
+
+    def read_block(self, i: int) -> list[LogRecord]:
+        """One block's records; empty if the segment was pruned or is damaged."""
+        _, offset, length = self.blocks[i]
+        try:
+            with open(self.path, "rb") as f:
+                f.seek(offset)
+                data = zlib.decompress(f.read(length))
+        except (OSError, zlib.error):
+            return []
+        return _decode_lines(data.decode("utf-8", "replace").splitlines())
+
+    def block_range(self, start: float, end: float) -> range:
+        """Blocks that can hold records with start <= ts <= end."""
+        first = max(0, bisect.bisect_right(self._firsts, start) - 1)
+        stop = bisect.bisect_right(self._firsts, end)
+        return range(first, stop)
+
+    def blocks_through(self, ts: float) -> range:
+        """Blocks that can hold records with timestamp <= ts, oldest first."""
+        return range(0, bisect.bisect_right(self._firsts, ts))
+
+
+def write_segment(directory: Path, lines: list[str], block_records: int = BLOCK_RECORDS) -> Optional[Segment]:
+    """Compress stored lines into a new segment; None if there were no records."""
+    records = [(decode_record(line), line) for line in lines]
+    records = [(rec, line) for rec, line in records if rec is not None]
+    if not records:
+        return None
+    first_ts = records[0][0].timestamp
+    last_ts = max(rec.timestamp for rec, _ in records)
+    name = f"{int(first_ts * 1000):013d}"
+    seg_path = directory / (name + SEGMENT_SUFFIX)
+    idx_path = directory / (name + INDEX_SUFFIX)
+
+    blocks: list[tuple[float, int, int]] = []
+    offset = 0
+    tmp_seg = seg_path.with_name(seg_path.name + ".tmp")
+    with open(tmp_seg, "wb") as f:
+        for i in range(0, len(records), block_records):
+            chunk = records[i:i + block_records]
+            data = zlib.compress("".join(line for _, line in chunk).encode("utf-8"), 6)
+            f.write(data)
+            blocks.append((chunk[0][0].timestamp, offset, len(data)))
+            offset += len(data)
+    index = _IDX_HEAD.pack(_IDX_MAGIC, len(blocks), first_ts, last_ts)
+    index += b"".join(_IDX_ENTRY.pack(*b) for b in blocks)
+    tmp_idx = idx_path.with_name(idx_path.name + ".tmp")
+    tmp_idx.write_bytes(index)
+    # Data first: readers only look at segments whose index exists
+    tmp_seg.replace(seg_path)
+    tmp_idx.replace(idx_path)
+    return Segment(seg_path, first_ts, last_ts, blocks)
+
+
+class LogStore:
+    """
+    Persistent log history, used as the logger's file sink. Records are
+    appended to a live text segment on a writer thread; once it passes
+    max_bytes it is compressed into a block-indexed segment. The oldest
+    segments are deleted beyond max_segments.
+
+    query() and before() can be called from any thread; they decompress
+    only the blocks the sparse index says can match. The live segment's
+    records and the segment list are kept in memory, so neither reads the
+    live file or lists the directory after the first call.
+    """
+
+    def __init__(self, directory: Path, max_bytes: int = 1_000_000, max_segments: int = 50,
+                 block_records: int = BLOCK_RECORDS) -> None:
+        self.directory = Path(directory)
+        self.active_path = self.directory / ACTIVE_NAME
+        self.max_bytes = max_bytes
+        self.max_segments = max_segments
+        self.block_records = block_records
+        # Held while the live segment is written, read or rotated
+        self._lock = threading.Lock()
+        # Loaded on first use, then kept in step by the writer
+        self._active: Optional[list[LogRecord]] = None
+        self._segments: Optional[list[Segment]] = None
+        # Set when the writer hits an I/O error; records are dropped from then on
+        self.disabled = False
+        self._queue: queue.SimpleQueue[Optional[list[LogRecord]]] = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._run, name="log-writer", daemon=True)
+        self._thread.start()
+
+    # ---- sink interface (see AppLogger.start) ----
+    def write(self, records: list[LogRecord]) -> None:
+        if records and not self.disabled:
+            self._queue.put(records)
+
+    def close(self, timeout: float = 2.0) -> None:
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join(timeout)
+
+    def _run(self) -> None:
+        f = None
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            f = open(self.active_path, "a", encoding="utf-8")
+            while True:
+                batch = self._queue.get()
+                if batch is None:
+                    break
+                # Coalesce everything already queued into one write
+                done = False
+                while True:
+                    try:
+                        more = self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if more is None:
+                        done = True
+                        break
+                    batch.extend(more)
+                with self._lock:
+                    f.write("".join(map(encode_record, batch)))
+                    f.flush()
+                    if self._active is not None:
+                        # Stored timestamps keep milliseconds; cache what a reread would give
+                        self._active.extend(decode_record(encode_record(r)) for r in batch)
+                if f.tell() >= self.max_bytes:
+                    f.close()
+                    self.rotate()
+                    f = open(self.active_path, "a", encoding="utf-8")
+                if done:
+                    break
+        except OSError as e:
+            self.disabled = True
+            print(f"Log file disabled: {e}", file=sys.stderr)
+            # Nothing will consume what is already queued
+            while True:
+                try:
+                    self._queue.get_nowait()
+                except queue.Empty:
+                    break
+        finally:
+            if f is not None:
+                f.close()
+
+    def rotate(self) -> None:
+        """Compress the live segment (writer thread, or while no writer runs)."""
+        with self._lock:
+            try:
+                lines = self.active_path.read_text(encoding="utf-8").splitlines(keepends=True)
+            except FileNotFoundError:
+                return
+            segments = self._load_segments()
+            segment = write_segment(self.directory, lines, self.block_records)
+            self.active_path.write_text("", encoding="utf-8")
+            self._active = []
+            if segment is not None:
+                segments.append(segment)
+                segments.sort(key=lambda s: s.path.name)
+            self._prune(segments)
+
+    def _prune(self, segments: list[Segment]) -> None:
+        indexes = sorted(self.directory.glob("*" + INDEX_SUFFIX))
+        doomed = {idx.stem for idx in indexes[:max(0, len(indexes) - self.max_segments)]}
+        for stem in doomed:
+            idx = self.directory / (stem + INDEX_SUFFIX)
+            idx.unlink(missing_ok=True)
+            idx.with_suffix(SEGMENT_SUFFIX).unlink(missing_ok=True)
+        segments[:] = [s for s in segments if s.path.stem not in doomed]
+
+    def _load_segments(self) -> list[Segment]:
+        # Caller holds _lock
+        if self._segments is None:
+            self._segments = []
+            for idx in sorted(self.directory.glob("*" + INDEX_SUFFIX)):
+                try:
+                    self._segments.append(Segment.open(idx))
+                except (OSError, ValueError, struct.error):
+                    continue
+        return self._segments
+
+    # ---- queries ----
+    def segments(self) -> list[Segment]:
+        """Compressed segments, oldest first."""
+        with self._lock:
+            return list(self._load_segments())
+
+    def _active_records(self) -> list[LogRecord]:
+        with self._lock:
+            if self._active is None:
+                try:
+                    text = self.active_path.read_text(encoding="utf-8")
+                except FileNotFoundError:
+                    text = ""
+                self._active = _decode_lines(text.splitlines())
+            return list(self._active)
+
+    def query(self, start: float, end: float) -> list[LogRecord]:
+        """Records with start <= timestamp <= end, oldest first."""
+        out: list[LogRecord] = []
+        for seg in self.segments():
+            if seg.last_ts < start or seg.first_ts > end:
+                continue
+            for i in seg.block_range(start, end):
+                out.extend(r for r in seg.read_block(i) if start <= r.timestamp <= end)
+        out.extend(r for r in self._active_records() if start <= r.timestamp <= end)
+        return out
+
+    def before(self, ts: float, limit: int, skip: int = 0) -> list[LogRecord]:
+        """
+        Up to limit newest records before a paging position, oldest first.
+        The position is a timestamp plus how many records stamped with that
+        same millisecond are already shown: stored timestamps only keep
+        milliseconds, so a page boundary can fall inside such a group.
+        """
+        if limit <= 0:
+            return []
+        ts = round(ts, 3)
+        want = limit + max(0, skip)
+        chunks: list[list[LogRecord]] = []
+        found = 0
+        active = [r for r in self._active_records() if r.timestamp <= ts]
+        if active:
+            chunks.append(active)
+            found += len(active)
+        for seg in reversed(self.segments()):
+            if found >= want:
+                break
+            if seg.first_ts > ts:
+                continue
+            for i in reversed(seg.blocks_through(ts)):
+                block = [r for r in seg.read_block(i) if r.timestamp <= ts]
+                chunks.append(block)
+                found += len(block)
+                if found >= want:
+                    break
+        records = [r for chunk in reversed(chunks) for r in chunk]
+        # Drop the newest `skip` records of the boundary millisecond (already shown)
+        for i in range(len(records) - 1, -1, -1):
+            if skip <= 0:
+                break
+            if records[i].timestamp == ts:
+                del records[i]
+                skip -= 1
+        return records[-limit:]
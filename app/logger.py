@@ -1,16 +1,193 @@
 from __future__ import annotations
 
-from PySide6.QtCore import QObject, Signal
+import sys
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Optional, Protocol, Sequence
+
+from PySide6.QtCore import QObject, QTimer, Signal
+
+from app.utils import project_root
+
+LOGS_DIR = project_root() / "logs"
+
+DEBUG = 10
+INFO = 20
+WARNING = 30
+ERROR = 40
+LEVEL_NAMES = {DEBUG: "DEBUG", INFO: "INFO", WARNING: "WARN", ERROR: "ERROR"}
+
+# How often queued records are handed to the sinks
+DRAIN_INTERVAL_MS = 50
+# Records held between drains; beyond this the oldest are dropped (and counted)
+QUEUE_MAX = 10_000
+# Per-source limit on lines reaching the UI: sustained rate and burst size
+RATE_PER_SECOND = 20.0
+RATE_BURST = 100
+
+
+@dataclass(frozen=True)
+class LogRecord:
+    timestamp: float
+    level: int
+    source: str
+    message: str
+
+    @property
+    def level_name(self) -> str:
+        return LEVEL_NAMES.get(self.level, str(self.level))
+
+    def __str__(self) -> str:
+        clock = time.strftime("%H:%M:%S", time.localtime(self.timestamp))
+        level = "" if self.level == INFO else f" {self.level_name}"
+        return f"{clock}{level} [{self.source}] {self.message}"
+
+
+class _RateLimiter:
+    """Token bucket per source, refilled from record timestamps (drain thread only)."""
+
+    def __init__(self, rate: float = RATE_PER_SECOND, burst: int = RATE_BURST) -> None:
+        self.rate = rate
+        self.burst = float(burst)
+        self._buckets: dict[str, list[float]] = {}  # source -> [tokens, last timestamp]
+        self.suppressed: dict[str, int] = {}
+
+    def filter(self, records: Sequence[LogRecord]) -> list[LogRecord]:
+        out: list[LogRecord] = []
+        for rec in records:
+            bucket = self._buckets.get(rec.source)
+            if bucket is None:
+                bucket = self._buckets[rec.source] = [self.burst, rec.timestamp]
+            tokens = min(self.burst, bucket[0] + (rec.timestamp - bucket[1]) * self.rate)
+            bucket[1] = rec.timestamp
+            if tokens < 1.0:
+                bucket[0] = tokens
+                self.suppressed[rec.source] = self.suppressed.get(rec.source, 0) + 1
+                continue
+            bucket[0] = tokens - 1.0
+            dropped = self.suppressed.pop(rec.source, 0)
+            if dropped:
+                out.append(LogRecord(rec.timestamp, WARNING, rec.source, f"{dropped} lines suppressed (rate limit)"))
+            out.append(rec)
+        return out
+
+
+class FileSink(Protocol):
+    """Persistent sink fed with every drained batch (see app.log_store.LogStore)."""
+
+    def write(self, records: list[LogRecord]) -> None: ...
+
+    def close(self) -> None: ...
 
 
 class AppLogger(QObject):
     """
-    Centralised logger that broadcasts log lines to any UI subscribers.
+    Centralised logging pipeline. log() is safe from any thread: it only
+    appends to a bounded queue (deque appends are atomic). On the GUI thread
+    a timer drains the queue every DRAIN_INTERVAL_MS and hands the whole
+    batch to the file sink and, after per-source rate limiting, to the UI
+    via the batch signal. If nothing drains (before start(), or while the
+    GUI thread is blocked) the oldest records are dropped past queue_max and
+    the next drain reports how many.
     """
-    line = Signal(str)
+    batch = Signal(list)  # list[LogRecord], emitted on the GUI thread
+
+    def __init__(self, parent: QObject | None = None, queue_max: int = QUEUE_MAX) -> None:
+        super().__init__(parent)
+        self.level = INFO
+        # Also echoed to stderr, as the old print() calls were
+        self.console_level = WARNING
+        self._queue: deque[LogRecord] = deque(maxlen=max(1, queue_max))
+        self._dropped = 0
+        self._limiter = _RateLimiter()
+        self._file: Optional[FileSink] = None
+        self._sinks: list[Callable[[list[LogRecord]], None]] = []
+        self._timer: Optional[QTimer] = None
+
+    @property
+    def file_sink(self) -> Optional[FileSink]:
+        return self._file
+
+    def start(self, file_sink: Optional[FileSink] = None) -> None:
+        """Begin periodic draining (call on the GUI thread once the app exists)."""
+        if file_sink is not None:
+            self._file = file_sink
+        if self._timer is None:
+            self._timer = QTimer(self)
+            self._timer.setInterval(DRAIN_INTERVAL_MS)
+            self._timer.timeout.connect(self.drain)
+        self._timer.start()
+
+    def close(self) -> None:
+        """Flush what is queued and stop the file sink."""
+        if self._timer is not None:
+            self._timer.stop()
+        self.drain()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def add_sink(self, sink: Callable[[list[LogRecord]], None]) -> None:
+        """Plain callback alternative to the batch signal (called on drain)."""
+        self._sinks.append(sink)
+
+    def log(self, level: int, source: str, message: str) -> None:
+        if level < self.level:
+            return
+        queue = self._queue
+        if len(queue) == queue.maxlen:
+            # The append below pushes the oldest record out (count is approximate across threads)
+            self._dropped += 1
+        queue.append(LogRecord(time.time(), level, source, str(message)))
+
+    def debug(self, source: str, message: str) -> None:
+        self.log(DEBUG, source, message)
+
+    def info(self, source: str, message: str) -> None:
+        self.log(INFO, source, message)
+
+    def warning(self, source: str, message: str) -> None:
+        self.log(WARNING, source, message)
+
+    def error(self, source: str, message: str) -> None:
+        self.log(ERROR, source, message)
 
     def emit(self, message: str) -> None:
-        self.line.emit(message)
+        self.info("app", message)
+
+    def drain(self) -> list[LogRecord]:
+        """Move queued records to the sinks. Returns what reached the UI."""
+        records: list[LogRecord] = []
+        pop = self._queue.popleft
+        try:
+            while True:
+                records.append(pop())
+        except IndexError:
+            pass
+        dropped, self._dropped = self._dropped, 0
+        if dropped:
+            records.insert(0, LogRecord(time.time(), WARNING, "logger", f"{dropped} records dropped (queue full)"))
+        if not records:
+            return records
+
+        if self._file is not None:
+            self._file.write(records)
+        for rec in records:
+            if rec.level >= self.console_level:
+                print(rec, file=sys.stderr)
+
+        shown = self._limiter.filter(records)
+        if shown:
+            for sink in self._sinks:
+                sink(shown)
+            self.batch.emit(shown)
+        return shown
+
+    @property
+    def suppressed(self) -> dict[str, int]:
+        """Lines per source currently held back by the rate limiter."""
+        return dict(self._limiter.suppressed)
 
 
 # Global singleton instance
@@ -21,8 +198,8 @@ def get_logger() -> AppLogger:
     return _logger
 
 
-def log(message: str) -> None:
+def log(message: str, level: int = INFO, source: str = "app") -> None:
     """
-    Call this anywhere in the project to push a log line to the UI.
+    Call this anywhere in the project (any thread) to push a log line to the UI.
     """
-    _logger.emit(str(message))
+    _logger.log(level, source, str(message))
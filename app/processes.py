@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import heapq
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, Optional
+
+import psutil
+
+_ATTRS = ["name", "cpu_times", "memory_info"]
+
+
+@dataclass(frozen=True)
+class ProcessInfo:
+    pid: int
+    name: str
+    cpu_percent: float  # of one core, like top (can exceed 100 on multi-threaded work)
+    rss_bytes: int
+
+
+@dataclass(frozen=True)
+class TopProcesses:
+    by_cpu: tuple[ProcessInfo, ...] = ()
+    by_rss: tuple[ProcessInfo, ...] = ()
+
+
+class _Entry:
+    __slots__ = ("proc", "name", "cpu_time")
+
+    def __init__(self, proc: Any, name: str, cpu_time: float) -> None:
+        self.proc = proc
+        self.name = name
+        self.cpu_time = cpu_time
+
+
+def _iter_processes() -> Iterable[Any]:
+    # process_iter reuses its own Process objects between calls and fills
+    # .info through as_dict(), which reads every attribute inside oneshot()
+    return psutil.process_iter(attrs=_ATTRS, ad_value=None)
+
+
+class ProcessTable:
+    """
+    Heaviest processes by CPU and resident memory. One entry per PID is kept
+    between samples with its previous CPU time, so a tick only creates
+    entries for new PIDs, evicts the ones that exited and picks the top N
+    without sorting the whole table.
+    """
+
+    def __init__(self, top_n: int = 5, iterator: Optional[Callable[[], Iterable[Any]]] = None) -> None:
+        self.top_n = top_n
+        self._iter = iterator or _iter_processes
+        self._entries: dict[int, _Entry] = {}
+        self._prev_ts: Optional[float] = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def sample(self, ts: Optional[float] = None) -> TopProcesses:
+        now = time.monotonic() if ts is None else ts
+        dt = now - self._prev_ts if self._prev_ts is not None else 0.0
+        self._prev_ts = now
+
+        seen: set[int] = set()
+        rows: list[tuple[float, int, int, str]] = []  # (cpu %, rss, pid, name)
+        entries = self._entries
+        for proc in self._iter():
+            info = proc.info
+            times = info.get("cpu_times")
+            mem = info.get("memory_info")
+            if times is None or mem is None:
+                # Exited mid-scan or no permission: nothing to rank it by
+                continue
+            pid = proc.pid
+            seen.add(pid)
+            cpu_time = times.user + times.system
+
+            entry = entries.get(pid)
+            if entry is None or entry.proc is not proc:
+                # New PID (or a reused one psutil replaced): baseline only
+                entry = entries[pid] = _Entry(proc, info.get("name") or str(pid), cpu_time)
+                percent = 0.0
+            else:
+                percent = max(0.0, cpu_time - entry.cpu_time) / dt * 100.0 if dt > 0 else 0.0
+                entry.cpu_time = cpu_time
+            rows.append((percent, int(mem.rss), pid, entry.name))
+
+        for pid in entries.keys() - seen:
+            del entries[pid]
+
+        # Only the winners become ProcessInfo objects
+        return TopProcesses(
+            by_cpu=tuple(ProcessInfo(p, n, c, r) for c, r, p, n in heapq.nlargest(self.top_n, rows, key=lambda row: row[0])),
+            by_rss=tuple(ProcessInfo(p, n, c, r) for c, r, p, n in heapq.nlargest(self.top_n, rows, key=lambda row: row[1])),
+        )
@@ -0,0 +1,296 @@
+from __future__ import annotations
+
+import math
+import mmap
+import struct
+from array import array
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Iterator, Optional, Sequence
+
+from app.utils import project_root, unique_labels
+
+RECORDINGS_DIR = project_root() / "recordings"
+
+# File layout (little endian):
+#   header: magic "CSDM", u16 version, u16 channel count, u32 header length,
+#           then per channel a u8 length + utf-8 name, zero padded to 8 bytes
+#   records: f64 unix timestamp + one f32 per channel (NaN = no reading)
+MAGIC = b"CSDM"
+VERSION = 1
+_HEAD = struct.Struct("<4sHHI")
+
+
+def encode_header(channels: Sequence[str]) -> bytes:
+    names = b""
+    for name in channels:
+        raw = name.encode("utf-8")[:255]
+        names += struct.pack("<B", len(raw)) + raw
+    length = _HEAD.size + len(names)
+    padding = (-length) % 8
+    return _HEAD.pack(MAGIC, VERSION, len(channels), length + padding) + names + b"\0" * padding
+
+
+def decode_header(buf: bytes) -> tuple[tuple[str, ...], int]:
+    """Return (channels, header length). Raises ValueError on foreign files."""
+    if len(buf) < _HEAD.size:
+        raise ValueError("truncated header")
+    magic, version, count, length = _HEAD.unpack_from(buf, 0)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError("not a metrics recording")
+    channels: list[str] = []
+    pos = _HEAD.size
+    for _ in range(count):
+        n = buf[pos]
+        channels.append(bytes(buf[pos + 1:pos + 1 + n]).decode("utf-8"))
+        pos += 1 + n
+    return tuple(channels), length
+
+
+def _read_header_from(path: Path) -> tuple[tuple[str, ...], int]:
+    with open(path, "rb") as f:
+        head = f.read(_HEAD.size)
+        if len(head) < _HEAD.size:
+            raise ValueError("truncated header")
+        length = _HEAD.unpack(head)[3]
+        return decode_header(head + f.read(max(0, length - _HEAD.size)))
+
+
+class MetricsWriter:
+    """
+    Appends fixed-size records to one recording file. Reopening an existing
+    file with the same channels continues it (dropping any torn last record).
+    """
+
+    def __init__(self, path: Path, channels: Sequence[str], flush_every: int = 10) -> None:
+        self.path = path
+        self.channels = tuple(channels)
+        self._record = struct.Struct(f"<d{len(self.channels)}f")
+        self._flush_every = max(1, flush_every)
+        self._pending = 0
+
+        if path.exists() and path.stat().st_size > 0:
+            existing, header_len = _read_header_from(path)
+            if existing != self.channels:
+                raise ValueError(f"{path.name} records different channels")
+            whole = (path.stat().st_size - header_len) // self._record.size
+            with open(path, "r+b") as f:
+                f.truncate(header_len + whole * self._record.size)
+            self._file = open(path, "ab")
+        else:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(path, "wb")
+            self._file.write(encode_header(self.channels))
+
+    @property
+    def record_size(self) -> int:
+        return self._record.size
+
+    def append(self, timestamp: float, values: Sequence[float]) -> None:
+        self._file.write(self._record.pack(timestamp, *values))
+        self._pending += 1
+        if self._pending >= self._flush_every:
+            self.flush()
+
+    def flush(self) -> None:
+        self._file.flush()
+        self._pending = 0
+
+    def close(self) -> None:
+        if not self._file.closed:
+            self._file.close()
+
+
+class MetricsReader:
+    """
+    Memory-mapped view of a recording. Lookups binary-search the timestamps
+    directly in the mapping, so nothing is loaded into Python objects until
+    a range is asked for.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.channels, self._header_len = _read_header_from(path)
+        self._record = struct.Struct(f"<d{len(self.channels)}f")
+        self._file = open(path, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._count = (len(self._map) - self._header_len) // self._record.size
+
+    def __enter__(self) -> "MetricsReader":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _offset(self, i: int) -> int:
+        return self._header_len + i * self._record.size
+
+    def timestamp(self, i: int) -> float:
+        return struct.unpack_from("<d", self._map, self._offset(i))[0]
+
+    def record(self, i: int) -> tuple[float, tuple[float, ...]]:
+        row = self._record.unpack_from(self._map, self._offset(i))
+        return row[0], row[1:]
+
+    def bisect(self, ts: float) -> int:
+        """Index of the first record with timestamp >= ts."""
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.timestamp(mid) < ts:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def range(self, t0: float, t1: float) -> Iterator[tuple[float, tuple[float, ...]]]:
+        """Records with t0 <= timestamp < t1."""
+        start, end = self.bisect(t0), self.bisect(t1)
+        view = memoryview(self._map)[self._offset(start):self._offset(end)]
+        try:
+            for row in self._record.iter_unpack(view):
+                yield row[0], row[1:]
+        finally:
+            view.release()
+
+    def series(self, channel: str, t0: float, t1: float) -> tuple[array, array]:
+        """(timestamps, values) of one channel in [t0, t1)."""
+        col = self.channels.index(channel)
+        ts_out = array("d")
+        val_out = array("f")
+        for ts, values in self.range(t0, t1):
+            ts_out.append(ts)
+            val_out.append(values[col])
+        return ts_out, val_out
+
+    def close(self) -> None:
+        self._map.close()
+        self._file.close()
+
+
+def snapshot_channels(snap) -> tuple[tuple[str, ...], list[float]]:
+    """
+    Flatten a SensorSnapshot into (channel names, values). The GPU channel
+    is NaN when no GPU provider is available. Sensors sharing a label get
+    "#2", "#3"... (utils.unique_labels) so every reading has its own column.
+    """
+    gpu = snap.gpu.load_percent if snap.gpu is not None else math.nan
+    names = ["cpu", "gpu", "ram"]
+    values = [snap.cpu_percent, gpu, snap.ram_used_gb]
+    for kind, readings in (("temp", snap.temperatures), ("fan", snap.fans)):
+        for key, (_, value) in zip(unique_labels(label for label, _ in readings), readings):
+            names.append(f"{kind}:{key}")
+            values.append(value)
+    return tuple(names), values
+
+
+class SnapshotRecorder:
+    """
+    Records every sensor snapshot into per-day files under `directory`.
+    A file's channels are fixed: a channel missing from a snapshot (a
+    failed sensor read) is recorded as NaN, and only a channel the file
+    lacks starts a new one, holding every channel seen so far. Files older
+    than retention_days are deleted once a day.
+    """
+
+    def __init__(self, directory: Path = RECORDINGS_DIR, retention_days: int = 30, flush_every: int = 10) -> None:
+        self.directory = directory
+        self.retention_days = retention_days
+        self._flush_every = flush_every
+        self._writer: Optional[MetricsWriter] = None
+        self._day: Optional[str] = None
+        self._pruned_day: Optional[str] = None
+
+    @property
+    def path(self) -> Optional[Path]:
+        return self._writer.path if self._writer is not None else None
+
+    def record(self, snap) -> None:
+        channels, values = snapshot_channels(snap)
+        day = datetime.fromtimestamp(snap.timestamp).strftime("%Y%m%d")
+        if self._writer is None or day != self._day:
+            self._open(channels, day)
+        elif channels != self._writer.channels:
+            known = self._writer.channels
+            added = tuple(c for c in channels if c not in known)
+            if added:
+                self._open(known + added, day)
+        if channels != self._writer.channels:
+            by_name = dict(zip(channels, values))
+            values = [by_name.get(c, math.nan) for c in self._writer.channels]
+        self._writer.append(snap.timestamp, values)
+
+    def _open(self, channels: tuple[str, ...], day: str) -> None:
+        self.close()
+        self._day = day
+        wanted = set(channels)
+        n = 1
+        while True:
+            suffix = "" if n == 1 else f"-{n}"
+            path = self.directory / f"metrics-{day}{suffix}.bin"
+            if path.exists() and path.stat().st_size > 0:
+                try:
+                    existing = _read_header_from(path)[0]
+                except (OSError, ValueError):
+                    existing = ()
+                # Continue today's file if it already has every channel
+                if wanted <= set(existing):
+                    channels = existing
+            try:
+                self._writer = MetricsWriter(path, channels, self._flush_every)
+                break
+            except ValueError:
+                # Same day, new sensors (hotplug): continue in a new file
+                n += 1
+        if self._pruned_day != day:
+            self._pruned_day = day
+            self._prune()
+
+    def _prune(self) -> None:
+        cutoff = (date.today() - timedelta(days=self.retention_days)).strftime("%Y%m%d")
+        for path in self.directory.glob("metrics-*.bin"):
+            if path.stem[len("metrics-"):len("metrics-") + 8] < cutoff:
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+
+    def flush(self) -> None:
+        if self._writer is not None:
+            self._writer.flush()
+
+    def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+
+def read_range(channel: str, t0: float, t1: float, directory: Path = RECORDINGS_DIR) -> tuple[array, array]:
+    """
+    (timestamps, values) of one channel across every recording in [t0, t1).
+    """
+    parts: list[tuple[float, array, array]] = []
+    for path in directory.glob("metrics-*.bin"):
+        try:
+            reader = MetricsReader(path)
+        except (OSError, ValueError):
+            continue
+        with reader:
+            if not len(reader) or channel not in reader.channels:
+                continue
+            first = reader.timestamp(0)
+            if reader.timestamp(len(reader) - 1) < t0 or first >= t1:
+                continue
+            ts, vals = reader.series(channel, t0, t1)
+            parts.append((first, ts, vals))
+
+    # File names don't sort chronologically once a day has several files
+    ts_out = array("d")
+    val_out = array("f")
+    for _, ts, vals in sorted(parts, key=lambda p: p[0]):
+        ts_out.extend(ts)
+        val_out.extend(vals)
+    return ts_out, val_out
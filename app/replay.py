@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import math
+import re
+import time
+from pathlib import Path
+from typing import Optional
+
+from app.gpu import GpuReading
+from app.io_rates import IoRates
+from app.recorder import MetricsReader
+from app.sensors import SensorSnapshot
+
+# --replay argument that selects generated data instead of a file
+SYNTHETIC = "synthetic"
+
+# Suffix recorder.snapshot_channels() adds to repeated sensor labels
+_REPEAT = re.compile(r"#\d+$")
+
+
+def _value(v: float) -> Optional[float]:
+    return None if math.isnan(v) else float(v)
+
+
+def _label(channel: str, prefix: str) -> str:
+    # "fan:nct6775#2" -> "nct6775" (the "#2" only keeps repeated labels apart)
+    return _REPEAT.sub("", channel[len(prefix):])
+
+
+def snapshot_from_record(channels: tuple[str, ...], ts: float, values: tuple[float, ...]) -> SensorSnapshot:
+    """
+    Inverse of recorder.snapshot_channels(). Values that were not recorded
+    (per-core load, RAM percent, I/O) are left at their defaults.
+    """
+    by_name = dict(zip(channels, values))
+    gpu = _value(by_name.get("gpu", math.nan))
+    temps = tuple((_label(n, "temp:"), v) for n, v in zip(channels, values) if n.startswith("temp:") and not math.isnan(v))
+    fans = tuple((_label(n, "fan:"), v) for n, v in zip(channels, values) if n.startswith("fan:") and not math.isnan(v))
+    return SensorSnapshot(
+        timestamp=ts,
+        cpu_percent=_value(by_name.get("cpu", math.nan)) or 0.0,
+        ram_used_gb=_value(by_name.get("ram", math.nan)) or 0.0,
+        temperatures=temps,
+        fans=fans,
+        gpu=GpuReading(source="replay", load_percent=gpu) if gpu is not None else None,
+    )
+
+
+class ReplaySampler:
+    """
+    Plays a metrics recording back one record per sample() call, looping at
+    the end. Timestamps keep increasing across loops so history stays ordered.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self._reader = MetricsReader(path)
+        if not len(self._reader):
+            self._reader.close()
+            raise ValueError(f"{path} has no records")
+        first = self._reader.timestamp(0)
+        last = self._reader.timestamp(len(self._reader) - 1)
+        self._loop_span = (last - first) + 1.0
+        self._index = 0
+        self._offset = 0.0
+
+    def sample(self) -> SensorSnapshot:
+        if self._index >= len(self._reader):
+            self._index = 0
+            self._offset += self._loop_span
+        ts, values = self._reader.record(self._index)
+        self._index += 1
+        return snapshot_from_record(self._reader.channels, ts + self._offset, values)
+
+    def close(self) -> None:
+        self._reader.close()
+
+
+class SyntheticSampler:
+    """
+    Deterministic generated metrics (smooth waves per channel), one simulated
+    second per sample() call. Machine independent, for profiling the UI.
+    """
+
+    def __init__(self, cores: int = 16, start: Optional[float] = None) -> None:
+        self._cores = cores
+        self._start = time.time() if start is None else start
+        self._n = 0
+
+    def sample(self) -> SensorSnapshot:
+        n = self._n
+        self._n += 1
+
+        def wave(period: float, phase: float = 0.0) -> float:
+            return 0.5 + 0.5 * math.sin(2.0 * math.pi * n / period + phase)
+
+        per_core = tuple(100.0 * wave(30.0 + i, i * 0.7) for i in range(self._cores))
+        cpu = sum(per_core) / len(per_core)
+        return SensorSnapshot(
+            timestamp=self._start + n,
+            cpu_percent=cpu,
+            cpu_per_core=per_core,
+            ram_used_gb=round(8.0 + 8.0 * wave(600.0), 1),
+            ram_percent=25.0 + 25.0 * wave(600.0),
+            cpu_freq_mhz=3000.0 + 1500.0 * wave(45.0),
+            temperatures=(("Tctl", 40.0 + 50.0 * wave(120.0)), ("edge", 35.0 + 40.0 * wave(90.0, 1.0))),
+            fans=(("cpu_fan", 600.0 + 1400.0 * wave(120.0)),),
+            gpu=GpuReading(source="synthetic", load_percent=100.0 * wave(20.0, 2.0)),
+            io=IoRates(),
+        )
+
+    def close(self) -> None:
+        pass
+
+
+def open_replay(source: str):
+    """
+    Build the sampler for a --replay argument: a recording path or 'synthetic'.
+    Raises OSError / ValueError when the file can't be replayed.
+    """
+    if source == SYNTHETIC:
+        return SyntheticSampler()
+    return ReplaySampler(Path(source))
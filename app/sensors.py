@@ -0,0 +1,294 @@
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from typing import Callable, Mapping, Optional, Sequence
+
+import psutil
+from PySide6.QtCore import QObject, QThread, QTimer, Qt, Signal, Slot
+
+from app.alerts import AlertEngine, AlertRule
+from app.cpu_load import CpuLoadEngine
+from app.gpu import GpuMonitor, GpuReading
+from app.hwmon import HwmonReader
+from app.io_rates import IoRates, IoRateSampler
+from app.processes import ProcessTable, TopProcesses
+
+
+@dataclass(frozen=True)
+class SensorSnapshot:
+    """
+    One immutable reading of every sensor, shared by all metric widgets.
+    """
+    timestamp: float
+    cpu_percent: float = 0.0
+    cpu_per_core: tuple[float, ...] = ()
+    ram_used_gb: float = 0.0
+    ram_percent: float = 0.0
+    cpu_freq_mhz: Optional[float] = None
+    temperatures: tuple[tuple[str, float], ...] = ()  # (label, celsius)
+    fans: tuple[tuple[str, float], ...] = ()  # (label, rpm)
+    gpu: Optional[GpuReading] = None  # None when no GPU source was found
+    io: IoRates = IoRates()
+    processes: TopProcesses = TopProcesses()  # empty unless process sampling is enabled
+
+
+def _read_temperatures() -> tuple[tuple[str, float], ...]:
+    # sensors_temperatures() does not exist on every platform (e.g. Windows)
+    reader = getattr(psutil, "sensors_temperatures", None)
+    if reader is None:
+        return ()
+    try:
+        temps = reader()
+    except Exception:
+        return ()
+
+    out: list[tuple[str, float]] = []
+    for sensor_name, readings in (temps or {}).items():
+        # Use the first reading for each sensor
+        for reading in readings:
+            out.append((reading.label or sensor_name, float(reading.current)))
+            break
+    return tuple(out)
+
+
+def _read_cpu_freq() -> Optional[float]:
+    try:
+        freq = psutil.cpu_freq()
+    except Exception:
+        return None
+    return float(freq.current) if freq else None
+
+
+class SensorSampler:
+    """
+    Reads every sensor once per call. Holds the state needed for
+    delta-based readings (CPU times, I/O counters) and the probed GPU source, so keep one
+    instance per sampler thread. Blocking (construction included); only use
+    it off the GUI thread.
+
+    io_filters: config.io_filters, used when no io sampler is given.
+    """
+
+    def __init__(
+        self,
+        gpu: Optional[GpuMonitor] = None,
+        io: Optional[IoRateSampler] = None,
+        hwmon: Optional[HwmonReader] = None,
+        processes: Optional[ProcessTable] = None,
+        io_filters: Optional[Mapping[str, Sequence[str]]] = None,
+    ) -> None:
+        self._cpu = CpuLoadEngine()
+        self._gpu = gpu if gpu is not None else GpuMonitor()
+        self._io = io if io is not None else IoRateSampler.from_filters(io_filters)
+        # Direct hwmon reads where available (Linux), psutil elsewhere
+        reader = hwmon if hwmon is not None else HwmonReader()
+        self._hwmon: Optional[HwmonReader] = reader if reader.available() else None
+        # The process scan is the most expensive read, so it is opt-in
+        self._processes = processes
+
+    def enable_processes(self, top_n: int) -> None:
+        if self._processes is None:
+            self._processes = ProcessTable(top_n)
+        else:
+            self._processes.top_n = max(self._processes.top_n, top_n)
+
+    def sample(self) -> SensorSnapshot:
+        cpu = self._cpu.sample()
+        mem = psutil.virtual_memory()
+        if self._hwmon is not None:
+            hw = self._hwmon.read()
+            temperatures, fans = hw.temperatures, hw.fans
+        else:
+            temperatures, fans = _read_temperatures(), ()
+        return SensorSnapshot(
+            timestamp=time.time(),
+            cpu_percent=cpu.total,
+            cpu_per_core=cpu.per_core,
+            ram_used_gb=round(mem.used / (1024**3), 1),
+            ram_percent=float(mem.percent),
+            cpu_freq_mhz=_read_cpu_freq(),
+            temperatures=temperatures,
+            fans=fans,
+            gpu=self._gpu.read(),
+            io=self._io.sample(),
+            processes=self._processes.sample() if self._processes is not None else TopProcesses(),
+        )
+
+    def close(self) -> None:
+        if self._hwmon is not None:
+            self._hwmon.close()
+
+
+class _SensorWorker(QObject):
+    """
+    Lives on the sampler thread and owns the sampling timer. Alert rules are
+    evaluated here too, so the GUI thread only receives the transitions.
+    """
+    sampled = Signal(object)
+    alerted = Signal(object)
+
+    def __init__(
+        self, interval_ms: int, sampler_factory: Callable[[], SensorSampler], alert_rules: Sequence[AlertRule] = ()
+    ) -> None:
+        super().__init__()
+        self._interval_ms = interval_ms
+        self._factory = sampler_factory
+        self._timer: Optional[QTimer] = None
+        self._sampler: Optional[SensorSampler] = None
+        self._alerts = AlertEngine(alert_rules)
+        self._process_top_n = 0
+
+    @Slot()
+    def start(self) -> None:
+        # Built here so provider probing happens on the sampler thread
+        if self._sampler is None:
+            self._sampler = self._factory()
+            if self._process_top_n:
+                self._apply_process_top_n()
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._timer.timeout.connect(self._on_timer)
+        self._sample()
+        self._schedule()
+
+    def _schedule(self) -> None:
+        # Re-armed every tick against the wall clock, so samples stay on
+        # interval boundaries (whole seconds by default) instead of drifting
+        # relative to the UI's TickBus
+        now_ms = time.time() * 1000.0
+        delay = self._interval_ms - (now_ms % self._interval_ms)
+        self._timer.start(max(1, int(delay)))
+
+    def _on_timer(self) -> None:
+        self._sample()
+        if self._timer is not None:
+            self._schedule()
+
+    @Slot()
+    def stop(self) -> None:
+        if self._timer is not None:
+            self._timer.stop()
+            self._timer = None
+        if self._sampler is not None:
+            self._sampler.close()
+            self._sampler = None
+
+    @Slot(int)
+    def enable_processes(self, top_n: int) -> None:
+        self._process_top_n = max(self._process_top_n, top_n)
+        if self._sampler is not None:
+            self._apply_process_top_n()
+
+    def _apply_process_top_n(self) -> None:
+        # Replay samplers have no live process table
+        enable = getattr(self._sampler, "enable_processes", None)
+        if enable is not None:
+            enable(self._process_top_n)
+
+    @Slot(object)
+    def set_alert_rules(self, rules: Sequence[AlertRule]) -> None:
+        # Replacing the rules drops any pending/firing state
+        self._alerts = AlertEngine(rules)
+
+    def _sample(self) -> None:
+        if self._sampler is None:
+            return
+        try:
+            snap = self._sampler.sample()
+        except Exception:
+            return
+        if snap is None:
+            # Nothing new yet (e.g. collector.CollectorSampler between publishes)
+            return
+        self.sampled.emit(snap)
+        for event in self._alerts.evaluate(snap):
+            self.alerted.emit(event)
+
+
+class SensorHub(QObject):
+    """
+    Samples psutil once per interval on a worker thread and broadcasts
+    the resulting SensorSnapshot to every subscriber on the GUI thread.
+
+    sampler_factory swaps the live source for anything with the same
+    sample()/close() methods (e.g. replay.ReplaySampler).
+
+    alert broadcasts an alerts.AlertEvent whenever a rule fires or resolves.
+    """
+    snapshot = Signal(object)
+    alert = Signal(object)
+    _rules_changed = Signal(object)
+    _processes_wanted = Signal(int)
+
+    def __init__(
+        self,
+        interval_ms: int = 1000,
+        parent: QObject | None = None,
+        sampler_factory: Optional[Callable[[], SensorSampler]] = None,
+        alert_rules: Sequence[AlertRule] = (),
+    ) -> None:
+        super().__init__(parent)
+        self._latest: Optional[SensorSnapshot] = None
+
+        self._thread = QThread(self)
+        self._thread.setObjectName("sensor-hub")
+        self._worker = _SensorWorker(interval_ms, sampler_factory or SensorSampler, tuple(alert_rules))
+        self._worker.moveToThread(self._thread)
+        # Queued: the engine is only ever touched on the sampler thread
+        self._rules_changed.connect(self._worker.set_alert_rules)
+        self._processes_wanted.connect(self._worker.enable_processes)
+        self._worker.alerted.connect(self.alert)
+
+        self._thread.started.connect(self._worker.start)
+        # finished is emitted from the sampler thread, so stop the timer there
+        self._thread.finished.connect(self._worker.stop, Qt.ConnectionType.DirectConnection)
+        self._worker.sampled.connect(self._on_sampled)
+
+    @property
+    def latest(self) -> Optional[SensorSnapshot]:
+        return self._latest
+
+    def is_running(self) -> bool:
+        return self._thread.isRunning()
+
+    def set_alert_rules(self, rules: Sequence[AlertRule]) -> None:
+        self._rules_changed.emit(tuple(rules))
+
+    def enable_processes(self, top_n: int = 5) -> None:
+        """Include the top_n heaviest processes in every following snapshot."""
+        self._processes_wanted.emit(top_n)
+
+    def start(self) -> None:
+        if not self._thread.isRunning():
+            self._thread.start()
+
+    def stop(self) -> None:
+        if self._thread.isRunning():
+            self._thread.quit()
+            self._thread.wait()
+
+    @Slot(object)
+    def _on_sampled(self, snap: SensorSnapshot) -> None:
+        self._latest = snap
+        self.snapshot.emit(snap)
+
+
+# Global singleton instance (created lazily, it owns a thread)
+_hub: Optional[SensorHub] = None
+
+
+def get_sensor_hub() -> SensorHub:
+    global _hub
+    if _hub is None:
+        _hub = SensorHub()
+    return _hub
+
+
+def set_sensor_hub(hub: SensorHub) -> None:
+    """
+    Install a different hub (replay, tests). Call before any widget subscribes.
+    """
+    global _hub
+    _hub = hub
@@ -3,12 +3,17 @@ from __future__ import annotations
 from dataclasses import dataclass, asdict
 from pathlib import Path
 import json
-from typing import Any
+import threading
+import time
+from typing import Any, Optional
 from datetime import datetime
 
 
 STATE_PATH = Path(__file__).resolve().parent.parent / "state.json"
 
+# Changes reach state.json this long after the first unsaved one, together
+FLUSH_INTERVAL_MS = 1000
+
 
 @dataclass
 class TodoItem:
@@ -125,31 +130,156 @@ def _normalise_state(data: dict[str, Any]) -> AppState:
     )
 
 
-def load_state() -> AppState:
-    if not STATE_PATH.exists():
-        state = AppState(todos=[])
-        save_state(state)
-        return state
+def _save_defaults(path: Path) -> AppState:
+    """Defaults for a missing or unreadable file, written back if possible."""
+    state = _normalise_state({})
+    try:
+        save_state(state, path)
+    except OSError as e:
+        from app.logger import get_logger
+
+        get_logger().error("state", f"Error saving state: {e}")
+    return state
+
+
+def load_state(path: Optional[Path] = None) -> AppState:
+    path = path or STATE_PATH
+    if not path.exists():
+        return _save_defaults(path)
 
     try:
-        data = json.loads(STATE_PATH.read_text(encoding="utf-8"))
+        data = json.loads(path.read_text(encoding="utf-8"))
         if not isinstance(data, dict):
             raise ValueError("state.json not a dict")
         return _normalise_state(data)
     except Exception:
-        state = AppState(todos=[])
-        save_state(state)
-        return state
-
-
-def save_state(state: AppState) -> None:
-    payload = {
-        "todos": [asdict(t) for t in state.todos],
-        "break_reminder": asdict(state.break_reminder) if state.break_reminder else {},
-        "focus_streak": asdict(state.focus_streak) if state.focus_streak else {},
-        "distraction_blocker": asdict(state.distraction_blocker) if state.distraction_blocker else {},
-        "hydration_reminder": asdict(state.hydration_reminder) if state.hydration_reminder else {},
-        "pomodoro_cycles": asdict(state.pomodoro_cycles) if state.pomodoro_cycles else {},
-    }
-    STATE_PATH.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+        return _save_defaults(path)
+
+
+SECTIONS = ("todos", "break_reminder", "focus_streak", "distraction_blocker",
+            "hydration_reminder", "pomodoro_cycles")
+
+
+def _section_payload(value: Any) -> Any:
+    if isinstance(value, list):
+        return [asdict(t) for t in value]
+    return asdict(value) if value else {}
+
+
+def save_state(state: AppState, path: Optional[Path] = None) -> None:
+    payload = {name: _section_payload(getattr(state, name)) for name in SECTIONS}
+    (path or STATE_PATH).write_text(json.dumps(payload, indent=2), encoding="utf-8")
+
+
+class StateStore:
+    """
+    Process-wide copy of state.json, loaded once. Each widget reads its own
+    section with section() and hands changes back with update(); the
+    section is serialised on the caller's thread and marked dirty. A writer
+    thread saves all dirty sections in one write FLUSH_INTERVAL_MS after
+    the first change, so a burst of clicks costs a single write. flush()
+    writes at once; close() flushes and stops the writer (on shutdown).
+    """
+
+    def __init__(self, path: Optional[Path] = None, flush_interval_ms: int = FLUSH_INTERVAL_MS) -> None:
+        self.path = Path(path) if path is not None else STATE_PATH
+        self.flush_interval_ms = max(0, int(flush_interval_ms))
+        self._state = load_state(self.path)
+        # Last serialised form of every section, as written to disk
+        self._payload = {name: _section_payload(getattr(self._state, name)) for name in SECTIONS}
+        self._dirty: set[str] = set()
+        self._cond = threading.Condition()
+        # Held from snapshot to rename so writes land in order
+        self._write_lock = threading.Lock()
+        self._closed = False
+        self._writes = 0
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def writes(self) -> int:
+        return self._writes
+
+    @property
+    def dirty(self) -> frozenset[str]:
+        with self._cond:
+            return frozenset(self._dirty)
+
+    def section(self, name: str) -> Any:
+        if name not in SECTIONS:
+            raise KeyError(name)
+        return getattr(self._state, name)
+
+    def update(self, name: str, value: Any) -> None:
+        """Replace a section (or pass the changed one back) and schedule a write."""
+        if name not in SECTIONS:
+            raise KeyError(name)
+        setattr(self._state, name, value)
+        snapshot = _section_payload(value)
+        with self._cond:
+            self._payload[name] = snapshot
+            self._dirty.add(name)
+            closed = self._closed
+            if not closed:
+                if self._thread is None:
+                    self._thread = threading.Thread(target=self._run, name="state-writer", daemon=True)
+                    self._thread.start()
+                self._cond.notify()
+        if closed:
+            self.flush()
+
+    def flush(self) -> bool:
+        """Write dirty sections now; False if there were none."""
+        with self._write_lock:
+            with self._cond:
+                if not self._dirty:
+                    return False
+                self._dirty.clear()
+                payload = dict(self._payload)
+            self._write(payload)
+        return True
+
+    def close(self, timeout: float = 2.0) -> None:
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        if self._thread is not None:
+            self._thread.join(timeout)
+        self.flush()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._dirty and not self._closed:
+                    self._cond.wait()
+                # Let further changes pile up before writing
+                deadline = time.monotonic() + self.flush_interval_ms / 1000.0
+                while not self._closed:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+                if self._closed:
+                    return  # close() does the final flush
+            self.flush()
+
+    def _write(self, payload: dict[str, Any]) -> None:
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        try:
+            tmp.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+            tmp.replace(self.path)
+            self._writes += 1
+        except OSError as e:
+            from app.logger import get_logger
+
+            get_logger().error("state", f"Error saving state: {e}")
+
+
+_store: Optional[StateStore] = None
+
+
+def get_state_store() -> StateStore:
+    global _store
+    if _store is None:
+        _store = StateStore()
+    return _store
 
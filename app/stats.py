@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+import math
+from collections import deque
+from typing import Optional
+
+
+class Ema:
+    """
+    Time-aware exponential moving average: a sample dt seconds after the
+    previous one gets weight 1 - exp(-dt / tau_s), so irregular ticks
+    (replay speed, a stalled sampler) smooth the same as steady ones.
+    """
+
+    def __init__(self, tau_s: float = 5.0) -> None:
+        self.tau_s = tau_s
+        self.value: Optional[float] = None
+        self._ts: Optional[float] = None
+
+    def add(self, value: float, ts: float) -> float:
+        if self.value is None or self._ts is None or self.tau_s <= 0:
+            self.value = value
+        else:
+            dt = max(0.0, ts - self._ts)
+            alpha = 1.0 - math.exp(-dt / self.tau_s)
+            self.value += alpha * (value - self.value)
+        self._ts = ts
+        return self.value
+
+
+class RunningStats:
+    """Welford mean/variance; two instances merge exactly (Chan et al.)."""
+
+    __slots__ = ("count", "mean", "_m2")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+
+    def merge(self, other: "RunningStats") -> None:
+        if other.count == 0:
+            return
+        n = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / n
+        self._m2 += other._m2 + delta * delta * self.count * other.count / n
+        self.count = n
+
+    @property
+    def variance(self) -> float:
+        # Sample variance; 0 until there are two samples
+        return self._m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def stddev(self) -> float:
+        return math.sqrt(self.variance)
+
+
+class QuantileSketch:
+    """
+    Log-bucketed quantile sketch (DDSketch style): every value lands in a
+    bucket whose width is a fixed fraction of its magnitude, so quantiles
+    come back within relative_accuracy and memory depends on the value
+    range, not the sample count. Counts can be added and subtracted, which
+    is what makes sliding windows cheap. Values <= 0 share one zero bucket.
+    """
+
+    MIN_VALUE = 1e-6
+
+    def __init__(self, relative_accuracy: float = 0.01) -> None:
+        self.relative_accuracy = relative_accuracy
+        gamma = (1.0 + relative_accuracy) / (1.0 - relative_accuracy)
+        self._gamma = gamma
+        self._log_gamma = math.log(gamma)
+        self.bins: dict[int, int] = {}
+        self.zero = 0
+        self.count = 0
+
+    def key(self, value: float) -> Optional[int]:
+        if value <= self.MIN_VALUE:
+            return None
+        return math.ceil(math.log(value) / self._log_gamma)
+
+    def add_key(self, key: Optional[int], n: int = 1) -> None:
+        self.count += n
+        if key is None:
+            self.zero += n
+            return
+        left = self.bins.get(key, 0) + n
+        if left:
+            self.bins[key] = left
+        else:
+            del self.bins[key]
+
+    def add(self, value: float) -> None:
+        self.add_key(self.key(value))
+
+    def quantile(self, q: float) -> Optional[float]:
+        if self.count <= 0:
+            return None
+        rank = q * (self.count - 1)
+        seen = self.zero
+        if seen > rank:
+            return 0.0
+        # Sorting the occupied buckets (a few hundred at most), not the samples
+        for key in sorted(self.bins):
+            seen += self.bins[key]
+            if seen > rank:
+                return 2.0 * self._gamma ** key / (self._gamma + 1.0)
+        return 2.0 * self._gamma ** max(self.bins) / (self._gamma + 1.0)
+
+
+class _Pane:
+    __slots__ = ("index", "stats", "keys")
+
+    def __init__(self, index: int) -> None:
+        self.index = index
+        self.stats = RunningStats()
+        self.keys: dict[Optional[int], int] = {}
+
+
+class WindowedStats:
+    """
+    Mean, variance and quantiles over the last window_s seconds. The window
+    is split into `panes` slices that each keep a RunningStats and their
+    sketch bucket counts; a slice that ages out is subtracted from the
+    window sketch in one step. Per sample the cost is O(1).
+    """
+
+    def __init__(self, window_s: float = 300.0, panes: int = 30, relative_accuracy: float = 0.01) -> None:
+        self.window_s = window_s
+        self._pane_s = window_s / max(1, panes)
+        self._panes: deque[_Pane] = deque()
+        self._sketch = QuantileSketch(relative_accuracy)
+
+    def _expire(self, now: float) -> None:
+        oldest = int((now - self.window_s) // self._pane_s)
+        while self._panes and self._panes[0].index <= oldest:
+            pane = self._panes.popleft()
+            for key, n in pane.keys.items():
+                self._sketch.add_key(key, -n)
+
+    def add(self, value: float, ts: float) -> None:
+        index = int(ts // self._pane_s)
+        # Samples from the past (clock stepped back) go into the newest pane
+        if not self._panes or index > self._panes[-1].index:
+            self._panes.append(_Pane(index))
+        pane = self._panes[-1]
+        pane.stats.add(value)
+        key = self._sketch.key(value)
+        pane.keys[key] = pane.keys.get(key, 0) + 1
+        self._sketch.add_key(key)
+        self._expire(ts)
+
+    def summary(self) -> RunningStats:
+        merged = RunningStats()
+        for pane in self._panes:
+            merged.merge(pane.stats)
+        return merged
+
+    @property
+    def count(self) -> int:
+        return self._sketch.count
+
+    def quantile(self, q: float) -> Optional[float]:
+        return self._sketch.quantile(q)
+
+
+class StatsStage:
+    """
+    Per-metric EMA and windowed statistics, fed once per sample next to
+    HistoryStore. Recording is O(1); quantiles are only worked out when a
+    display asks for them.
+    """
+
+    def __init__(self, window_s: float = 300.0, tau_s: float = 5.0) -> None:
+        self.window_s = window_s
+        self.tau_s = tau_s
+        self._ema: dict[str, Ema] = {}
+        self._windows: dict[str, WindowedStats] = {}
+
+    def record(self, name: str, value: float, ts: float) -> None:
+        ema = self._ema.get(name)
+        if ema is None:
+            ema = self._ema[name] = Ema(self.tau_s)
+            self._windows[name] = WindowedStats(self.window_s)
+        ema.add(value, ts)
+        self._windows[name].add(value, ts)
+
+    def smoothed(self, name: str) -> Optional[float]:
+        ema = self._ema.get(name)
+        return ema.value if ema is not None else None
+
+    def window(self, name: str) -> Optional[WindowedStats]:
+        return self._windows.get(name)
+
+    def quantile(self, name: str, q: float) -> Optional[float]:
+        window = self._windows.get(name)
+        return window.quantile(q) if window is not None else None
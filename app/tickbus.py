@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import math
+import time
+from typing import Callable, Optional
+
+from PySide6.QtCore import QObject, QTimer, Qt
+
+from app.logger import get_logger
+
+# Fire a few ms after the boundary so the clock has certainly rolled over
+_LATE_MS = 5
+
+
+class Subscription:
+    """
+    Handle returned by TickBus.subscribe(). The callback runs on wall-clock
+    seconds where second % interval_s == phase_s.
+    """
+
+    def __init__(self, bus: "TickBus", callback: Callable[[], None], interval_s: int, phase_s: int, coarse: bool) -> None:
+        self._bus = bus
+        self.callback = callback
+        self.interval_s = max(1, int(interval_s))
+        self.phase_s = int(phase_s) % self.interval_s
+        self.coarse = coarse
+        self.active = True
+
+    def next_due(self, after: int) -> int:
+        """First due second strictly after `after`."""
+        n = after + 1
+        return n + (self.phase_s - n) % self.interval_s
+
+    def set_active(self, active: bool) -> None:
+        if active != self.active:
+            self.active = active
+            self._bus._rearm()
+
+    def cancel(self) -> None:
+        self._bus._remove(self)
+
+
+class TickBus(QObject):
+    """
+    One timer for every periodic UI update, aligned to wall-clock seconds.
+    Subscriptions due on the same second run back to back in one timer
+    event, so they repaint in the same frame; the timer sleeps until the
+    next second anything is due and is stopped when nothing is.
+
+    Coarse subscriptions (minute-scale reminders) let Qt batch the wakeup
+    with other timers when they are the only thing due.
+    """
+
+    def __init__(self, parent: QObject | None = None, clock: Callable[[], float] = time.time) -> None:
+        super().__init__(parent)
+        self._clock = clock
+        self._subs: list[Subscription] = []
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._fire)
+        self._last_second: Optional[int] = None
+
+    def subscribe(
+        self,
+        callback: Callable[[], None],
+        interval_s: int = 1,
+        phase_s: int = 0,
+        coarse: bool = False,
+        owner: QObject | None = None,
+        active: bool = True,
+    ) -> Subscription:
+        """
+        owner: unsubscribe automatically when this QObject is destroyed.
+        active=False registers the subscription paused (see set_active).
+        """
+        sub = Subscription(self, callback, interval_s, phase_s, coarse)
+        sub.active = active
+        self._subs.append(sub)
+        if owner is not None:
+            # No re-arm here: owners can outlive the bus at shutdown, and a
+            # stale wakeup just finds nothing due and re-arms itself
+            owner.destroyed.connect(lambda *_: self._subs.remove(sub) if sub in self._subs else None)
+        self._rearm()
+        return sub
+
+    def subscriptions(self) -> list[Subscription]:
+        return list(self._subs)
+
+    def _remove(self, sub: Subscription) -> None:
+        if sub in self._subs:
+            self._subs.remove(sub)
+            self._rearm()
+
+    def _rearm(self) -> None:
+        active = [s for s in self._subs if s.active]
+        if not active:
+            self._timer.stop()
+            return
+        now = self._clock()
+        # Never re-fire a second that was already dispatched
+        after = max(math.floor(now), self._last_second if self._last_second is not None else -1)
+        target = min(s.next_due(after) for s in active)
+        precise = any(not s.coarse for s in active if s.next_due(after) == target)
+        self._timer.setTimerType(Qt.TimerType.PreciseTimer if precise else Qt.TimerType.CoarseTimer)
+        delay_ms = max(0, int((target - now) * 1000) + _LATE_MS)
+        self._timer.start(delay_ms)
+
+    def _fire(self) -> None:
+        second = math.floor(self._clock())
+        prev = self._last_second if self._last_second is not None else second - 1
+        if second > prev:
+            self._last_second = second
+            for sub in list(self._subs):
+                # A late wakeup (suspend, busy loop) still runs each due callback once
+                if sub.active and sub.next_due(prev) <= second:
+                    try:
+                        sub.callback()
+                    except Exception as e:
+                        # One broken widget must not stop everyone else's ticks
+                        get_logger().error("tickbus", f"callback failed: {e}")
+        self._rearm()
+
+
+# Global singleton instance (created lazily on the GUI thread)
+_bus: Optional[TickBus] = None
+
+
+def get_tick_bus() -> TickBus:
+    global _bus
+    if _bus is None:
+        _bus = TickBus()
+    return _bus
@@ -1,8 +1,23 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import Iterable
 
 
 def project_root() -> Path:
     # app/utils.py -> app/ -> project root
     return Path(__file__).resolve().parent.parent
+
+
+def unique_labels(labels: Iterable[str]) -> list[str]:
+    """
+    labels with repeats numbered in order: ("fan", "fan", "fan") gives
+    ["fan", "fan#2", "fan#3"]. Sensor readers list their sensors in a
+    fixed order, so this is a stable key per reading.
+    """
+    seen: dict[str, int] = {}
+    out: list[str] = []
+    for label in labels:
+        n = seen[label] = seen.get(label, 0) + 1
+        out.append(label if n == 1 else f"{label}#{n}")
+    return out
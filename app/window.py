@@ -3,20 +3,29 @@ from __future__ import annotations
 import time
 from pathlib import Path
 
-from PySide6.QtCore import QTimer, QRect, Qt
+from PySide6.QtCore import QRect, Qt, QTimer
 from PySide6.QtGui import QCloseEvent, QAction, QIcon
 from PySide6.QtWidgets import QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QPushButton
 
-import psutil
-
-from app.config import AppConfig
-from app.state import load_state, save_state, AppState
+from app.alerts import FIRING, STALE, AlertEvent
+from app.config import AppConfig, DEFAULT_LOG_MAX_LINES
+from app.log_store import LogStore
+from app.logger import get_logger
+from app.recorder import SnapshotRecorder
+from app.sensors import SensorSnapshot, get_sensor_hub
+from app.state import get_state_store
 from ui.dashboard import DashboardView
+from ui.widgets import AlertBanner
 
 
 class MainWindow(QMainWindow):
-    def __init__(self, screen_geometry: QRect, cfg: AppConfig) -> None:
+    def __init__(self, screen_geometry: QRect, cfg: AppConfig, record_metrics: bool = True) -> None:
         super().__init__()
+        # Startup timings (time-to-first-frame / time-to-interactive) are measured from here
+        self._started = time.perf_counter()
+        self._first_frame_ms: float | None = None
+        self._interactive_ms: float | None = None
+        self._log = get_logger()
 
         self.setWindowTitle("case dashboard")
         self.setGeometry(screen_geometry)
@@ -42,7 +51,11 @@ class MainWindow(QMainWindow):
         top_bar.setMaximumHeight(60)
         top_bar_layout = QHBoxLayout(top_bar)
         top_bar_layout.setContentsMargins(10, 8, 10, 8)
-        top_bar_layout.setSpacing(0)
+        top_bar_layout.setSpacing(10)
+
+        # Active threshold alerts (hidden while none are firing)
+        self.alert_banner = AlertBanner(top_bar)
+        top_bar_layout.addWidget(self.alert_banner, 1)
         top_bar_layout.addStretch()  # Push button to the right
 
         # Create quit button
@@ -76,7 +89,16 @@ class MainWindow(QMainWindow):
         # Add top bar and dashboard to main layout
         main_layout.addWidget(top_bar, 0)
 
-        self.dashboard = DashboardView(layout_cfg=cfg.layout, widget_order=getattr(cfg, "widget_order", None), parent=container)
+        self.dashboard = DashboardView(
+            layout_cfg=cfg.layout,
+            widget_order=getattr(cfg, "widget_order", None),
+            parent=container,
+            metric_display=getattr(cfg, "metric_display", None),
+            # Placeholders first; real widgets are built after the first frame
+            progressive=True,
+            log_max_lines=getattr(cfg, "log_max_lines", DEFAULT_LOG_MAX_LINES),
+        )
+        self.dashboard.ready.connect(self._on_interactive)
         main_layout.addWidget(self.dashboard, 1)
 
         container.setLayout(main_layout)
@@ -89,37 +111,87 @@ class MainWindow(QMainWindow):
         quit_action.triggered.connect(self.close)
         file_menu.addAction(quit_action)
 
-        # Load state
-        state = load_state()
-        self.dashboard.set_todos(state.todos)
+        # Load state (state.json is read once, by the shared store)
+        self.dashboard.set_todos(get_state_store().section("todos"))
 
-        # ---- Heartbeat timer (placeholder metrics/logs) ----
+        # ---- Heartbeat (driven by the shared sensor hub) ----
         self._t0 = time.time()
         self._tick = 0
 
-        self._timer = QTimer(self)
-        self._timer.timeout.connect(self._on_tick)
-        self._timer.start(1000)
+        # Every snapshot is also appended to the on-disk recording (not when replaying one)
+        self._recorder: SnapshotRecorder | None = SnapshotRecorder() if record_metrics else None
+
+        # Log lines reach the logs panel in batches from the logging pipeline
+        self._log.batch.connect(self.dashboard.append_records)
+
+        hub = get_sensor_hub()
+        hub.snapshot.connect(self._on_tick)
+        hub.alert.connect(self._on_alert)
 
-    def _on_tick(self) -> None:
+    def _on_tick(self, snap: SensorSnapshot) -> None:
         self._tick += 1
 
-        cpu_load = psutil.cpu_percent()
-        gpu_load = cpu_load  # Placeholder: use CPU for GPU
-        ram_used = round(psutil.virtual_memory().used / (1024**3), 1)
+        cpu_load = snap.cpu_percent
+        gpu_load = snap.gpu.load_percent if snap.gpu is not None else None
+        ram_used = snap.ram_used_gb
 
-        self.dashboard.set_metrics(cpu_temp=cpu_load, gpu_load=gpu_load, ram_used=ram_used)
+        self.dashboard.set_metrics(cpu_temp=cpu_load, gpu_load=gpu_load, ram_used=ram_used, timestamp=snap.timestamp)
+
+        if self._recorder is not None:
+            try:
+                self._recorder.record(snap)
+            except OSError as e:
+                # Disk full / read-only: stop recording, keep the dashboard running
+                self._log.error("recorder", f"disabled: {e}")
+                self._recorder.close()
+                self._recorder = None
 
         if self._tick % 10 == 0:
-            self.dashboard.append_log(
-                f"[ui] tick={self._tick} cpu={cpu_load}% gpu={gpu_load}% ram={ram_used}gb"
+            self._log.info(
+                "ui",
+                f"tick={self._tick} cpu={cpu_load:.1f}% "
+                f"gpu={'n/a' if gpu_load is None else f'{gpu_load:.0f}%'} ram={ram_used}gb"
+            )
+
+    def paintEvent(self, event) -> None:
+        super().paintEvent(event)
+        if self._first_frame_ms is None:
+            self._first_frame_ms = (time.perf_counter() - self._started) * 1000
+            self._log.info(
+                "ui",
+                f"first frame after {self._first_frame_ms:.0f} ms "
+                f"({self.dashboard.pending} widgets pending)"
             )
+            if not self.dashboard.pending:
+                self._on_interactive()
+
+    def _on_interactive(self) -> None:
+        if self._interactive_ms is not None:
+            return
+        self._interactive_ms = (time.perf_counter() - self._started) * 1000
+        self._log.info("ui", f"interactive after {self._interactive_ms:.0f} ms")
+        # Previous sessions' lines page in from the on-disk history. The first
+        # page may decode all of current.log, so it waits for the next pass
+        # instead of holding up the first frame.
+        if isinstance(self._log.file_sink, LogStore):
+            QTimer.singleShot(0, self, lambda: self.dashboard.set_log_history(self._log.file_sink.before))
+
+    def _on_alert(self, event: AlertEvent) -> None:
+        self.alert_banner.show_alert(event)
+        if event.state == FIRING:
+            self._log.warning("alert", f"ALERT {event.message}")
+        elif event.state == STALE:
+            self._log.warning("alert", event.message)
+        else:
+            self._log.info("alert", f"resolved {event.message}")
 
     def closeEvent(self, event: QCloseEvent) -> None:
         # Save state on close
-        todos = self.dashboard.get_todos()
-        state = AppState(todos=todos)
-        save_state(state)
+        store = get_state_store()
+        store.update("todos", self.dashboard.get_todos())
+        store.flush()
+        if self._recorder is not None:
+            self._recorder.close()
         super().closeEvent(event)
 
     def keyPressEvent(self, event) -> None:
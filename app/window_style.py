@@ -1,6 +1,107 @@
 from __future__ import annotations
 
-from PySide6.QtWidgets import QWidget
+from typing import Optional
+
+from PySide6.QtWidgets import QApplication, QWidget
+
+# Colours that follow a widget's "state" dynamic property. Widgets keep their
+# sizing in their own sheet and only flip the property via set_style_state(),
+# so Qt re-resolves the style when the state changes, not on every refresh.
+STATE_STYLE = """
+/* ---------------- State colours ---------------- */
+QLabel#timerLabel[state="ok"], QLabel#dndTimer[state="ok"],
+QLabel#breakStatus[state="ok"], QLabel#breakTime[state="ok"],
+QLabel#hydrationStatus[state="ok"] {
+    color: #4CAF50;
+}
+
+QLabel#timerLabel[state="warn"] {
+    color: #FF9800;
+}
+
+QLabel#timerLabel[state="alert"] {
+    color: #f44336;
+}
+
+QLabel#dndTimer[state="alert"], QLabel#breakStatus[state="alert"],
+QLabel#breakTime[state="alert"], QLabel#hydrationStatus[state="alert"] {
+    color: #FF5722;
+}
+
+QLabel#breakStatus, QLabel#dndStatus, QLabel#hydrationStatus {
+    color: #666;
+}
+
+QLabel#breakTime {
+    color: #2196F3;
+}
+
+QLabel#timerLabel {
+    color: #333;
+}
+
+QLabel#fanValue, QLabel#tempValue[state="ok"] {
+    color: #00cc00;
+}
+
+QLabel#tempValue[state="warm"] {
+    color: #ffcc00;
+}
+
+QLabel#tempValue[state="hot"] {
+    color: #ff6600;
+}
+
+QLabel#tempValue[state="alert"] {
+    color: #ff0000;
+}
+
+QLabel#streakNumber {
+    font-size: 32px;
+    color: #FF6F00;
+}
+
+QLabel#streakNumber[state="milestone"] {
+    font-size: 36px;
+    color: #FFD700;
+}
+"""
+
+STATE_PROPERTY = "state"
+
+_repolish_count = 0
+
+
+def set_style_state(widget: QWidget, state: str) -> bool:
+    """
+    Set widget's "state" property and repolish it, but only when the value
+    actually changes. Returns True if a repolish happened.
+    """
+    global _repolish_count
+    if widget.property(STATE_PROPERTY) == state:
+        return False
+    widget.setProperty(STATE_PROPERTY, state)
+    style = widget.style()
+    style.unpolish(widget)
+    style.polish(widget)
+    widget.update()
+    _repolish_count += 1
+    return True
+
+
+def repolish_count() -> int:
+    """Number of state changes that forced a repolish so far."""
+    return _repolish_count
+
+
+def apply_state_style(app: Optional[QApplication] = None) -> None:
+    """Install STATE_STYLE application-wide (idempotent)."""
+    app = app or QApplication.instance()
+    if app is None:
+        return
+    sheet = app.styleSheet()
+    if STATE_STYLE not in sheet:
+        app.setStyleSheet(sheet + STATE_STYLE)
 
 
 def apply_base_style(widget: QWidget) -> None:
@@ -59,4 +160,5 @@ def apply_base_style(widget: QWidget) -> None:
             padding-top: 10px; /* aligns baseline visually with big number */
         }
         """
+        + STATE_STYLE
     )
@@ -1,7 +1,10 @@
+import multiprocessing
 import sys
 import os
 sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
 from app.app import run_app
 
 if __name__ == "__main__":
+    # The --collector process is spawned from this executable when frozen
+    multiprocessing.freeze_support()
     raise SystemExit(run_app())
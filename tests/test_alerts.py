@@ -0,0 +1,100 @@
+import sys
+
+from PySide6.QtWidgets import QApplication
+
+from app.alerts import FIRING, RESOLVED, STALE, AlertEngine, AlertRule, parse_rules
+from app.gpu import GpuReading
+from app.sensors import SensorSnapshot
+from ui.widgets import AlertBanner
+
+app = QApplication.instance() or QApplication(sys.argv)
+
+
+def _snap(ts, temp=50.0, cpu=10.0, gpu=None):
+    return SensorSnapshot(timestamp=ts, cpu_percent=cpu, temperatures=(("Tctl", temp), ("edge", 40.0)),
+                          gpu=GpuReading(source="x", load_percent=gpu) if gpu is not None else None)
+
+
+def test_rule_fires_only_after_duration():
+    engine = AlertEngine([AlertRule("hot", "temp:Tctl", 85.0, duration_s=30.0, hysteresis=5.0)])
+    assert engine.evaluate(_snap(0, 90.0)) == []
+    assert engine.evaluate(_snap(20, 90.0)) == []
+    events = engine.evaluate(_snap(30, 91.0))
+    assert [(e.rule, e.state, e.value) for e in events] == [("hot", FIRING, 91.0)]
+    # Already firing: no repeat
+    assert engine.evaluate(_snap(31, 95.0)) == []
+    assert engine.active() == ["hot"]
+
+
+def test_dip_below_threshold_restarts_duration():
+    engine = AlertEngine([AlertRule("hot", "temp:Tctl", 85.0, duration_s=10.0)])
+    engine.evaluate(_snap(0, 90.0))
+    engine.evaluate(_snap(5, 80.0))
+    assert engine.evaluate(_snap(10, 90.0)) == []
+    assert engine.evaluate(_snap(20, 90.0))[0].state == FIRING
+
+
+def test_hysteresis_band_holds_alert():
+    engine = AlertEngine([AlertRule("hot", "temp:Tctl", 85.0, hysteresis=5.0)])
+    assert engine.evaluate(_snap(0, 86.0))[0].state == FIRING
+    # Between threshold - hysteresis and threshold: still firing
+    assert engine.evaluate(_snap(1, 82.0)) == []
+    events = engine.evaluate(_snap(2, 79.0))
+    assert [e.state for e in events] == [RESOLVED]
+    assert engine.active() == []
+
+
+def test_pattern_uses_worst_channel_and_below_direction():
+    engine = AlertEngine([
+        AlertRule("any hot", "temp:*", 60.0),
+        AlertRule("gpu idle", "gpu", 5.0, above=False),
+    ])
+    events = engine.evaluate(_snap(0, temp=50.0, gpu=2.0))
+    assert [e.rule for e in events] == ["gpu idle"]
+    events = engine.evaluate(_snap(1, temp=70.0, gpu=50.0))
+    assert sorted((e.rule, e.state) for e in events) == [("any hot", FIRING), ("gpu idle", RESOLVED)]
+
+
+def test_missing_metric_never_fires():
+    engine = AlertEngine([AlertRule("gpu busy", "gpu", 50.0), AlertRule("fan", "fan:*", 0.0)])
+    assert engine.evaluate(_snap(0)) == []
+
+
+def test_firing_rule_clears_when_metric_stops_reporting():
+    engine = AlertEngine([AlertRule("gpu busy", "gpu", 50.0, duration_s=10.0)])
+    engine.evaluate(_snap(0, gpu=90.0))
+    assert [e.state for e in engine.evaluate(_snap(10, gpu=90.0))] == [FIRING]
+    # GPU gone: held for duration_s, then cleared once
+    assert engine.evaluate(_snap(15)) == []
+    events = engine.evaluate(_snap(20))
+    assert [e.state for e in events] == [STALE]
+    assert "no readings" in events[0].message
+    assert engine.active() == []
+    assert engine.evaluate(_snap(30)) == []
+
+
+def test_parse_rules_skips_bad_entries():
+    rules = parse_rules([
+        {"name": "Hot", "metric": "temp:*", "threshold": 85, "duration_s": 30, "hysteresis": 5},
+        {"metric": "gpu", "threshold": "x"},
+        {"threshold": 3},
+        {"metric": "ram", "threshold": 1, "direction": "below"},
+        "nope",
+    ])
+    assert rules == [
+        AlertRule("Hot", "temp:*", 85.0, 30.0, 5.0, True),
+        AlertRule("ram", "ram", 1.0, 0.0, 0.0, False),
+    ]
+    assert parse_rules(None) == []
+
+
+def test_banner_tracks_active_alerts():
+    banner = AlertBanner()
+    engine = AlertEngine([AlertRule("hot", "temp:Tctl", 85.0)])
+    for e in engine.evaluate(_snap(0, 90.0)):
+        banner.show_alert(e)
+    assert banner.active() == ["hot"] and "hot" in banner.text()
+    assert not banner.isHidden()
+    for e in engine.evaluate(_snap(1, 50.0)):
+        banner.show_alert(e)
+    assert banner.active() == [] and banner.isHidden()
@@ -0,0 +1,75 @@
+import os
+import signal
+import time
+
+from app.collector import SIZE, CollectorSampler, SnapshotReader, SnapshotWriter
+from app.gpu import GpuReading
+from app.io_rates import DeviceRate, IoRates
+from app.processes import ProcessInfo, TopProcesses
+from app.sensors import SensorSnapshot
+
+
+def _snap(ts=1_800_000_000.0):
+    return SensorSnapshot(
+        timestamp=ts, cpu_percent=12.5, cpu_per_core=(10.0, 15.0), ram_used_gb=7.5, ram_percent=40.0,
+        cpu_freq_mhz=None, temperatures=(("Tctl", 61.0),), fans=(("cpu_fan", 1100.0),),
+        gpu=GpuReading(source="sysfs", load_percent=30.0, temp_c=55.0),
+        io=IoRates(net=(DeviceRate("eth0", 100.0, 50.0),)),
+        processes=TopProcesses(by_cpu=(ProcessInfo(42, "python", 99.0, 1 << 30),)),
+    )
+
+
+def test_snapshot_round_trips_through_shared_block():
+    buf = memoryview(bytearray(SIZE))
+    writer, reader = SnapshotWriter(buf), SnapshotReader(buf)
+    assert reader.read() is None
+
+    writer.write(_snap())
+    got = reader.read()
+    assert got.timestamp == 1_800_000_000.0
+    assert got.cpu_percent == 12.5 and got.cpu_per_core == (10.0, 15.0)
+    assert got.cpu_freq_mhz is None
+    assert got.temperatures == (("Tctl", 61.0),) and got.fans == (("cpu_fan", 1100.0),)
+    assert got.gpu.source == "sysfs" and got.gpu.load_percent == 30.0 and got.gpu.vram_used_mb is None
+    assert got.io.net_rx_bps == 100.0 and got.io.disk == ()
+    assert got.processes.by_cpu == (ProcessInfo(42, "python", 99.0, 1 << 30),)
+    # Nothing new published since
+    assert reader.read() is None
+
+
+def test_reader_skips_write_in_progress_and_writer_resumes_sequence():
+    buf = memoryview(bytearray(SIZE))
+    SnapshotWriter(buf).write(_snap())
+    reader = SnapshotReader(buf)
+    assert reader.read() is not None
+
+    # Simulate a collector killed mid-write: odd sequence
+    buf[0] = buf[0] + 1
+    assert reader.read() is None
+
+    # A restarted collector keeps counting up, so the reader sees its data
+    SnapshotWriter(buf).write(_snap(ts=1_800_000_001.0))
+    assert reader.read().timestamp == 1_800_000_001.0
+
+
+def test_collector_process_publishes_and_restarts():
+    sampler = CollectorSampler(interval_ms=50)
+    try:
+        def wait_for_snapshot():
+            deadline = time.monotonic() + 30
+            while time.monotonic() < deadline:
+                snap = sampler.sample()
+                if snap is not None:
+                    return snap
+                time.sleep(0.05)
+            raise AssertionError("collector published nothing")
+
+        assert wait_for_snapshot().cpu_percent >= 0.0
+
+        os.kill(sampler.pid, signal.SIGKILL)
+        time.sleep(0.2)
+        sampler.sample()
+        assert sampler.restarts == 1
+        wait_for_snapshot()
+    finally:
+        sampler.close()
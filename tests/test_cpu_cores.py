@@ -0,0 +1,27 @@
+import sys
+
+from PySide6.QtWidgets import QApplication
+
+from ui.widgets.cpu_cores_widget import COLOR_LUT, CoreHeatmap
+
+app = QApplication.instance() or QApplication(sys.argv)
+
+
+def test_color_lut_covers_every_percent():
+    assert len(COLOR_LUT) == 101
+    assert COLOR_LUT[0].green() > COLOR_LUT[0].red()
+    assert COLOR_LUT[100].red() > COLOR_LUT[100].green()
+
+
+def test_heatmap_repaints_only_when_levels_change():
+    heatmap = CoreHeatmap()
+    assert heatmap.set_loads((10.2, 99.9, 150.0, -1.0)) is True
+    assert heatmap.levels() == (10, 100, 100, 0)
+    assert heatmap.set_loads((10.4, 99.6, 100.0, 0.0)) is False
+
+
+def test_heatmap_paints_32_cores():
+    heatmap = CoreHeatmap()
+    heatmap.resize(320, 120)
+    heatmap.set_loads(tuple(float(i * 3) for i in range(32)))
+    assert not heatmap.grab().isNull()
@@ -0,0 +1,39 @@
+from collections import namedtuple
+
+from app.cpu_load import CpuLoadEngine
+
+Times = namedtuple("Times", "user system idle")
+
+
+def test_first_sample_measures_since_boot():
+    engine = CpuLoadEngine()
+    load = engine.update([Times(30.0, 10.0, 60.0)])
+    assert load.total == 40.0
+    assert load.per_core == (40.0,)
+
+
+def test_delta_between_samples_per_core_and_aggregate():
+    engine = CpuLoadEngine()
+    engine.update([Times(0.0, 0.0, 0.0), Times(0.0, 0.0, 0.0)])
+    load = engine.update([Times(1.0, 0.0, 1.0), Times(0.0, 0.0, 2.0)])
+    assert load.per_core == (50.0, 0.0)
+    assert load.total == 25.0
+
+
+def test_no_time_elapsed_reports_zero():
+    engine = CpuLoadEngine()
+    engine.update([Times(1.0, 1.0, 1.0)])
+    load = engine.update([Times(1.0, 1.0, 1.0)])
+    assert load.total == 0.0
+
+
+def test_core_count_change_resets_baseline():
+    engine = CpuLoadEngine()
+    engine.update([Times(5.0, 0.0, 5.0)])
+    load = engine.update([Times(5.0, 0.0, 5.0), Times(1.0, 0.0, 3.0)])
+    assert load.per_core == (50.0, 25.0)
+
+
+def test_sample_uses_reader():
+    engine = CpuLoadEngine(reader=lambda: [Times(2.0, 0.0, 2.0)])
+    assert engine.sample().total == 50.0
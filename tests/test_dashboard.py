@@ -0,0 +1,84 @@
+import gc
+import sys
+
+import pytest
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QApplication, QWidget
+
+from app.state import TodoItem
+from ui.dashboard import DashboardView
+from ui.registry import WIDGET_REGISTRY, WidgetSpec
+from ui.widgets import BreakReminderWidget, TodoListWidget
+from ui.widgets.countdown_widget import CountdownWidget
+
+app = QApplication.instance() or QApplication(sys.argv)
+
+LAYOUT = {"slot_1": "break_reminder", "slot_2": "metrics", "slot_3": "todo", "slot_4": "countdown"}
+
+
+@pytest.fixture(autouse=True)
+def _collect_views():
+    yield
+    # Views sit in reference cycles (bound-method slots); free them before the next test
+    gc.collect()
+
+
+def _slot_widgets(view):
+    # Looked up by indexOf: wrappers from QLayout.itemAt() crash the view's later garbage collection
+    layout = view._slots
+    children = layout.parentWidget().findChildren(QWidget, options=Qt.FindChildOption.FindDirectChildrenOnly)
+    return sorted((w for w in children if layout.indexOf(w) >= 0), key=layout.indexOf)
+
+
+def test_progressive_view_builds_cheapest_first_after_first_paint():
+    view = DashboardView(LAYOUT, progressive=True)
+    ready = []
+    view.ready.connect(lambda: ready.append(True))
+    # Metrics is built up front; the rest wait behind placeholders
+    assert view.pending == 3
+    assert view._metrics_tiles
+
+    view._build_next()
+    # Priority 0 types go before state.json readers, in slot order
+    assert isinstance(_slot_widgets(view)[2], TodoListWidget)
+    view._build_next()
+    assert isinstance(_slot_widgets(view)[3], CountdownWidget)
+    view._build_next()
+    assert isinstance(_slot_widgets(view)[0], BreakReminderWidget)
+    assert view.pending == 0 and ready == [True]
+    assert _slot_widgets(view)[0].minimumHeight() == 200
+
+
+def test_todos_set_before_the_widget_exists_are_handed_over():
+    view = DashboardView({"slot_1": "todo"}, progressive=True)
+    todos = [TodoItem(text="ship it")]
+    view.set_todos(todos)
+    assert [t.text for t in view.get_todos()] == ["ship it"]
+    view.build_all()
+    assert [t.text for t in view._todo_widget.get_items()] == ["ship it"]
+
+
+def test_shown_view_builds_on_the_event_loop():
+    view = DashboardView(LAYOUT, progressive=True)
+    view.resize(600, 1600)
+    view.show()
+    for _ in range(20):
+        app.processEvents()
+        if not view.pending:
+            break
+    assert view.pending == 0
+    view.close()
+
+
+def _broken_widget(parent=None):
+    raise RuntimeError("no sensors")
+
+
+def test_failing_widget_still_reports_ready(monkeypatch):
+    monkeypatch.setitem(WIDGET_REGISTRY, "countdown", WidgetSpec("countdown", "tests.test_dashboard:_broken_widget"))
+    view = DashboardView({"slot_1": "metrics", "slot_2": "countdown"}, progressive=True)
+    ready = []
+    view.ready.connect(lambda: ready.append(True))
+    view.build_all()
+    assert ready == [True]
+    assert view.pending == 0
@@ -0,0 +1,52 @@
+import sys
+
+from PySide6.QtWidgets import QApplication
+
+from app.sensors import SensorSnapshot
+from ui.widgets.fan_speed_widget import FanSpeedWidget
+
+app = QApplication.instance() or QApplication(sys.argv)
+
+
+def _snap(temps, fans=()):
+    return SensorSnapshot(timestamp=0.0, cpu_percent=12.5, temperatures=tuple(temps), fans=tuple(fans))
+
+
+def test_rows_are_reused_across_snapshots():
+    widget = FanSpeedWidget()
+    widget.update_data(_snap([("CPU", 35.0), ("GPU", 50.0)], [("fan1", 1200)]))
+    cpu_row = widget.temp_rows.row("CPU")
+    children = len(widget.findChildren(object))
+
+    for i in range(50):
+        widget.update_data(_snap([("CPU", 35.0 + i), ("GPU", 50.0)], [("fan1", 1200 + i)]))
+    app.processEvents()
+
+    assert widget.temp_rows.row("CPU") is cpu_row
+    assert cpu_row.value_label.text() == "84.0°C"
+    assert cpu_row.value_label.property("state") == "alert"
+    assert widget.fan_rows.row("fan1").value_label.text() == "1,249 RPM"
+    assert len(widget.findChildren(object)) == children
+
+
+def test_rows_follow_sensor_set_and_order():
+    widget = FanSpeedWidget()
+    widget.update_data(_snap([("CPU", 30.0), ("GPU", 45.0)]))
+    gpu_row = widget.temp_rows.row("GPU")
+
+    widget.update_data(_snap([("GPU", 65.0), ("NVMe", 41.0)]))
+    assert len(widget.temp_rows) == 2
+    assert widget.temp_rows.row("CPU") is None
+    assert widget.temp_rows.row("GPU") is gpu_row
+    assert widget.temps_container.indexOf(gpu_row.container) == 0
+    assert gpu_row.value_label.property("state") == "hot"
+    assert widget.temp_rows.row("NVMe").value_label.property("state") == "warm"
+
+
+def test_sensors_sharing_a_label_keep_their_own_rows():
+    widget = FanSpeedWidget()
+    widget.update_data(_snap([], [("nct6775", 1200), ("nct6775", 800), ("nct6775", 650)]))
+    assert len(widget.fan_rows) == 3
+    rows = [widget.fan_rows.row(key) for key in ("nct6775", "nct6775#2", "nct6775#3")]
+    assert [r.name_label.text() for r in rows] == ["nct6775"] * 3
+    assert [r.value_label.text() for r in rows] == ["1,200 RPM", "800 RPM", "650 RPM"]
@@ -0,0 +1,65 @@
+from pathlib import Path
+
+import pytest
+
+from app.gpu import GpuMonitor, GpuProvider, NvidiaSmiProvider, SysfsGpuProvider, probe_gpu_providers
+
+
+def _fake_card(root: Path, name: str, busy: str, hwmon_temp: str | None = None) -> Path:
+    device = root / "class" / "drm" / name / "device"
+    device.mkdir(parents=True)
+    (device / "gpu_busy_percent").write_text(busy)
+    (device / "mem_info_vram_used").write_text(str(512 * 1024**2))
+    (device / "mem_info_vram_total").write_text(str(8192 * 1024**2))
+    if hwmon_temp is not None:
+        hwmon = device / "hwmon" / "hwmon3"
+        hwmon.mkdir(parents=True)
+        (hwmon / "temp1_input").write_text(hwmon_temp)
+    return device
+
+
+def test_probe_finds_sysfs_card(tmp_path):
+    _fake_card(tmp_path, "card0", "37\n", hwmon_temp="55000\n")
+    providers = probe_gpu_providers(tmp_path, allow_commands=False)
+    assert len(providers) == 1
+    reading = providers[0].read()
+    assert reading.load_percent == 37.0
+    assert reading.vram_used_mb == 512.0
+    assert reading.vram_total_mb == 8192.0
+    assert reading.temp_c == 55.0
+
+
+def test_probe_skips_unreadable_card(tmp_path):
+    _fake_card(tmp_path, "card0", "garbage")
+    assert probe_gpu_providers(tmp_path, allow_commands=False) == []
+
+
+def test_monitor_without_providers_returns_none():
+    assert GpuMonitor(providers=[]).read() is None
+
+
+def test_monitor_falls_back_after_repeated_failures(tmp_path):
+    device = _fake_card(tmp_path, "card0", "10")
+
+    class Constant(GpuProvider):
+        def read(self):
+            return NvidiaSmiProvider.parse("80, 1, 2, 3")
+
+    monitor = GpuMonitor(providers=[SysfsGpuProvider(device), Constant()])
+    assert monitor.read().load_percent == 10.0
+    (device / "gpu_busy_percent").unlink()
+    for _ in range(GpuMonitor.MAX_FAILURES):
+        assert monitor.read() is None
+    assert monitor.read().load_percent == 80.0
+
+
+def test_nvidia_smi_output_parsing():
+    reading = NvidiaSmiProvider.parse("37, 1024, 8192, 61\n45, 0, 0, 40\n")
+    assert (reading.load_percent, reading.vram_used_mb, reading.vram_total_mb, reading.temp_c) == (37.0, 1024.0, 8192.0, 61.0)
+    assert NvidiaSmiProvider.parse("") is None
+    assert NvidiaSmiProvider.parse("[N/A], 1, 2, 3") is None
+
+
+def test_provider_base_is_abstract():
+    with pytest.raises(TypeError):
+        GpuProvider()
@@ -0,0 +1,50 @@
+from app.history import HistoryStore, MetricHistory
+
+
+def test_window_stats_over_recent_samples():
+    hist = MetricHistory()
+    for i in range(120):
+        hist.add(float(i), timestamp=1000.0 + i)
+    stats = hist.window_stats(10)
+    assert stats.minimum == 110.0
+    assert stats.maximum == 119.0
+    assert stats.count == 10
+    assert stats.mean == sum(range(110, 120)) / 10
+
+
+def test_ring_memory_is_bounded():
+    hist = MetricHistory(tiers=((1.0, 5.0),))
+    for i in range(1000):
+        hist.add(float(i), timestamp=float(i))
+    assert hist.values(1000) == [995.0, 996.0, 997.0, 998.0, 999.0]
+
+
+def test_coarse_tier_downsamples_incrementally():
+    hist = MetricHistory(tiers=((1.0, 10.0), (10.0, 100.0)))
+    for i in range(30):
+        hist.add(float(i), timestamp=float(i))
+    # 30 s window needs the 10 s tier: three buckets of ten samples
+    assert hist.values(30, now=29.5) == [4.5, 14.5, 24.5]
+    stats = hist.window_stats(30, now=29.5)
+    assert (stats.minimum, stats.maximum, stats.count) == (0.0, 29.0, 30)
+
+
+def test_samples_in_same_bucket_are_merged():
+    hist = MetricHistory(tiers=((1.0, 10.0),))
+    hist.add(2.0, timestamp=5.1)
+    hist.add(4.0, timestamp=5.6)
+    assert hist.values(10) == [3.0]
+    assert hist.latest == 4.0
+
+
+def test_empty_window_returns_none():
+    hist = MetricHistory()
+    assert hist.window_stats(60) is None
+    assert hist.values(60) == []
+
+
+def test_store_creates_series_on_first_use():
+    store = HistoryStore()
+    store.record("cpu", 10.0, timestamp=1.0)
+    assert store.names() == ["cpu"]
+    assert store.series("cpu").latest == 10.0
@@ -0,0 +1,98 @@
+from pathlib import Path
+
+import app.hwmon as hwmon
+from app.hwmon import HwmonReader, discover_sensors
+
+
+def _chip(root: Path, name: str, chip: str, temps=(), fans=()) -> Path:
+    d = root / name
+    d.mkdir(parents=True)
+    (d / "name").write_text(chip + "\n")
+    for i, (label, milli) in enumerate(temps, start=1):
+        (d / f"temp{i}_input").write_text(f"{milli}\n")
+        if label:
+            (d / f"temp{i}_label").write_text(label + "\n")
+    for i, rpm in enumerate(fans, start=1):
+        (d / f"fan{i}_input").write_text(f"{rpm}\n")
+    return d
+
+
+def test_discover_lists_temps_and_fans(tmp_path):
+    _chip(tmp_path, "hwmon0", "k10temp", temps=[("Tctl", 45000), ("Tccd1", 41000)])
+    _chip(tmp_path, "hwmon1", "nct6775", fans=[1200, 0])
+    sensors = discover_sensors(tmp_path)
+    assert [(s.kind, s.label) for s in sensors] == [
+        ("temp", "Tctl"), ("temp", "Tccd1"), ("fan", "nct6775 fan1"), ("fan", "nct6775 fan2"),
+    ]
+
+
+def test_chips_sharing_a_name_are_told_apart(tmp_path):
+    _chip(tmp_path, "hwmon1", "nvme", temps=[("Composite", 38000)])
+    _chip(tmp_path, "hwmon2", "nvme", temps=[("", 41000)])
+    sensors = discover_sensors(tmp_path)
+    assert [(s.chip, s.label) for s in sensors] == [
+        ("nvme hwmon1", "Composite"), ("nvme hwmon2", "nvme hwmon2 temp1"),
+    ]
+
+
+def test_reader_uses_default_selection(tmp_path):
+    _chip(tmp_path, "hwmon0", "k10temp", temps=[("Tctl", 45500), ("Tccd1", 41000)])
+    _chip(tmp_path, "hwmon1", "nvme", temps=[("", 38000)], fans=[900])
+    reader = HwmonReader(tmp_path)
+    readings = reader.read()
+    assert readings.temperatures == (("Tctl", 45.5), ("nvme temp1", 38.0))
+    assert readings.fans == (("nvme fan1", 900.0),)
+    reader.close()
+
+
+def test_reader_rereads_open_files(tmp_path):
+    chip = _chip(tmp_path, "hwmon0", "k10temp", temps=[("Tctl", 45000)])
+    reader = HwmonReader(tmp_path)
+    reader.read()
+    (chip / "temp1_input").write_text("61000\n")
+    assert reader.read().temperatures == (("Tctl", 61.0),)
+    reader.close()
+
+
+def test_reader_rescans_on_hotplug(tmp_path):
+    _chip(tmp_path, "hwmon0", "k10temp", temps=[("Tctl", 45000)])
+    reader = HwmonReader(tmp_path)
+    assert len(reader.read().temperatures) == 1
+    _chip(tmp_path, "hwmon1", "amdgpu", temps=[("edge", 50000)])
+    assert reader.read().temperatures == (("Tctl", 45.0), ("edge", 50.0))
+    reader.close()
+
+
+def test_patterns_replace_default_selection(tmp_path):
+    _chip(tmp_path, "hwmon0", "k10temp", temps=[("Tctl", 45000), ("Tccd1", 41000)])
+    reader = HwmonReader(tmp_path, patterns=["k10temp/Tccd*"])
+    assert reader.read().temperatures == (("Tccd1", 41.0),)
+    reader.close()
+
+
+def test_missing_root_is_unavailable(tmp_path):
+    reader = HwmonReader(tmp_path / "nope")
+    assert not reader.available()
+    assert reader.read().temperatures == ()
+
+
+def test_failing_sensor_backs_off_without_rescanning(tmp_path, monkeypatch):
+    chip = _chip(tmp_path, "hwmon0", "nct6775", temps=[("SYSTIN", 30000)], fans=[1200])
+    (chip / "temp1_input").write_text("N/A\n")
+    scans = []
+    discover = hwmon.discover_sensors
+    monkeypatch.setattr(hwmon, "discover_sensors", lambda root: scans.append(root) or discover(root))
+    reader = HwmonReader(tmp_path, patterns=["*"])
+
+    reads = [reader.read() for _ in range(10)]
+    assert len(scans) == 1
+    assert all(r.fans == (("nct6775 fan1", 1200.0),) for r in reads)
+    # Tried on reads 1, 3 and 6, then skipped for the next 4
+    assert reader._backoff[0] == (0, 4)
+
+    (chip / "temp1_input").write_text("31000\n")
+    while not reader.read().temperatures:
+        pass
+    assert 0 not in reader._backoff
+    assert len(scans) == 1
+    reader.close()
@@ -0,0 +1,94 @@
+import sys
+from collections import namedtuple
+
+import pytest
+
+from app.config import DEFAULT_IO_FILTERS, _normalise_io_filters
+from app.io_rates import DEFAULT_DISK_EXCLUDE, DEFAULT_NIC_EXCLUDE, IoRateSampler, _selected, format_rate
+
+Net = namedtuple("Net", "bytes_sent bytes_recv")
+Disk = namedtuple("Disk", "read_bytes write_bytes")
+
+
+def _sampler(net, disk, **kwargs):
+    return IoRateSampler(net_reader=lambda: net, disk_reader=lambda: disk, **kwargs)
+
+
+def test_first_sample_has_no_rates():
+    rates = _sampler({"eth0": Net(0, 0)}, {"sda": Disk(0, 0)}).sample(ts=0.0)
+    assert rates.net == () and rates.disk == ()
+
+
+def test_rates_are_deltas_over_elapsed_time():
+    net = {"eth0": Net(bytes_sent=0, bytes_recv=0), "lo": Net(0, 0)}
+    disk = {"sda": Disk(0, 0), "loop0": Disk(0, 0)}
+    sampler = _sampler(net, disk)
+    sampler.sample(ts=10.0)
+    net["eth0"] = Net(bytes_sent=1000, bytes_recv=4000)
+    net["lo"] = Net(99999, 99999)
+    disk["sda"] = Disk(read_bytes=2048, write_bytes=0)
+    rates = sampler.sample(ts=12.0)
+    assert [d.name for d in rates.net] == ["eth0"]
+    assert (rates.net_rx_bps, rates.net_tx_bps) == (2000.0, 500.0)
+    assert [d.name for d in rates.disk] == ["sda"]
+    assert rates.disk_read_bps == 1024.0
+
+
+def test_include_filter_and_interface_changes():
+    net = {"eth0": Net(0, 0), "wlan0": Net(0, 0)}
+    sampler = _sampler(net, {}, nic_include=("wlan*",))
+    sampler.sample(ts=0.0)
+    net["wlan1"] = Net(0, 0)
+    net["wlan0"] = Net(0, 100)
+    rates = sampler.sample(ts=1.0)
+    # wlan1 appeared this tick, so it has no baseline yet
+    assert [d.name for d in rates.net] == ["wlan0"]
+    rates = sampler.sample(ts=2.0)
+    assert [d.name for d in rates.net] == ["wlan0", "wlan1"]
+
+
+def test_config_filters_reach_the_sampler():
+    assert tuple(DEFAULT_IO_FILTERS["net_exclude"]) == DEFAULT_NIC_EXCLUDE
+    assert tuple(DEFAULT_IO_FILTERS["disk_exclude"]) == DEFAULT_DISK_EXCLUDE
+    filters = _normalise_io_filters({"net_include": ["eth*", 3], "disk_exclude": "sda", "bogus": ["x"]})
+    assert filters == {**DEFAULT_IO_FILTERS, "net_include": ["eth*"]}
+
+    net = {"eth0": Net(0, 0), "wlan0": Net(0, 0), "lo": Net(0, 0)}
+    disk = {"sda": Disk(0, 0), "sdb": Disk(0, 0)}
+    filters["disk_exclude"] = ["sdb"]
+    sampler = IoRateSampler.from_filters(filters, net_reader=lambda: net, disk_reader=lambda: disk)
+    sampler.sample(ts=0.0)
+    rates = sampler.sample(ts=1.0)
+    assert [d.name for d in rates.net] == ["eth0"]
+    assert [d.name for d in rates.disk] == ["sda"]
+
+
+def test_counter_reset_reports_zero():
+    net = {"eth0": Net(500, 500)}
+    sampler = _sampler(net, {})
+    sampler.sample(ts=0.0)
+    net["eth0"] = Net(10, 10)
+    assert sampler.sample(ts=1.0).net_rx_bps == 0.0
+
+
+def test_format_rate():
+    assert format_rate(512) == "512 B/s"
+    assert format_rate(1536) == "1.5 KB/s"
+    assert format_rate(5 * 1024**2) == "5.0 MB/s"
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="partitions are only listed on Linux")
+def test_partitions_are_not_double_counted():
+    disk = {"sda": Disk(0, 0), "sda1": Disk(0, 0), "nvme0n1": Disk(0, 0), "nvme0n1p1": Disk(0, 0)}
+    sampler = _sampler({}, disk)
+    sampler.sample(ts=0.0)
+    rates = sampler.sample(ts=1.0)
+    assert [d.name for d in rates.disk] == ["nvme0n1", "sda"]
+
+
+def test_whole_disks_sharing_a_prefix_are_kept():
+    names = ["dm-1", "dm-10", "sda", "sda1", "sdaa", "sdaa2", "nvme0n1", "nvme0n1p1",
+             "mmcblk0", "mmcblk0p1", "PhysicalDrive1", "PhysicalDrive10"]
+    assert _selected(names, (), (), skip_partitions=True) == (
+        "PhysicalDrive1", "PhysicalDrive10", "dm-1", "dm-10", "mmcblk0", "nvme0n1", "sda", "sdaa",
+    )
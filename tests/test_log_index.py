@@ -0,0 +1,102 @@
+import sys
+
+from PySide6.QtWidgets import QApplication
+
+from app.logger import ERROR, INFO, WARNING, LogRecord
+from ui.log_index import LogFilter, LogIndex, parse_filter
+from ui.log_model import LogFilterModel, LogRingModel
+from ui.panels import LogsPanel
+
+app = QApplication.instance() or QApplication(sys.argv)
+
+
+def _rec(i, source="ui", level=INFO, message=None):
+    return LogRecord(1000.0 + i, level, source, message or f"line {i}")
+
+
+def _messages(model):
+    return [model.entry(row).message for row in range(model.rowCount())]
+
+
+def test_parse_filter_tokens():
+    flt = parse_filter("source:collector level:warn  Disk FULL")
+    assert flt == LogFilter("disk full", frozenset({"collector"}), WARNING)
+    assert parse_filter("src:ui level:e").min_level == ERROR
+    assert parse_filter("level:bogus").text == "level:bogus"
+    assert parse_filter("   ").empty
+    assert parse_filter("disk full").narrows(parse_filter("disk"))
+    assert not parse_filter("disk").narrows(parse_filter("disk full"))
+    assert parse_filter("source:ui disk").narrows(parse_filter("disk"))
+
+
+def test_index_search_and_eviction():
+    index = LogIndex()
+    index.add(0, _rec(0, "ui", INFO, "fan spun up"))
+    index.add(1, _rec(1, "collector", WARNING, "sensor restart"))
+    index.add(2, _rec(2, "ui", ERROR, "fan stalled"))
+    assert index.search(parse_filter("fan")) == [0, 2]
+    assert index.search(parse_filter("source:collector")) == [1]
+    assert index.search(parse_filter("level:warn")) == [1, 2]
+    assert index.search(parse_filter("no such words")) == []
+
+    index.evict(0)
+    assert len(index) == 2
+    assert index.search(parse_filter("spun")) == []
+    assert "spu" not in index._grams
+    assert list(index._sources["ui"]) == [2]
+
+
+def test_level_postings_answer_level_filters():
+    index = LogIndex()
+    for i in range(6):
+        index.add(i, _rec(i, "ui", (INFO, WARNING, ERROR)[i % 3]))
+    index.add_older([(-1, _rec(-1, "ui", ERROR, "disk x"))])
+    assert index.search(parse_filter("level:error")) == [-1, 2, 5]
+    assert index.search(parse_filter("level:warn")) == [-1, 1, 2, 4, 5]
+    assert index.search(parse_filter("level:warn line 4")) == [4]
+    assert index.search(parse_filter("level:error x")) == [-1]
+
+    index.evict(-1)
+    index.evict(0)
+    assert list(index._levels[ERROR]) == [2, 5]
+    assert index.search(parse_filter("level:warn")) == [1, 2, 4, 5]
+
+
+def test_filter_model_follows_appends_and_evictions():
+    model = LogRingModel(max_lines=10)
+    filtered = LogFilterModel(model)
+    filtered.set_filter(parse_filter("source:alert"))
+    model.extend([_rec(i, "alert" if i % 2 else "ui") for i in range(8)])
+    model.flush()
+    assert _messages(filtered) == ["line 1", "line 3", "line 5", "line 7"]
+
+    # Four more lines push 0..1 out of the ring
+    model.extend([_rec(i, "alert" if i % 2 else "ui") for i in range(8, 12)])
+    model.flush()
+    assert _messages(filtered) == ["line 3", "line 5", "line 7", "line 9", "line 11"]
+    assert len(model.search_index) == 10
+
+    # Narrowing re-checks the current matches only
+    filtered.set_filter(parse_filter("source:alert line 1"))
+    assert _messages(filtered) == ["line 11"]
+
+
+def test_filter_model_sees_history_pages():
+    model = LogRingModel(max_lines=10)
+    filtered = LogFilterModel(model)
+    model.extend([_rec(i) for i in range(5, 8)])
+    model.flush()
+    filtered.set_filter(parse_filter("line"))
+    model.prepend([_rec(i) for i in range(5)])
+    assert _messages(filtered) == [f"line {i}" for i in range(8)]
+
+
+def test_panel_swaps_to_filtered_view():
+    panel = LogsPanel(max_lines=100)
+    panel.append_records([_rec(0, "ui"), _rec(1, "collector", WARNING, "restart")])
+    panel.model.flush()
+    panel.filter_input.setText("level:warn")
+    assert panel.text.model() is panel.filtered
+    assert _messages(panel.filtered) == ["restart"]
+    panel.filter_input.clear()
+    assert panel.text.model() is panel.model
@@ -0,0 +1,78 @@
+import sys
+import time
+
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QApplication
+
+from ui.log_model import LogRingModel
+from ui.panels import LogsPanel
+
+app = QApplication.instance() or QApplication(sys.argv)
+
+
+def _rows(model):
+    return [model.data(model.index(i), Qt.ItemDataRole.DisplayRole) for i in range(model.rowCount())]
+
+
+def test_burst_is_one_insert_notification():
+    model = LogRingModel(max_lines=100)
+    inserts, flushes = [], []
+    model.rowsInserted.connect(lambda _p, first, last: inserts.append((first, last)))
+    model.flushed.connect(flushes.append)
+    for i in range(40):
+        model.append(f"line {i}")
+    assert model.rowCount() == 0 and model.pending == 40
+    model.flush()
+    assert inserts == [(0, 39)]
+    assert flushes == [40]
+    assert _rows(model)[-1] == "line 39"
+
+
+def test_ring_evicts_oldest_in_one_removal():
+    model = LogRingModel(max_lines=10)
+    removes = []
+    model.rowsRemoved.connect(lambda _p, first, last: removes.append((first, last)))
+    model.extend([f"a{i}" for i in range(8)])
+    model.flush()
+    model.extend([f"b{i}" for i in range(5)])
+    model.flush()
+    assert removes == [(0, 2)]
+    assert _rows(model) == [f"a{i}" for i in range(3, 8)] + [f"b{i}" for i in range(5)]
+    assert model.first_seq == 3
+
+    # A batch larger than the cap keeps only its newest lines
+    model.extend([f"c{i}" for i in range(25)])
+    model.flush()
+    assert _rows(model) == [f"c{i}" for i in range(15, 25)]
+    assert model.first_seq == 28
+
+
+def test_flush_happens_on_the_event_loop():
+    model = LogRingModel(max_lines=10)
+    model.append("hello")
+    for _ in range(50):
+        app.processEvents()
+        if not model.pending:
+            break
+        time.sleep(0.005)
+    assert _rows(model) == ["hello"]
+
+
+def test_panel_follows_tail_only_when_at_bottom():
+    panel = LogsPanel(max_lines=1000)
+    panel.resize(300, 200)
+    panel.show()
+    app.processEvents()
+    for i in range(200):
+        panel.append_line(f"tick {i}")
+    panel.model.flush()
+    app.processEvents()
+    bar = panel.text.verticalScrollBar()
+    assert bar.value() == bar.maximum() > 0
+
+    bar.setValue(0)
+    panel.append_line("more")
+    panel.model.flush()
+    app.processEvents()
+    assert bar.value() == 0
+    panel.close()
@@ -0,0 +1,159 @@
+import sys
+
+from PySide6.QtWidgets import QApplication
+
+from app.log_store import LogStore, Segment, decode_record, encode_record
+from app.logger import INFO, WARNING, LogRecord
+from ui.panels import LogsPanel
+
+app = QApplication.instance() or QApplication(sys.argv)
+
+
+def _reopen(path, **kwargs):
+    # A store caches the live file; files written behind its back need a fresh one
+    store = LogStore(path, **kwargs)
+    store.close()
+    return store
+
+
+def _records(start, n, step=1.0, source="test"):
+    return [LogRecord(start + i * step, INFO, source, f"line {i}") for i in range(n)]
+
+
+def test_record_round_trip_escapes_separators():
+    rec = LogRecord(1700000000.125, WARNING, "ui\tx", "multi\nline \\ with\ttabs")
+    assert decode_record(encode_record(rec)) == rec
+    assert decode_record("torn line") is None
+
+
+def test_rotation_compresses_and_range_query_reads_few_blocks(tmp_path, monkeypatch):
+    store = LogStore(tmp_path, max_bytes=10**9, block_records=100)
+    store.write(_records(1000.0, 1000))
+    store.close()
+    store.rotate()
+    (tmp_path / "current.log").write_text("".join(map(encode_record, _records(3000.0, 10))))
+    store = _reopen(tmp_path)
+
+    (seg,) = store.segments()
+    assert seg.first_ts == 1000.0 and seg.last_ts == 1999.0
+    assert len(seg.blocks) == 10
+    assert seg.path.stat().st_size < 1000 * 20
+
+    reads = []
+    original = Segment.read_block
+    monkeypatch.setattr(Segment, "read_block", lambda self, i: reads.append(i) or original(self, i))
+    hits = store.query(1450.0, 1460.0)
+    assert [r.message for r in hits] == [f"line {i}" for i in range(450, 461)]
+    assert reads == [4]
+
+    # Spans the compressed segment and the live file
+    assert [r.timestamp for r in store.query(1998.0, 3001.0)] == [1998.0, 1999.0, 3000.0, 3001.0]
+
+
+def test_before_pages_backwards_across_segments(tmp_path):
+    store = LogStore(tmp_path, max_bytes=10**9, block_records=50)
+    store.close()
+    for start in (0.0, 500.0):
+        (tmp_path / "current.log").write_text("".join(map(encode_record, _records(start, 200))))
+        store.rotate()
+    (tmp_path / "current.log").write_text("".join(map(encode_record, _records(900.0, 5))))
+    store = _reopen(tmp_path)
+
+    page = store.before(901.5, 10)
+    assert [r.timestamp for r in page] == [float(t) for t in range(692, 700)] + [900.0, 901.0]
+    # The position is inclusive; skip leaves out the records already shown
+    assert [r.timestamp for r in store.before(500.0, 3)] == [198.0, 199.0, 500.0]
+    older = store.before(500.0, 3, skip=1)
+    assert [r.timestamp for r in older] == [197.0, 198.0, 199.0]
+    assert store.before(0.0, 5, skip=1) == []
+
+
+def test_missing_or_damaged_segments_are_skipped(tmp_path):
+    store = LogStore(tmp_path, max_bytes=10**9, block_records=50)
+    store.close()
+    for start in (0.0, 500.0):
+        (tmp_path / "current.log").write_text("".join(map(encode_record, _records(start, 100))))
+        store.rotate()
+    old, new = store.segments()
+    # Pruned while a reader still holds it, and a truncated file
+    old.path.unlink()
+    new.path.write_bytes(new.path.read_bytes()[:new.blocks[1][1] + 10])
+
+    page = store.before(600.0, 200)
+    assert [r.timestamp for r in page] == [500.0 + i for i in range(50)]
+    assert store.query(0.0, 600.0) == page
+
+
+def test_old_segments_are_pruned(tmp_path):
+    store = LogStore(tmp_path, max_bytes=10**9, max_segments=2)
+    store.close()
+    for start in (0.0, 100.0, 200.0):
+        (tmp_path / "current.log").write_text("".join(map(encode_record, _records(start, 5))))
+        store.rotate()
+    assert [s.first_ts for s in store.segments()] == [100.0, 200.0]
+    assert len(list(tmp_path.glob("*.lgz"))) == 2
+
+
+def test_panel_pages_history_in_on_demand(tmp_path):
+    (tmp_path / "current.log").write_text("".join(map(encode_record, _records(1000.0, 500))))
+    store = _reopen(tmp_path)
+
+    panel = LogsPanel(max_lines=450)
+    panel.resize(300, 200)
+    panel.show()
+    panel.set_history(store.before)
+    app.processEvents()
+    assert panel.model.rowCount() == 200
+    assert panel.model.entry(199).message == "line 499"
+
+    panel.text.verticalScrollBar().setValue(0)
+    assert panel.model.rowCount() == 400
+    assert panel.model.entry(0).message == "line 100"
+    # Only the room left in the ring is used
+    assert panel.load_older() == 50
+    assert panel.load_older() == 0
+    panel.close()
+
+
+def test_paging_does_not_skip_records_sharing_a_millisecond(tmp_path):
+    store = LogStore(tmp_path, max_bytes=10**9, block_records=50)
+    store.close()
+    # 300 records in groups of 70 per millisecond, half of them compressed
+    records = [LogRecord(1000.0 + (i // 70) / 1000, INFO, "test", f"line {i}") for i in range(300)]
+    (tmp_path / "current.log").write_text("".join(map(encode_record, records[:150])))
+    store.rotate()
+    (tmp_path / "current.log").write_text("".join(map(encode_record, records[150:])))
+    store = _reopen(tmp_path)
+
+    panel = LogsPanel(max_lines=1000)
+    panel.set_history(store.before)
+    while panel.load_older():
+        pass
+    assert [e.message for e in panel.model.entries()] == [f"line {i}" for i in range(300)]
+
+
+def test_live_segment_is_cached(tmp_path, monkeypatch):
+    store = LogStore(tmp_path, max_bytes=10**9)
+    assert store.before(2000.0, 100) == []
+    # The writer keeps the loaded cache current
+    store.write(_records(1000.0, 5))
+    store.close()
+
+    reads = []
+    original = type(tmp_path).read_text
+    monkeypatch.setattr(type(tmp_path), "read_text", lambda self, *a, **k: reads.append(self) or original(self, *a, **k))
+    monkeypatch.setattr(type(tmp_path), "glob", lambda self, pattern: reads.append(pattern) or iter(()))
+    for _ in range(3):
+        assert [r.message for r in store.before(2000.0, 2)] == ["line 3", "line 4"]
+    assert reads == []
+
+
+def test_write_failure_disables_the_store(tmp_path, capsys):
+    blocker = tmp_path / "not_a_dir"
+    blocker.write_text("")
+    store = LogStore(blocker)
+    store._thread.join(2.0)
+    assert store.disabled
+    assert "Log file disabled" in capsys.readouterr().err
+    store.write(_records(0.0, 10))
+    assert store._queue.empty()
@@ -0,0 +1,83 @@
+import sys
+import threading
+
+from PySide6.QtWidgets import QApplication
+
+from app.log_store import LogStore
+from app.logger import DEBUG, ERROR, INFO, WARNING, AppLogger, LogRecord, _RateLimiter
+
+app = QApplication.instance() or QApplication(sys.argv)
+
+
+def test_records_from_worker_threads_arrive_in_one_batch():
+    logger = AppLogger()
+    logger.console_level = ERROR + 1
+    batches = []
+    logger.batch.connect(batches.append)
+
+    def worker(n):
+        for i in range(50):
+            logger.info(f"worker{n}", f"line {i}")
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    logger.drain()
+    assert len(batches) == 1
+    assert len(batches[0]) == 200
+    assert logger.drain() == []
+
+
+def test_level_threshold_and_formatting():
+    logger = AppLogger()
+    logger.console_level = ERROR + 1
+    logger.debug("ui", "hidden")
+    logger.warning("alert", "hot")
+    logger.level = DEBUG
+    logger.debug("ui", "shown")
+    shown = logger.drain()
+    assert [r.message for r in shown] == ["hot", "shown"]
+    assert str(shown[0]).endswith(" WARN [alert] hot")
+    assert str(LogRecord(0.0, INFO, "ui", "tick")).endswith(" [ui] tick")
+
+
+def test_noisy_source_is_rate_limited_without_starving_others():
+    limiter = _RateLimiter(rate=10, burst=5)
+    noisy = [LogRecord(100.0 + i * 0.001, INFO, "noisy", str(i)) for i in range(50)]
+    quiet = [LogRecord(100.02, INFO, "quiet", "hello")]
+    out = limiter.filter(noisy + quiet)
+    assert [r.source for r in out].count("noisy") == 5
+    assert out[-1].message == "hello"
+    assert limiter.suppressed == {"noisy": 45}
+
+    # A second later the bucket has refilled; the gap is reported once
+    out = limiter.filter([LogRecord(101.1, INFO, "noisy", "back")])
+    assert [r.message for r in out] == ["45 lines suppressed (rate limit)", "back"]
+    assert out[0].level == WARNING
+    assert limiter.suppressed == {}
+
+
+def test_close_drains_to_file(tmp_path):
+    logger = AppLogger()
+    logger.console_level = ERROR + 1
+    store = LogStore(tmp_path)
+    logger.start(file_sink=store)
+    logger.error("ui", "boom")
+    logger.close()
+    assert logger.file_sink is None
+    assert [(r.level, r.message) for r in store.query(0, 1e12)] == [(ERROR, "boom")]
+
+
+def test_undrained_queue_is_bounded_and_reports_drops():
+    logger = AppLogger(queue_max=100)
+    logger.console_level = ERROR + 1
+    for i in range(250):
+        logger.info("worker", f"line {i}")
+    assert len(logger._queue) == 100
+    shown = logger.drain()
+    assert shown[0].message == "150 records dropped (queue full)"
+    assert shown[0].level == WARNING
+    assert shown[-1].message == "line 249"
+    assert logger.drain() == []
@@ -0,0 +1,79 @@
+from types import SimpleNamespace
+
+from app.processes import ProcessTable
+
+
+class FakeProc:
+    created = 0
+
+    def __init__(self, pid, name):
+        FakeProc.created += 1
+        self.pid = pid
+        self.name = name
+        self.cpu = 0.0
+        self.rss = 0
+
+    @property
+    def info(self):
+        return {
+            "name": self.name,
+            "cpu_times": SimpleNamespace(user=self.cpu, system=0.0),
+            "memory_info": SimpleNamespace(rss=self.rss),
+        }
+
+
+def test_cpu_percent_from_cached_baseline():
+    a, b = FakeProc(1, "a"), FakeProc(2, "b")
+    procs = [a, b]
+    table = ProcessTable(top_n=2, iterator=lambda: procs)
+
+    first = table.sample(ts=0.0)
+    assert all(p.cpu_percent == 0.0 for p in first.by_cpu)
+
+    a.cpu, b.cpu = 0.5, 2.0
+    a.rss, b.rss = 300, 100
+    top = table.sample(ts=1.0)
+    assert [(p.name, p.cpu_percent) for p in top.by_cpu] == [("b", 200.0), ("a", 50.0)]
+    assert [p.pid for p in top.by_rss] == [1, 2]
+
+
+def test_dead_pids_evicted_and_new_ones_start_at_zero():
+    a = FakeProc(1, "a")
+    procs = [a]
+    table = ProcessTable(iterator=lambda: procs)
+    table.sample(ts=0.0)
+
+    c = FakeProc(3, "c")
+    c.cpu = 100.0  # long-running process seen for the first time
+    procs[:] = [c]
+    top = table.sample(ts=1.0)
+    assert len(table) == 1
+    assert top.by_cpu[0].cpu_percent == 0.0
+
+
+def test_reused_pid_gets_new_baseline():
+    old = FakeProc(7, "old")
+    old.cpu = 50.0
+    procs = [old]
+    table = ProcessTable(iterator=lambda: procs)
+    table.sample(ts=0.0)
+
+    new = FakeProc(7, "new")
+    new.cpu = 1.0
+    procs[:] = [new]
+    top = table.sample(ts=1.0)
+    assert top.by_cpu[0].name == "new" and top.by_cpu[0].cpu_percent == 0.0
+
+
+def test_unreadable_processes_skipped():
+    ghost = SimpleNamespace(pid=9, info={"name": "x", "cpu_times": None, "memory_info": None})
+    table = ProcessTable(iterator=lambda: [ghost])
+    assert table.sample(ts=0.0).by_cpu == ()
+    assert len(table) == 0
+
+
+def test_live_psutil_scan():
+    table = ProcessTable(top_n=3)
+    table.sample()
+    top = table.sample()
+    assert 0 < len(top.by_rss) <= 3
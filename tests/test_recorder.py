@@ -0,0 +1,98 @@
+import math
+
+import pytest
+
+from app.recorder import MetricsReader, MetricsWriter, SnapshotRecorder, read_range, snapshot_channels
+from app.sensors import SensorSnapshot
+
+
+def test_write_then_read_range(tmp_path):
+    path = tmp_path / "m.bin"
+    writer = MetricsWriter(path, ["cpu", "ram"])
+    for i in range(100):
+        writer.append(1000.0 + i, [float(i), 8.0])
+    writer.close()
+
+    with MetricsReader(path) as reader:
+        assert reader.channels == ("cpu", "ram")
+        assert len(reader) == 100
+        rows = list(reader.range(1010.0, 1013.0))
+        assert [ts for ts, _ in rows] == [1010.0, 1011.0, 1012.0]
+        assert rows[0][1] == (10.0, 8.0)
+        ts, values = reader.series("cpu", 1095.0, 2000.0)
+        assert list(values) == [95.0, 96.0, 97.0, 98.0, 99.0]
+
+
+def test_reopen_appends_and_drops_torn_record(tmp_path):
+    path = tmp_path / "m.bin"
+    writer = MetricsWriter(path, ["cpu"])
+    writer.append(1.0, [1.0])
+    writer.close()
+    with open(path, "ab") as f:
+        f.write(b"\x01\x02\x03")  # torn write from a crash
+
+    writer = MetricsWriter(path, ["cpu"])
+    writer.append(2.0, [2.0])
+    writer.close()
+    with MetricsReader(path) as reader:
+        assert [ts for ts, _ in reader.range(0.0, 10.0)] == [1.0, 2.0]
+
+
+def test_reopen_with_other_channels_is_rejected(tmp_path):
+    path = tmp_path / "m.bin"
+    MetricsWriter(path, ["cpu"]).close()
+    with pytest.raises(ValueError):
+        MetricsWriter(path, ["cpu", "gpu"])
+
+
+def test_snapshot_channels_marks_missing_gpu_as_nan():
+    snap = SensorSnapshot(timestamp=0.0, cpu_percent=5.0, ram_used_gb=3.0,
+                          temperatures=(("Tctl", 50.0),), fans=(("cpu_fan", 900.0),))
+    names, values = snapshot_channels(snap)
+    assert names == ("cpu", "gpu", "ram", "temp:Tctl", "fan:cpu_fan")
+    assert math.isnan(values[1])
+
+
+def test_repeated_sensor_labels_get_their_own_channels(tmp_path):
+    fans = (("nct6775", 1200.0), ("nct6775", 800.0), ("nct6775", 650.0))
+    snap = SensorSnapshot(timestamp=1_800_000_000.0, cpu_percent=1.0, fans=fans)
+    names, values = snapshot_channels(snap)
+    assert names[3:] == ("fan:nct6775", "fan:nct6775#2", "fan:nct6775#3")
+
+    recorder = SnapshotRecorder(tmp_path, flush_every=1)
+    recorder.record(snap)
+    recorder.close()
+    _, rpm = read_range("fan:nct6775#3", snap.timestamp, snap.timestamp + 1, directory=tmp_path)
+    assert list(rpm) == [650.0]
+
+
+def test_recorder_starts_new_file_when_channels_change(tmp_path):
+    recorder = SnapshotRecorder(tmp_path, flush_every=1)
+    ts = 1_800_000_000.0
+    recorder.record(SensorSnapshot(timestamp=ts, cpu_percent=1.0))
+    first = recorder.path
+    recorder.record(SensorSnapshot(timestamp=ts + 1, cpu_percent=2.0, fans=(("fan1", 800.0),)))
+    assert recorder.path != first
+    recorder.close()
+
+    ts_out, cpu = read_range("cpu", ts, ts + 10, directory=tmp_path)
+    assert list(cpu) == [1.0, 2.0]
+
+
+def test_flaky_sensor_keeps_one_file(tmp_path, monkeypatch):
+    recorder = SnapshotRecorder(tmp_path, flush_every=1)
+    prunes = []
+    monkeypatch.setattr(recorder, "_prune", lambda: prunes.append(1))
+    ts = 1_800_000_000.0
+    fans = (("fan1", 800.0),)
+    recorder.record(SensorSnapshot(timestamp=ts, cpu_percent=1.0, fans=fans))
+    first = recorder.path
+    for i in range(1, 6):
+        # The fan read fails on every other tick
+        recorder.record(SensorSnapshot(timestamp=ts + i, cpu_percent=1.0, fans=fans if i % 2 == 0 else ()))
+    assert recorder.path == first
+    assert prunes == [1]
+    recorder.close()
+
+    _, rpm = read_range("fan:fan1", ts, ts + 10, directory=tmp_path)
+    assert [math.isnan(v) for v in rpm] == [False, True, False, True, False, True]
@@ -0,0 +1,49 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from app.config import WIDGET_TYPES
+from ui.registry import WIDGET_REGISTRY, get_spec, widget_types
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def test_registry_matches_config_widget_types():
+    assert WIDGET_TYPES == widget_types()
+    assert "blank" in WIDGET_TYPES and "top_processes" in WIDGET_TYPES
+    assert get_spec("focus_timer").min_height == 320
+    assert get_spec("nope") is None
+
+
+def test_config_does_not_import_ui():
+    script = "import sys, app.config; print(sorted(m for m in sys.modules if m.split('.')[0] == 'ui'))"
+    env = dict(os.environ, PYTHONPATH=str(ROOT))
+    out = subprocess.run([sys.executable, "-c", script], cwd=ROOT, env=env,
+                         capture_output=True, text=True, timeout=60)
+    assert out.returncode == 0, out.stderr
+    assert out.stdout.strip() == "[]"
+
+
+def test_every_factory_resolves():
+    for spec in WIDGET_REGISTRY.values():
+        if spec.target is not None:
+            assert callable(spec.load()), spec.name
+
+
+def test_dashboard_imports_only_widgets_in_layout():
+    # Fresh interpreter so earlier tests' imports don't count
+    script = (
+        "import sys\n"
+        "from PySide6.QtWidgets import QApplication\n"
+        "app = QApplication(sys.argv)\n"
+        "from ui.dashboard import DashboardView\n"
+        "view = DashboardView({'slot_1': 'metrics', 'slot_2': 'countdown', 'slot_3': 'nope'})\n"
+        "loaded = {m.rsplit('.', 1)[-1] for m in sys.modules if m.startswith('ui.widgets.')}\n"
+        "print(sorted(loaded))\n"
+    )
+    env = dict(os.environ, QT_QPA_PLATFORM="offscreen", PYTHONPATH=str(ROOT))
+    out = subprocess.run([sys.executable, "-c", script], cwd=ROOT, env=env,
+                         capture_output=True, text=True, timeout=60)
+    assert out.returncode == 0, out.stderr
+    assert out.stdout.strip() == "['countdown_widget']"
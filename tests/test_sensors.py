@@ -0,0 +1,20 @@
+import dataclasses
+
+import pytest
+
+from app.sensors import SensorSampler, SensorSnapshot
+
+
+def test_sampler_returns_snapshot():
+    snap = SensorSampler().sample()
+    assert isinstance(snap, SensorSnapshot)
+    assert 0.0 <= snap.cpu_percent <= 100.0
+    assert 0.0 <= snap.ram_percent <= 100.0
+    assert len(snap.cpu_per_core) >= 1
+    assert isinstance(snap.temperatures, tuple)
+
+
+def test_snapshot_is_immutable():
+    snap = SensorSnapshot(timestamp=0.0, cpu_percent=12.5)
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        snap.cpu_percent = 50.0  # type: ignore[misc]
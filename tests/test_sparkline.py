@@ -0,0 +1,33 @@
+import sys
+
+from PySide6.QtWidgets import QApplication
+
+from ui.widgets import MetricTile, Sparkline
+
+app = QApplication.instance() or QApplication(sys.argv)
+
+
+def test_sparkline_keeps_last_n_samples():
+    line = Sparkline(points=5)
+    for i in range(12):
+        line.append(float(i))
+    assert line.values() == [7.0, 8.0, 9.0, 10.0, 11.0]
+
+
+def test_sparkline_path_is_compacted():
+    line = Sparkline(points=10)
+    for i in range(1000):
+        line.append(float(i))
+    assert line._path.elementCount() < 2 * 10
+
+
+def test_metric_tile_feeds_sparkline_with_numeric_values():
+    tile = MetricTile("CPU LOAD", "0", "%", history_points=60)
+    tile.set_value(42.0)
+    tile.set_value("n/a")
+    assert tile.value.text() == "n/a"
+    assert tile.sparkline.values() == [42.0]
+
+
+def test_metric_tile_without_history_has_no_sparkline():
+    assert MetricTile("RAM USED", "0", "GB").sparkline is None
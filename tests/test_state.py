@@ -0,0 +1,82 @@
+import json
+import sys
+import time
+
+from PySide6.QtWidgets import QApplication
+
+import app.state as state_mod
+from app.state import FocusStreakState, StateStore, TodoItem
+
+app = QApplication.instance() or QApplication(sys.argv)
+
+
+def _saved(path):
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def test_burst_of_updates_is_one_write(tmp_path):
+    path = tmp_path / "state.json"
+    store = StateStore(path, flush_interval_ms=100)
+    streak = store.section("focus_streak")
+    for i in range(10):
+        streak.sessions_completed = i + 1
+        store.update("focus_streak", streak)
+    store.update("todos", [TodoItem("write report")])
+    assert store.dirty == {"focus_streak", "todos"}
+
+    deadline = time.monotonic() + 2.0
+    while store.writes == 0 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    time.sleep(0.15)
+    assert store.writes == 1
+    data = _saved(path)
+    assert data["focus_streak"]["sessions_completed"] == 10
+    assert data["todos"] == [{"text": "write report", "done": False}]
+    store.close()
+    assert store.writes == 1  # nothing left to flush
+
+
+def test_close_flushes_and_keeps_other_sections(tmp_path):
+    path = tmp_path / "state.json"
+    first = StateStore(path, flush_interval_ms=60_000)
+    first.update("focus_streak", FocusStreakState(current_streak=3))
+    first.close()
+    assert first.writes == 1
+
+    second = StateStore(path, flush_interval_ms=60_000)
+    second.update("todos", [TodoItem("a", done=True)])
+    second.close()
+    data = _saved(path)
+    assert data["focus_streak"]["current_streak"] == 3
+    assert data["todos"] == [{"text": "a", "done": True}]
+
+    # Updates after close are written straight away
+    second.update("todos", [])
+    assert _saved(path)["todos"] == []
+
+
+def test_widget_clicks_go_through_the_store(tmp_path, monkeypatch):
+    from ui.widgets import PomodoroCyclesWidget
+
+    path = tmp_path / "state.json"
+    store = StateStore(path, flush_interval_ms=60_000)
+    monkeypatch.setattr(state_mod, "_store", store)
+    widget = PomodoroCyclesWidget()
+    for _ in range(10):
+        widget._log_cycle()
+    assert store.writes == 0
+    assert store.section("pomodoro_cycles").cycles_today == 10
+    store.close()
+    assert store.writes == 1
+    assert _saved(path)["pomodoro_cycles"]["cycles_today"] == 10
+
+
+def test_unwritable_state_file_falls_back_to_defaults(tmp_path):
+    blocker = tmp_path / "not_a_dir"
+    blocker.write_text("", encoding="utf-8")
+    store = StateStore(blocker / "state.json", flush_interval_ms=60_000)
+    assert store.section("todos") == []
+    assert store.section("focus_streak") == FocusStreakState()
+    store.update("todos", [TodoItem("a")])
+    store.close()
+    assert store.writes == 0
@@ -0,0 +1,66 @@
+import random
+import statistics
+
+import pytest
+
+from app.stats import Ema, QuantileSketch, RunningStats, StatsStage, WindowedStats
+
+
+def test_ema_converges_and_respects_time_gaps():
+    ema = Ema(tau_s=5.0)
+    assert ema.add(0.0, 0.0) == 0.0
+    one_tick = ema.add(100.0, 1.0)
+    assert 0.0 < one_tick < 50.0
+
+    slow = Ema(tau_s=5.0)
+    slow.add(0.0, 0.0)
+    # A long gap trusts the new reading almost fully
+    assert slow.add(100.0, 60.0) > 99.0
+
+
+def test_running_stats_matches_statistics_and_merges():
+    data = [random.uniform(0, 100) for _ in range(500)]
+    whole = RunningStats()
+    for v in data:
+        whole.add(v)
+    assert abs(whole.mean - statistics.fmean(data)) < 1e-9
+    assert abs(whole.variance - statistics.variance(data)) < 1e-6
+
+    a, b = RunningStats(), RunningStats()
+    for v in data[:200]:
+        a.add(v)
+    for v in data[200:]:
+        b.add(v)
+    a.merge(b)
+    assert a.count == 500
+    assert abs(a.variance - whole.variance) < 1e-6
+
+
+def test_sketch_quantile_within_relative_accuracy():
+    data = [random.uniform(1, 100) for _ in range(5000)]
+    sketch = QuantileSketch(relative_accuracy=0.01)
+    for v in data:
+        sketch.add(v)
+    exact = sorted(data)[int(0.95 * (len(data) - 1))]
+    assert abs(sketch.quantile(0.95) - exact) <= 0.02 * exact
+    assert len(sketch.bins) < 500
+
+
+def test_window_forgets_old_samples():
+    win = WindowedStats(window_s=60.0, panes=6)
+    for t in range(60):
+        win.add(90.0, float(t))
+    for t in range(60, 180):
+        win.add(10.0, float(t))
+    assert win.quantile(0.95) == pytest.approx(10.0, rel=0.02)
+    assert win.summary().mean == 10.0
+    assert win.count <= 70
+
+
+def test_zero_values_and_stage_lookup():
+    stage = StatsStage(window_s=30.0, tau_s=2.0)
+    assert stage.smoothed("gpu") is None and stage.quantile("gpu", 0.95) is None
+    for t in range(10):
+        stage.record("gpu", 0.0, float(t))
+    assert stage.quantile("gpu", 0.95) == 0.0
+    assert stage.smoothed("gpu") == 0.0
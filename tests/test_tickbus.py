@@ -0,0 +1,86 @@
+import sys
+
+from PySide6.QtCore import QCoreApplication, QEvent, QObject
+from PySide6.QtWidgets import QApplication
+
+from app.tickbus import TickBus
+
+app = QApplication.instance() or QApplication(sys.argv)
+
+
+class FakeClock:
+    def __init__(self, now):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def _run(bus, clock, seconds):
+    # Drive the bus as its timer would: one wakeup per whole second
+    for _ in range(seconds):
+        clock.now += 1.0
+        bus._fire()
+
+
+def test_intervals_and_phases_share_wakeups():
+    clock = FakeClock(1000.2)
+    bus = TickBus(clock=clock)
+    calls = []
+    bus.subscribe(lambda: calls.append(("1s", clock.now)), 1)
+    bus.subscribe(lambda: calls.append(("5s", clock.now)), 5, phase_s=2)
+    _run(bus, clock, 10)
+    ones = [t for name, t in calls if name == "1s"]
+    fives = [int(t) for name, t in calls if name == "5s"]
+    assert len(ones) == 10
+    assert fives == [1002, 1007]
+
+
+def test_timer_sleeps_until_next_due_second():
+    clock = FakeClock(1000.25)
+    bus = TickBus(clock=clock)
+    bus.subscribe(lambda: None, 60, coarse=True)
+    # 1020 is the next multiple of 60 after 1000.25
+    assert 19700 <= bus._timer.interval() <= 19800
+
+
+def test_paused_and_cancelled_subscriptions_do_not_run():
+    clock = FakeClock(50.5)
+    bus = TickBus(clock=clock)
+    calls = []
+    paused = bus.subscribe(lambda: calls.append("paused"), 1, active=False)
+    cancelled = bus.subscribe(lambda: calls.append("cancelled"), 1)
+    assert paused.active is False
+    cancelled.cancel()
+    assert not bus._timer.isActive()
+
+    _run(bus, clock, 3)
+    assert calls == []
+    paused.set_active(True)
+    _run(bus, clock, 2)
+    assert calls == ["paused", "paused"]
+
+
+def test_late_wakeup_runs_due_callbacks_once():
+    clock = FakeClock(10.5)
+    bus = TickBus(clock=clock)
+    calls = []
+    bus.subscribe(lambda: calls.append("min"), 60)
+    bus._fire()
+    clock.now = 200.1  # slept through two minute boundaries
+    bus._fire()
+    assert calls == ["min"]
+
+
+def test_owner_destruction_unsubscribes_and_errors_are_contained():
+    clock = FakeClock(0.5)
+    bus = TickBus(clock=clock)
+    owner = QObject()
+    calls = []
+    bus.subscribe(lambda: 1 / 0, 1)
+    bus.subscribe(lambda: calls.append(1), 1, owner=owner)
+    _run(bus, clock, 1)
+    assert calls == [1]
+    owner.deleteLater()
+    QCoreApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete)
+    assert len(bus.subscriptions()) == 1
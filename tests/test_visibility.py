@@ -0,0 +1,97 @@
+import sys
+
+from PySide6.QtCore import QCoreApplication, QEvent, QObject, Signal
+from PySide6.QtWidgets import QApplication, QScrollArea, QVBoxLayout, QWidget
+
+from ui.visibility import VisibilityGate
+
+app = QApplication.instance() or QApplication(sys.argv)
+
+
+def _settle():
+    for _ in range(3):
+        app.processEvents()
+
+
+def _scroll_setup():
+    scroll = QScrollArea()
+    scroll.setWidgetResizable(True)
+    scroll.resize(300, 200)
+    content = QWidget()
+    layout = QVBoxLayout(content)
+    top, bottom = QWidget(), QWidget()
+    for w in (top, bottom):
+        w.setMinimumHeight(400)
+        layout.addWidget(w)
+    scroll.setWidget(content)
+    return scroll, top, bottom
+
+
+def test_offscreen_widget_skips_updates_and_catches_up_once():
+    scroll, top, bottom = _scroll_setup()
+    gate = VisibilityGate()
+    top_calls, bottom_calls = [], []
+    top_update = gate.gated(top, top_calls.append)
+    bottom_update = gate.gated(bottom, bottom_calls.append)
+    scroll.show()
+    _settle()
+
+    for i in range(5):
+        top_update(i)
+        bottom_update(i)
+    assert top_calls == [0, 1, 2, 3, 4]
+    assert bottom_calls == []
+    assert gate.suppressed == 5
+
+    scroll.verticalScrollBar().setValue(scroll.verticalScrollBar().maximum())
+    _settle()
+    # One catch-up with the newest arguments
+    assert bottom_calls == [4]
+    assert not gate.is_visible(top)
+    bottom_update(5)
+    assert bottom_calls == [4, 5]
+    scroll.close()
+
+
+def test_catch_up_override_and_hidden_window():
+    scroll, top, _ = _scroll_setup()
+    gate = VisibilityGate()
+    calls = []
+    update = gate.gated(top, lambda v: calls.append(("update", v)), catch_up=lambda v: calls.append(("reseed", v)))
+
+    # Not shown yet: nothing is visible
+    update(1)
+    assert calls == []
+    scroll.show()
+    _settle()
+    assert calls == [("reseed", 1)]
+
+    scroll.hide()
+    _settle()
+    update(2)
+    assert calls == [("reseed", 1)]
+    scroll.show()
+    _settle()
+    assert calls[-1] == ("reseed", 2)
+    scroll.close()
+
+
+def test_connect_gated_disconnects_when_widget_is_destroyed():
+    class Source(QObject):
+        fired = Signal(int)
+
+    source = Source()
+    gate = VisibilityGate()
+    widget = QWidget()
+    calls = []
+    gate.connect_gated(source.fired, widget, calls.append)
+    widget.show()
+    _settle()
+    source.fired.emit(1)
+    assert calls == [1]
+    assert source.receivers("2fired(int)") == 1
+
+    widget.deleteLater()
+    _settle()
+    QCoreApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete)
+    assert source.receivers("2fired(int)") == 0
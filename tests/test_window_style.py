@@ -0,0 +1,53 @@
+import sys
+from datetime import datetime, timedelta
+
+from PySide6.QtGui import QPalette
+from PySide6.QtWidgets import QApplication, QLabel
+
+from app.window_style import apply_state_style, repolish_count, set_style_state
+from ui.widgets import DistractionBlockerWidget, FocusTimerWidget
+
+app = QApplication.instance() or QApplication(sys.argv)
+apply_state_style(app)
+
+
+def test_state_change_repolishes_only_on_change():
+    label = QLabel("00:00")
+    label.setObjectName("timerLabel")
+    before = repolish_count()
+    assert set_style_state(label, "ok") is True
+    assert set_style_state(label, "ok") is False
+    assert set_style_state(label, "alert") is True
+    assert repolish_count() - before == 2
+    assert label.palette().color(QPalette.ColorRole.WindowText).name() == "#f44336"
+
+
+def test_apply_state_style_is_idempotent():
+    sheet = app.styleSheet()
+    apply_state_style(app)
+    assert app.styleSheet() == sheet
+
+
+def test_focus_timer_countdown_repolishes_at_thresholds_only():
+    widget = FocusTimerWidget()
+    widget.remaining_seconds = 5 * 60 + 3
+    widget._update_display()
+    before = repolish_count()
+    # Ok -> warn at 5:00 and warn -> alert at 0:00, however many ticks in between
+    for _ in range(5 * 60 + 3):
+        widget.remaining_seconds -= 1
+        widget._update_display()
+    assert widget.label.property("state") == "alert"
+    assert repolish_count() - before == 2
+
+
+def test_dnd_countdown_does_not_repolish_every_second():
+    widget = DistractionBlockerWidget()
+    widget._state.is_active = True
+    widget._state.blocked_until = (datetime.now() + timedelta(minutes=10)).isoformat()
+    widget._update_timer()
+    before = repolish_count()
+    for _ in range(30):
+        widget._update_timer()
+    assert widget.timer_label.property("state") == "alert"
+    assert repolish_count() == before
@@ -1,48 +1,92 @@
 from __future__ import annotations
 
+import time
 from typing import Optional
 
-from PySide6.QtWidgets import QWidget, QScrollArea, QVBoxLayout
-from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QWidget, QScrollArea, QVBoxLayout, QFrame, QLabel
+from PySide6.QtCore import Qt, QEvent, QObject, QTimer, Signal
+from PySide6.QtGui import QWindow
 
-from app.config import DEFAULT_LAYOUT
+from app.config import DEFAULT_LAYOUT, DEFAULT_LOG_MAX_LINES, DEFAULT_METRIC_DISPLAY
+from app.history import HistoryStore
+from app.logger import LogRecord, get_logger
+from app.stats import StatsStage
 from app.state import TodoItem
 from ui.panels import LogsPanel
-from ui.widgets import (
-    FocusTimerWidget,
-    MetricTile,
-    TodoListWidget,
-    UniTasksWidget,
-    BreakReminderWidget,
-    FocusStreakWidget,
-    DistractionBlockerWidget,
-    HydrationReminderWidget,
-    PomodoroCyclesWidget,
-)
-from ui.widgets.fan_speed_widget import FanSpeedWidget
-from ui.widgets.weather_widget import WeatherWidget
-from ui.widgets.calendar_widget import CalendarWidget
-from ui.widgets.habit_tracker_widget import HabitTrackerWidget
-from ui.widgets.motivational_quote_widget import MotivationalQuoteWidget
-from ui.widgets.system_stats_widget import SystemStatsWidget
-from ui.widgets.countdown_widget import CountdownWidget
-from ui.widgets.sticky_notes_widget import StickyNotesWidget
-from ui.widgets.media_controls_widget import MediaControlsWidget
-from ui.widgets.focus_music_widget import FocusMusicWidget
-from ui.widgets.github_notifications_widget import GitHubNotificationsWidget
+from ui.visibility import get_visibility_gate
+from ui.registry import get_spec
+from ui.widgets import MetricTile, TodoListWidget
+
+# Seconds of history drawn on the metric tiles' sparklines
+METRIC_HISTORY_SECONDS = 60
+# Window behind the "mean" and "p95" tile display modes
+STATS_WINDOW_SECONDS = 300
+# Tile label suffix per display mode
+_DISPLAY_SUFFIX = {
+    "raw": "",
+    "smoothed": " · smoothed",
+    "mean": f" · avg {STATS_WINDOW_SECONDS // 60}m",
+    "p95": f" · p95 {STATS_WINDOW_SECONDS // 60}m",
+}
+
+
+class _Placeholder(QFrame):
+    """Stands in for a slot until its real widget has been built."""
+
+    def __init__(self, widget_type: str, parent: QWidget | None = None) -> None:
+        super().__init__(parent)
+        self.setStyleSheet("QFrame { background-color: #242424; border-radius: 8px; }")
+        layout = QVBoxLayout(self)
+        label = QLabel(f"loading {widget_type.replace('_', ' ')}…", self)
+        label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        label.setStyleSheet("color: #666; font-size: 12px; background: transparent;")
+        layout.addWidget(label)
 
 
 class DashboardView(QWidget):
-    def __init__(self, layout_cfg: Optional[dict[str, str]] = None, widget_order: Optional[list[str]] = None, parent: QWidget | None = None) -> None:
+    # Emitted once every slot holds its real widget (progressive mode)
+    ready = Signal()
+
+    def __init__(
+        self,
+        layout_cfg: Optional[dict[str, str]] = None,
+        widget_order: Optional[list[str]] = None,
+        parent: QWidget | None = None,
+        metric_display: Optional[dict[str, str]] = None,
+        progressive: bool = False,
+        log_max_lines: int = DEFAULT_LOG_MAX_LINES,
+    ) -> None:
+        """
+        progressive: fill slots with placeholders and build the real widgets
+        one per event-loop pass (cheapest first) once the window is on screen, so
+        the first frame doesn't wait for network/file/state.json work.
+        """
         super().__init__(parent)
 
         cfg = layout_cfg if isinstance(layout_cfg, dict) else dict(DEFAULT_LAYOUT)
         order = widget_order if isinstance(widget_order, list) else None
+        self._metric_display = dict(DEFAULT_METRIC_DISPLAY)
+        if isinstance(metric_display, dict):
+            self._metric_display.update(metric_display)
 
         # Widget handles
         self._metrics_tiles: dict[str, MetricTile] = {}
+        self._refresh_tiles = self._set_tile_values
         self._logs_panel: Optional[LogsPanel] = None
         self._todo_widget: Optional[TodoListWidget] = None
+        self._log_max_lines = log_max_lines
+        # Todos handed over before the todo widget exists (progressive mode)
+        self._pending_todos: Optional[list[TodoItem]] = None
+        # (priority, slot index, widget type, placeholder) still to build
+        self._build_queue: list[tuple[int, int, str, QWidget]] = []
+        self._build_timer = QTimer(self)
+        self._build_timer.setInterval(0)
+        self._build_timer.timeout.connect(self._build_next)
+
+        # Bounded metric history (kept even when no metrics tile is shown)
+        self.history = HistoryStore()
+        # Streaming EMA / windowed stats behind the tiles' display modes
+        self.stats = StatsStage(window_s=STATS_WINDOW_SECONDS)
 
         # Create scrollable area for better use of space
         scroll = QScrollArea(self)
@@ -53,7 +97,7 @@ class DashboardView(QWidget):
         scroll_widget.setStyleSheet("QWidget { background-color: #1e1e1e; }")
         
         # Main vertical layout - single column, full width
-        main_vbox = QVBoxLayout(scroll_widget)
+        main_vbox = self._slots = QVBoxLayout(scroll_widget)
         main_vbox.setContentsMargins(40, 40, 40, 40)
         main_vbox.setSpacing(40)
 
@@ -61,31 +105,21 @@ class DashboardView(QWidget):
         # Order slots by number: slot_1, slot_2, slot_3, slot_4, slot_5, slot_6
         slot_order = [f"slot_{i}" for i in range(1, 7)]
         
-        for slot_name in slot_order:
+        for index, slot_name in enumerate(slot_order):
             widget_type = cfg.get(slot_name, "blank")
             if widget_type == "blank":
                 continue
             
-            widget = self._make_widget(widget_type, widget_type)
-            # sensible defaults for heights
-            if widget_type == "focus_timer":
-                widget.setMinimumHeight(320)
-            elif widget_type == "metrics":
-                widget.setMinimumHeight(240)
-            elif widget_type in ("university", "todo"):
-                widget.setMinimumHeight(300)
-            elif widget_type in ("calendar", "countdown", "sticky_notes"):
-                widget.setMinimumHeight(280)
-            elif widget_type in ("habit_tracker", "system_stats", "motivational_quote"):
-                widget.setMinimumHeight(250)
-            elif widget_type in ("weather", "focus_music", "media_controls", "github_notifications"):
-                widget.setMinimumHeight(220)
-            elif widget_type in ("break_reminder", "focus_streak", "distraction_blocker", 
-                                 "hydration_reminder", "pomodoro_cycles", "fan_speed"):
-                widget.setMinimumHeight(200)
+            spec = get_spec(widget_type)
+            # Metrics and logs are in-house and cheap; they also receive data from the first tick
+            if progressive and spec is not None and spec.target is not None:
+                widget = _Placeholder(widget_type, self)
+                self._build_queue.append((spec.priority, index, widget_type, widget))
             else:
-                widget.setMinimumHeight(200)
+                widget = self._make_widget(widget_type, widget_type)
+            widget.setMinimumHeight(spec.min_height if spec is not None else 200)
             main_vbox.addWidget(widget)
+        self._build_queue.sort(key=lambda item: item[:2])
         
         # Add stretch at end to prevent widgets from being stretched
         main_vbox.addStretch(1)
@@ -98,151 +132,184 @@ class DashboardView(QWidget):
         main_layout.addWidget(scroll)
         self.setLayout(main_layout)
 
+    @property
+    def pending(self) -> int:
+        """Slots still showing a placeholder."""
+        return len(self._build_queue)
+
+    def showEvent(self, event) -> None:
+        super().showEvent(event)
+        if not self._build_queue or self._build_timer.isActive():
+            return
+        handle = self.window().windowHandle()
+        if handle is None or handle.isExposed():
+            self._build_timer.start()
+        else:
+            # Wait for the window to be exposed (and painted with the placeholders)
+            handle.installEventFilter(self)
+
+    def eventFilter(self, obj: QObject, event: QEvent) -> bool:
+        if event.type() == QEvent.Type.Expose and isinstance(obj, QWindow) and obj.isExposed():
+            obj.removeEventFilter(self)
+            # The expose is painted synchronously; the timer fires after that frame
+            if self._build_queue:
+                self._build_timer.start()
+        return False
+
+    def build_all(self) -> None:
+        """Build every remaining slot now."""
+        while self._build_queue:
+            self._build_next()
+
+    def _build_next(self) -> None:
+        if not self._build_queue:
+            self._build_timer.stop()
+            return
+        _, _, widget_type, placeholder = self._build_queue.pop(0)
+        try:
+            try:
+                widget = self._make_widget(widget_type, widget_type)
+            except Exception as e:
+                # Runs from a timer slot: keep building the other slots
+                get_logger().error("dashboard", f"widget {widget_type!r} failed to build: {e}")
+                widget = QWidget(self)
+            widget.setMinimumHeight(placeholder.minimumHeight())
+            self._slots.replaceWidget(placeholder, widget)
+            placeholder.deleteLater()
+            if widget is self._todo_widget and self._pending_todos is not None:
+                self._todo_widget.set_items(self._pending_todos)
+                self._pending_todos = None
+        finally:
+            if not self._build_queue:
+                self._build_timer.stop()
+                self.ready.emit()
+
     def _make_widget(self, widget_type: str, fallback: str) -> QWidget:
         wt = widget_type if isinstance(widget_type, str) else fallback
-        if wt == "blank":
+        spec = get_spec(wt)
+        if spec is None:
+            # Unknown type -> fallback
+            if wt != fallback:
+                return self._make_widget(fallback, fallback)
             return QWidget(self)
 
-        if wt == "university":
-            return UniTasksWidget(self)
-
-        if wt == "todo":
-            self._todo_widget = TodoListWidget(self)
-            return self._todo_widget
-
-        if wt == "focus_timer":
-            return FocusTimerWidget(self)
+        if wt == "metrics":
+            return self._make_metrics()
 
         if wt == "logs":
-            self._logs_panel = LogsPanel("logs", self)
+            self._logs_panel = LogsPanel("logs", self, max_lines=self._log_max_lines)
             return self._logs_panel
 
-        if wt == "metrics":
-            # Simple metrics block (three MetricTiles)
-            box = QWidget(self)
-            layout = QVBoxLayout(box)
-            layout.setContentsMargins(20, 20, 20, 20)
-            layout.setSpacing(20)
-
-            cpu = MetricTile("CPU LOAD", "0", "%", box)
-            cpu.setMinimumHeight(70)
-            gpu = MetricTile("GPU LOAD", "0", "%", box)
-            gpu.setMinimumHeight(70)
-            ram = MetricTile("RAM USED", "0.0", "GB", box)
-            ram.setMinimumHeight(70)
-
-            self._metrics_tiles = {"cpu": cpu, "gpu": gpu, "ram": ram}
-
-            layout.addWidget(cpu)
-            layout.addWidget(gpu)
-            layout.addWidget(ram)
-
-            box.setLayout(layout)
-            return box
-
-        # New ADHD/Focus widgets
-        if wt == "break_reminder":
-            return BreakReminderWidget(self)
-
-        if wt == "focus_streak":
-            return FocusStreakWidget(self)
-
-        if wt == "distraction_blocker":
-            return DistractionBlockerWidget(self)
-
-        if wt == "hydration_reminder":
-            return HydrationReminderWidget(self)
-
-        if wt == "pomodoro_cycles":
-            return PomodoroCyclesWidget(self)
-
-        if wt == "fan_speed":
-            return FanSpeedWidget(self)
-
-        if wt == "weather":
-            try:
-                return WeatherWidget(parent=self)
-            except Exception:
-                return QWidget(self)
-
-        if wt == "calendar":
-            try:
-                return CalendarWidget(parent=self)
-            except Exception:
-                return QWidget(self)
-
-        if wt == "habit_tracker":
-            try:
-                return HabitTrackerWidget(parent=self)
-            except Exception:
-                return QWidget(self)
-
-        if wt == "motivational_quote":
-            try:
-                return MotivationalQuoteWidget(parent=self)
-            except Exception:
-                return QWidget(self)
-
-        if wt == "system_stats":
-            try:
-                return SystemStatsWidget(parent=self)
-            except Exception:
-                return QWidget(self)
-
-        if wt == "countdown":
-            try:
-                return CountdownWidget(parent=self)
-            except Exception:
-                return QWidget(self)
-
-        if wt == "sticky_notes":
-            try:
-                return StickyNotesWidget(parent=self)
-            except Exception:
-                return QWidget(self)
-
-        if wt == "media_controls":
-            try:
-                return MediaControlsWidget(parent=self)
-            except Exception:
-                return QWidget(self)
-
-        if wt == "focus_music":
-            try:
-                return FocusMusicWidget(parent=self)
-            except Exception:
-                return QWidget(self)
+        if spec.target is None:  # blank
+            return QWidget(self)
 
-        if wt == "github_notifications":
-            try:
-                return GitHubNotificationsWidget(parent=self)
-            except Exception:
-                return QWidget(self)
+        try:
+            # First use of a type imports its module
+            widget = spec.load()(parent=self)
+        except Exception as e:
+            if not spec.optional:
+                raise
+            get_logger().warning("dashboard", f"widget {wt!r} unavailable: {e}")
+            return QWidget(self)
 
-        # Unknown type -> fallback
-        if wt != fallback:
-            return self._make_widget(fallback, fallback)
-        return QWidget(self)
+        if wt == "todo":
+            self._todo_widget = widget
+        return widget
+
+    def _make_metrics(self) -> QWidget:
+        # Simple metrics block (three MetricTiles)
+        box = QWidget(self)
+        layout = QVBoxLayout(box)
+        layout.setContentsMargins(20, 20, 20, 20)
+        layout.setSpacing(20)
+
+        # 60 s of history at the 1 Hz sample rate
+        suffix = {k: _DISPLAY_SUFFIX.get(m, "") for k, m in self._metric_display.items()}
+        cpu = MetricTile("CPU LOAD" + suffix["cpu"], "0", "%", box, history_points=METRIC_HISTORY_SECONDS, history_range=(0.0, 100.0))
+        cpu.setMinimumHeight(70)
+        gpu = MetricTile("GPU LOAD" + suffix["gpu"], "0", "%", box, history_points=METRIC_HISTORY_SECONDS, history_range=(0.0, 100.0))
+        gpu.setMinimumHeight(70)
+        ram = MetricTile("RAM USED" + suffix["ram"], "0.0", "GB", box, history_points=METRIC_HISTORY_SECONDS)
+        ram.setMinimumHeight(70)
+
+        self._metrics_tiles = {"cpu": cpu, "gpu": gpu, "ram": ram}
+        for name, tile in self._metrics_tiles.items():
+            tile.set_history(self.history.series(name).values(METRIC_HISTORY_SECONDS))
+
+        layout.addWidget(cpu)
+        layout.addWidget(gpu)
+        layout.addWidget(ram)
+
+        # Off screen the tiles skip updates; coming back reseeds the sparklines from history
+        self._refresh_tiles = get_visibility_gate().gated(box, self._set_tile_values, catch_up=self._reseed_tiles)
+
+        box.setLayout(layout)
+        return box
 
     # ---- hooks used by MainWindow heartbeat ----
-    def set_metrics(self, cpu_temp: int, gpu_load: int, ram_used: float) -> None:
-        if not self._metrics_tiles:
-            return
-        self._metrics_tiles["cpu"].set_value(str(cpu_temp))
-        self._metrics_tiles["gpu"].set_value(str(gpu_load))
-        self._metrics_tiles["ram"].set_value(f"{ram_used:.1f}")
+    def set_metrics(self, cpu_temp: float, gpu_load: Optional[float], ram_used: float, timestamp: float | None = None) -> None:
+        # gpu_load is None when no GPU provider was found
+        ts = time.time() if timestamp is None else timestamp
+        readings = {"cpu": cpu_temp, "gpu": gpu_load, "ram": ram_used}
+        for name, value in readings.items():
+            if value is not None:
+                self.history.record(name, value, ts)
+                self.stats.record(name, value, ts)
+        if self._metrics_tiles:
+            self._refresh_tiles(readings)
+
+    def _set_tile_values(self, readings: dict[str, Optional[float]]) -> None:
+        for name, value in readings.items():
+            tile = self._metrics_tiles[name]
+            if value is None:
+                tile.set_value("--")
+            else:
+                tile.set_value(self._display_value(name, float(value)), sample=float(value))
+
+    def _reseed_tiles(self, readings: dict[str, Optional[float]]) -> None:
+        for name, tile in self._metrics_tiles.items():
+            values = self.history.series(name).values(METRIC_HISTORY_SECONDS)
+            # The newest reading is appended again by _set_tile_values
+            tile.set_history(values[:-1] if readings.get(name) is not None else values)
+        self._set_tile_values(readings)
+
+    def _display_value(self, name: str, value: float) -> float:
+        mode = self._metric_display.get(name, "raw")
+        if mode == "smoothed":
+            shown = self.stats.smoothed(name)
+        elif mode == "mean":
+            window = self.stats.window(name)
+            shown = window.summary().mean if window is not None and window.count else None
+        elif mode == "p95":
+            shown = self.stats.quantile(name, 0.95)
+        else:
+            shown = None
+        return value if shown is None else shown
 
     def append_log(self, line: str) -> None:
         if self._logs_panel is None:
             return
         self._logs_panel.append_line(line)
 
+    def set_log_history(self, before) -> None:
+        """Let the logs panel page in older records (see LogsPanel.set_history)."""
+        if self._logs_panel is None:
+            return
+        self._logs_panel.set_history(before)
+
+    def append_records(self, records: list[LogRecord]) -> None:
+        if self._logs_panel is None:
+            return
+        self._logs_panel.append_records(records)
+
     def set_todos(self, todos: list[TodoItem]) -> None:
         if self._todo_widget is None:
+            # Not built yet: hand them over when it is
+            self._pending_todos = list(todos)
             return
         self._todo_widget.set_items(todos)
 
     def get_todos(self) -> list[TodoItem]:
         if self._todo_widget is None:
-            return []
+            return list(self._pending_todos or [])
         return self._todo_widget.get_items()
@@ -576,10 +576,9 @@ class LaunchDialog(QDialog):
         layout.addWidget(table)
 
         # Load existing
-        from app.state import load_state
+        from app.state import get_state_store
         try:
-            state = load_state()
-            for todo in state.todos:
+            for todo in get_state_store().section("todos"):
                 self._add_todo_row(table, todo.text, todo.done)
         except:
             pass
@@ -608,7 +607,7 @@ class LaunchDialog(QDialog):
         dialog.exec()
 
         # Save
-        from app.state import save_state, AppState, TodoItem
+        from app.state import TodoItem
         todos = []
         for row in range(table.rowCount()):
             task = table.item(row, 0).text().strip() if table.item(row, 0) else ""
@@ -616,8 +615,9 @@ class LaunchDialog(QDialog):
             if task:
                 todos.append(TodoItem(text=task, done=done))
         try:
-            state = AppState(todos=todos)
-            save_state(state)
+            store = get_state_store()
+            store.update("todos", todos)
+            store.flush()
         except:
             pass
 
@@ -0,0 +1,211 @@
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Iterable, Optional, Sequence
+
+from app.logger import INFO, LEVEL_NAMES
+
+# Postings are keyed by entry sequence number (LogRingModel.first_seq + row).
+# Entries only ever enter or leave at the two ends of the ring, so every
+# postings deque stays sorted: new lines append, history prepends, evictions
+# pop from the front.
+
+
+def _trigrams(text: str) -> set[str]:
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+@dataclass(frozen=True)
+class LogFilter:
+    """Parsed filter box text: "source:ui level:warn disk full"."""
+    text: str = ""  # lower-cased substring
+    sources: frozenset[str] = field(default_factory=frozenset)
+    min_level: Optional[int] = None
+
+    @property
+    def empty(self) -> bool:
+        return not self.text and not self.sources and self.min_level is None
+
+    def narrows(self, other: "LogFilter") -> bool:
+        """True if everything this filter matches is also matched by other."""
+        if other.text not in self.text:
+            return False
+        if other.sources and not (self.sources and self.sources <= other.sources):
+            return False
+        if other.min_level is not None and (self.min_level is None or self.min_level < other.min_level):
+            return False
+        return True
+
+
+def parse_filter(raw: str) -> LogFilter:
+    words: list[str] = []
+    sources: set[str] = set()
+    min_level: Optional[int] = None
+    for token in raw.split():
+        key, sep, value = token.partition(":")
+        key = key.lower()
+        if sep and value and key in ("source", "src"):
+            sources.add(value)
+        elif sep and value and key == "level":
+            wanted = value.upper()
+            for level, name in sorted(LEVEL_NAMES.items()):
+                if name.startswith(wanted) or wanted.startswith(name):
+                    min_level = level
+                    break
+            else:
+                words.append(token)
+        else:
+            words.append(token)
+    return LogFilter(" ".join(words).lower(), frozenset(sources), min_level)
+
+
+class LogIndex:
+    """
+    Incremental search index over the log ring: source tag -> postings,
+    level -> postings and trigram -> postings of the lower-cased display
+    text. Evicted entries are removed from every postings list they were in.
+    """
+
+    def __init__(self) -> None:
+        # seq -> lower-cased display text, and seq -> (source, level)
+        self._texts: dict[int, str] = {}
+        self._meta: dict[int, tuple[Optional[str], int]] = {}
+        # Every indexed seq, ascending, with its text: for filters nothing narrows
+        self._order: deque[int] = deque()
+        self._order_texts: deque[str] = deque()
+        self._sources: dict[Optional[str], deque[int]] = {}
+        self._levels: dict[int, deque[int]] = {}
+        self._grams: dict[str, deque[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._texts)
+
+    def _store(self, seq: int, entry: Any) -> tuple[str, Optional[str], int]:
+        text = self._texts[seq] = str(entry).lower()
+        source = getattr(entry, "source", None)
+        level = getattr(entry, "level", INFO)
+        self._meta[seq] = (source, level)
+        return text, source, level
+
+    def add(self, seq: int, entry: Any) -> None:
+        """Index a new (newest) entry."""
+        text, source, level = self._store(seq, entry)
+        self._order.append(seq)
+        self._order_texts.append(text)
+        self._sources.setdefault(source, deque()).append(seq)
+        self._levels.setdefault(level, deque()).append(seq)
+        grams = self._grams
+        for gram in _trigrams(text):
+            postings = grams.get(gram)
+            if postings is None:
+                postings = grams[gram] = deque()
+            postings.append(seq)
+
+    def add_older(self, entries: Iterable[tuple[int, Any]]) -> None:
+        """Index entries older than everything indexed (history pages)."""
+        for seq, entry in sorted(entries, key=lambda item: item[0], reverse=True):
+            text, source, level = self._store(seq, entry)
+            self._order.appendleft(seq)
+            self._order_texts.appendleft(text)
+            self._sources.setdefault(source, deque()).appendleft(seq)
+            self._levels.setdefault(level, deque()).appendleft(seq)
+            for gram in _trigrams(text):
+                self._grams.setdefault(gram, deque()).appendleft(seq)
+
+    def evict(self, seq: int) -> None:
+        """Drop the oldest entry."""
+        text = self._texts.pop(seq, None)
+        if text is None:
+            return
+        source, level = self._meta.pop(seq)
+        if self._order and self._order[0] == seq:
+            self._order.popleft()
+            self._order_texts.popleft()
+        self._drop_front(self._sources, source, seq)
+        self._drop_front(self._levels, level, seq)
+        for gram in _trigrams(text):
+            self._drop_front(self._grams, gram, seq)
+
+    @staticmethod
+    def _drop_front(table: dict, key: Any, seq: int) -> None:
+        postings = table.get(key)
+        if postings and postings[0] == seq:
+            postings.popleft()
+            if not postings:
+                del table[key]
+
+    def clear(self) -> None:
+        self._texts.clear()
+        self._meta.clear()
+        self._order.clear()
+        self._order_texts.clear()
+        self._sources.clear()
+        self._levels.clear()
+        self._grams.clear()
+
+    def matches(self, seq: int, flt: LogFilter) -> bool:
+        text = self._texts.get(seq)
+        if text is None:
+            return False
+        source, level = self._meta[seq]
+        if flt.sources and source not in flt.sources:
+            return False
+        if flt.min_level is not None and level < flt.min_level:
+            return False
+        return flt.text in text
+
+    def search(self, flt: LogFilter, within: Optional[Sequence[int]] = None) -> list[int]:
+        """
+        Sequence numbers matching flt, ascending. within narrows the search
+        to known candidates (e.g. the previous, broader result).
+        """
+        text, sources, min_level = flt.text, flt.sources, flt.min_level
+        texts, meta = self._texts, self._meta
+        candidates, exact = self._candidates(flt)
+        if within is not None and len(within) < len(candidates):
+            candidates, exact = within, False
+        if exact:
+            # Postings of the only condition (source or level)
+            return list(candidates)
+        if not text:
+            out = list(candidates)
+        elif len(candidates) >= len(texts):
+            # Nothing narrows it down: one pass over every entry, in order
+            out = [seq for seq, doc in zip(self._order, self._order_texts) if text in doc]
+        else:
+            out = [seq for seq in candidates if text in texts[seq]]
+        if sources or min_level is not None:
+            floor = min_level if min_level is not None else -1
+            out = [seq for seq in out
+                   if meta[seq][1] >= floor and (not sources or meta[seq][0] in sources)]
+        return out
+
+    def _candidates(self, flt: LogFilter) -> tuple[Sequence[int], bool]:
+        """
+        The shortest postings list every match must be in, and whether all
+        of it matches (the filter is that one condition alone).
+        """
+        lists: list[Sequence[int]] = []
+        if flt.sources:
+            lists.append(self._merged(self._sources, flt.sources))
+        if flt.min_level is not None:
+            lists.append(self._merged(self._levels, [lv for lv in self._levels if lv >= flt.min_level]))
+        for gram in _trigrams(flt.text):
+            postings = self._grams.get(gram)
+            if postings is None:
+                return (), True
+            lists.append(postings)
+        if not lists:
+            return self._order, not flt.text
+        exact = len(lists) == 1 and not flt.text
+        return min(lists, key=len), exact
+
+    @staticmethod
+    def _merged(table: dict, keys: Iterable[Any]) -> Sequence[int]:
+        postings = [table[key] for key in keys if key in table]
+        if len(postings) == 1:
+            return postings[0]
+        merged = [seq for p in postings for seq in p]
+        merged.sort()  # ascending runs: a linear merge
+        return merged
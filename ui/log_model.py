@@ -0,0 +1,231 @@
+from __future__ import annotations
+
+import bisect
+from typing import Any, Optional
+
+from PySide6.QtCore import QAbstractListModel, QModelIndex, QObject, QPersistentModelIndex, Qt, QTimer, Signal
+
+from ui.log_index import LogFilter, LogIndex
+
+# Lines kept by default; older ones are dropped from the front
+DEFAULT_MAX_LINES = 5000
+# Appends are coalesced and published at most once per frame
+FLUSH_INTERVAL_MS = 16
+
+
+class LogRingModel(QAbstractListModel):
+    """
+    List model over a fixed-capacity ring buffer of log entries.
+
+    append() only queues; queued entries are published together on the next
+    frame with one rows-removed (for evicted entries) and one rows-inserted
+    notification, however many lines arrived. flushed is emitted after each
+    publish so a view can autoscroll once. Every entry in the ring is also
+    in search_index (see LogFilterModel).
+    """
+    flushed = Signal(int)  # number of rows appended
+
+    def __init__(self, max_lines: int = DEFAULT_MAX_LINES, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self._cap = max(1, int(max_lines))
+        self._buf: list[Any] = [None] * self._cap
+        self._start = 0  # physical slot of row 0
+        self._count = 0
+        self._pending: list[Any] = []
+        # Sequence number of row 0; every appended entry gets the next one
+        self._first_seq = 0
+        self.search_index = LogIndex()
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(FLUSH_INTERVAL_MS)
+        self._flush_timer.timeout.connect(self.flush)
+
+    @property
+    def capacity(self) -> int:
+        return self._cap
+
+    @property
+    def first_seq(self) -> int:
+        return self._first_seq
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    def entry(self, row: int) -> Any:
+        if not 0 <= row < self._count:
+            raise IndexError(row)
+        return self._buf[(self._start + row) % self._cap]
+
+    def entries(self) -> list[Any]:
+        return [self._buf[(self._start + i) % self._cap] for i in range(self._count)]
+
+    def append(self, entry: Any) -> None:
+        self._pending.append(entry)
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def extend(self, entries: list[Any]) -> None:
+        if entries:
+            self._pending.extend(entries)
+            if not self._flush_timer.isActive():
+                self._flush_timer.start()
+
+    def flush(self) -> None:
+        """Publish queued entries now."""
+        self._flush_timer.stop()
+        if not self._pending:
+            return
+        batch, self._pending = self._pending, []
+        if len(batch) > self._cap:
+            # Only the newest cap entries can survive; skip the rest outright
+            self._evict(self._count)
+            self._first_seq += len(batch) - self._cap
+            batch = batch[-self._cap:]
+
+        overflow = self._count + len(batch) - self._cap
+        if overflow > 0:
+            self._evict(overflow)
+
+        first = self._count
+        self.beginInsertRows(QModelIndex(), first, first + len(batch) - 1)
+        for entry in batch:
+            self._buf[(self._start + self._count) % self._cap] = entry
+            self.search_index.add(self._first_seq + self._count, entry)
+            self._count += 1
+        self.endInsertRows()
+        self.flushed.emit(len(batch))
+
+    @property
+    def room(self) -> int:
+        """Rows that can still be added without evicting anything."""
+        return max(0, self._cap - self._count - len(self._pending))
+
+    def prepend(self, entries: list[Any]) -> int:
+        """
+        Insert older entries above row 0, newest last. Only free room is
+        used, so live lines are never evicted for history; returns how
+        many entries were inserted (the newest of them).
+        """
+        entries = entries[len(entries) - min(len(entries), self.room):]
+        n = len(entries)
+        if not n:
+            return 0
+        self.beginInsertRows(QModelIndex(), 0, n - 1)
+        self._start = (self._start - n) % self._cap
+        for i, entry in enumerate(entries):
+            self._buf[(self._start + i) % self._cap] = entry
+        self._count += n
+        self._first_seq -= n
+        self.search_index.add_older((self._first_seq + i, entry) for i, entry in enumerate(entries))
+        self.endInsertRows()
+        return n
+
+    def _evict(self, n: int) -> None:
+        if n <= 0:
+            return
+        self.beginRemoveRows(QModelIndex(), 0, n - 1)
+        for i in range(n):
+            self._buf[(self._start + i) % self._cap] = None
+            self.search_index.evict(self._first_seq + i)
+        self._start = (self._start + n) % self._cap
+        self._count -= n
+        self._first_seq += n
+        self.endRemoveRows()
+
+    def clear(self) -> None:
+        self._pending.clear()
+        self.beginResetModel()
+        self._first_seq += self._count
+        self.search_index.clear()
+        self._buf = [None] * self._cap
+        self._start = 0
+        self._count = 0
+        self.endResetModel()
+
+    # ---- QAbstractListModel ----
+    def rowCount(self, parent: QModelIndex | QPersistentModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else self._count
+
+    def data(self, index: QModelIndex | QPersistentModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Optional[str]:
+        if role != Qt.ItemDataRole.DisplayRole or not index.isValid():
+            return None
+        row = index.row()
+        if not 0 <= row < self._count:
+            return None
+        return str(self._buf[(self._start + row) % self._cap])
+
+
+class LogFilterModel(QAbstractListModel):
+    """
+    The rows of a LogRingModel that match a LogFilter, found through the
+    ring's index. The match list is kept current as lines are appended,
+    paged in or evicted, so a filter that only narrows the previous one
+    (typing more characters) just re-checks the current matches.
+    """
+
+    def __init__(self, source: LogRingModel, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self._source = source
+        self._filter = LogFilter()
+        self._seqs: list[int] = []
+        source.rowsInserted.connect(self._on_inserted)
+        source.rowsRemoved.connect(self._on_removed)
+        source.modelReset.connect(self._refilter)
+
+    @property
+    def filter(self) -> LogFilter:
+        return self._filter
+
+    def set_filter(self, flt: LogFilter) -> None:
+        if flt == self._filter:
+            return
+        within = self._seqs if not self._filter.empty and flt.narrows(self._filter) else None
+        self.beginResetModel()
+        self._filter = flt
+        self._seqs = [] if flt.empty else self._source.search_index.search(flt, within)
+        self.endResetModel()
+
+    def _refilter(self) -> None:
+        self.beginResetModel()
+        self._seqs = [] if self._filter.empty else self._source.search_index.search(self._filter)
+        self.endResetModel()
+
+    def _on_inserted(self, _parent: QModelIndex, first: int, last: int) -> None:
+        if self._filter.empty:
+            return
+        base = self._source.first_seq
+        index, flt = self._source.search_index, self._filter
+        new = [seq for seq in range(base + first, base + last + 1) if index.matches(seq, flt)]
+        if not new:
+            return
+        if self._seqs and new[-1] < self._seqs[0]:
+            # History paged in above everything else
+            self.beginInsertRows(QModelIndex(), 0, len(new) - 1)
+            self._seqs[:0] = new
+        else:
+            n = len(self._seqs)
+            self.beginInsertRows(QModelIndex(), n, n + len(new) - 1)
+            self._seqs.extend(new)
+        self.endInsertRows()
+
+    def _on_removed(self, *_: Any) -> None:
+        cut = bisect.bisect_left(self._seqs, self._source.first_seq)
+        if cut:
+            self.beginRemoveRows(QModelIndex(), 0, cut - 1)
+            del self._seqs[:cut]
+            self.endRemoveRows()
+
+    def entry(self, row: int) -> Any:
+        return self._source.entry(self._seqs[row] - self._source.first_seq)
+
+    def rowCount(self, parent: QModelIndex | QPersistentModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._seqs)
+
+    def data(self, index: QModelIndex | QPersistentModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Optional[str]:
+        if role != Qt.ItemDataRole.DisplayRole or not index.isValid():
+            return None
+        row = index.row()
+        if not 0 <= row < len(self._seqs):
+            return None
+        return str(self.entry(row))
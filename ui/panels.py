@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import time
+from typing import Callable, Optional
+
 from PySide6.QtCore import Qt
 from PySide6.QtWidgets import (
     QHBoxLayout,
@@ -7,32 +10,142 @@ from PySide6.QtWidgets import (
     QLineEdit,
     QListWidget,
     QListWidgetItem,
+    QListView,
+    QAbstractItemView,
     QPushButton,
     QVBoxLayout,
     QWidget,
 )
 
+from ui.log_index import parse_filter
+from ui.log_model import DEFAULT_MAX_LINES, LogFilterModel, LogRingModel
 from ui.widgets import Panel
+from app.logger import LogRecord
 from app.state import AppState, TodoItem
 
 
+# Older records loaded per scroll to the top
+HISTORY_PAGE = 200
+
+
 class LogsPanel(Panel):
     """
-    Placeholder logs panel.
-    (We will wire real logging later.)
+    Log lines in a QListView over a bounded ring-buffer model. Bursts of
+    lines reach the view as one update per frame; the view follows the tail
+    (at most one scroll per frame) unless the user has scrolled up.
+    With a history source, scrolling to the top pages in older records
+    while the model has room.
+
+    The filter box narrows the view as you type: plain words match a
+    substring, source:<tag> a source and level:<name> a minimum level,
+    e.g. "source:collector level:warn restart".
     """
 
-    def __init__(self, title: str = "logs", parent: QWidget | None = None) -> None:
+    def __init__(self, title: str = "logs", parent: QWidget | None = None,
+                 max_lines: int = DEFAULT_MAX_LINES) -> None:
         super().__init__(title, parent)
 
-        self.text = QListWidget(self)
+        self.model = LogRingModel(max_lines, self)
+        self.filtered = LogFilterModel(self.model, self)
+        self.filter_input = QLineEdit(self)
+        self.filter_input.setPlaceholderText("filter: text  source:ui  level:warn")
+        self.filter_input.setClearButtonEnabled(True)
+        self.filter_input.textChanged.connect(self.set_filter_text)
+        self.body_layout.addWidget(self.filter_input)
+
+        self.text = QListView(self)
+        self.text.setModel(self.model)
+        self.text.setUniformItemSizes(True)
+        self.text.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
         self.body_layout.addWidget(self.text, 1)
 
+        self._follow = True
+        self.model.rowsAboutToBeInserted.connect(self._remember_follow)
+        self.model.flushed.connect(self._on_flushed)
+
+        self._history: Optional[Callable[[float, int], list[LogRecord]]] = None
+        self._history_done = False
+        self.text.verticalScrollBar().valueChanged.connect(self._maybe_page)
+
+    def set_filter_text(self, raw: str) -> None:
+        flt = parse_filter(raw)
+        self.filtered.set_filter(flt)
+        shown = self.model if flt.empty else self.filtered
+        if self.text.model() is not shown:
+            self.text.setModel(shown)
+            self.text.scrollToBottom()
+
+    def set_history(self, before: Callable[[float, int, int], list[LogRecord]]) -> None:
+        """
+        before(ts, limit, skip) returns up to limit records older than the
+        oldest shown one, oldest first (see LogStore.before). The first
+        page is loaded straight away.
+        """
+        self._history = before
+        self._history_done = False
+        self.load_older()
+
+    def load_older(self) -> int:
+        """Prepend one page of history; returns the number of rows added."""
+        if self._history is None or self._history_done:
+            return 0
+        # Lines still queued for the view are already in the store
+        self.model.flush()
+        limit = min(HISTORY_PAGE, self.model.room)
+        if limit <= 0:
+            return 0
+        ts, skip = self._history_position()
+        records = self._history(ts, limit, skip)
+        if not records:
+            self._history_done = True
+            return 0
+        was_empty = self.model.rowCount() == 0
+        added = self.model.prepend(records)
+        if was_empty:
+            self.text.scrollToBottom()
+        elif added and self.text.model() is self.model:
+            # Keep the row that was on top where it was
+            self.text.scrollTo(self.model.index(added), QAbstractItemView.ScrollHint.PositionAtTop)
+        return added
+
+    def _history_position(self) -> tuple[float, int]:
+        """(oldest shown timestamp to the ms, rows shown with that same ms)."""
+        oldest: Optional[float] = None
+        shown = 0
+        for row in range(self.model.rowCount()):
+            ts = getattr(self.model.entry(row), "timestamp", None)
+            if ts is None:
+                continue
+            ts = round(ts, 3)
+            if oldest is None:
+                oldest = ts
+            elif ts != oldest:
+                break
+            shown += 1
+        if oldest is None:
+            return time.time(), 0
+        return oldest, shown
+
+    def _maybe_page(self, value: int) -> None:
+        bar = self.text.verticalScrollBar()
+        if value == bar.minimum() and bar.maximum() > bar.minimum():
+            self.load_older()
+
     def append_line(self, line: str) -> None:
         if not line:
             return
-        self.text.addItem(line)
-        self.text.scrollToBottom()
+        self.model.append(line)
+
+    def append_records(self, records: list[LogRecord]) -> None:
+        self.model.extend(records)
+
+    def _remember_follow(self, *_) -> None:
+        bar = self.text.verticalScrollBar()
+        self._follow = bar.value() >= bar.maximum()
+
+    def _on_flushed(self, _count: int) -> None:
+        if self._follow:
+            self.text.scrollToBottom()
 
 
 class SensorsPanel(Panel):
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import importlib
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+from app.config import WIDGET_TYPES
+
+# Kept free of Qt and widget imports; widget modules load on first use.
+
+
+@dataclass(frozen=True)
+class WidgetSpec:
+    """
+    One dashboard widget type. The widget class is named as "module:attr"
+    and only imported when a layout actually uses the type.
+    """
+    name: str
+    target: Optional[str]  # None: built by DashboardView itself (blank, metrics, logs)
+    min_height: int = 200
+    optional: bool = False  # import/construction errors fall back to an empty widget
+    priority: int = 0  # progressive build order: 0 cheap, 1 reads state.json, 2 file/network I/O
+
+    def load(self) -> Callable[..., Any]:
+        if self.target is None:
+            raise LookupError(f"widget type {self.name!r} has no factory")
+        module_name, _, attr = self.target.partition(":")
+        return getattr(importlib.import_module(module_name), attr)
+
+
+_SPECS: tuple[WidgetSpec, ...] = (
+    WidgetSpec("university", "ui.widgets:UniTasksWidget", 300),
+    WidgetSpec("metrics", None, 240),
+    WidgetSpec("todo", "ui.widgets:TodoListWidget", 300),
+    WidgetSpec("focus_timer", "ui.widgets:FocusTimerWidget", 320),
+    WidgetSpec("logs", None),
+    WidgetSpec("blank", None),
+    WidgetSpec("break_reminder", "ui.widgets:BreakReminderWidget", priority=1),
+    WidgetSpec("focus_streak", "ui.widgets:FocusStreakWidget", priority=1),
+    WidgetSpec("distraction_blocker", "ui.widgets:DistractionBlockerWidget", priority=1),
+    WidgetSpec("hydration_reminder", "ui.widgets:HydrationReminderWidget", priority=1),
+    WidgetSpec("pomodoro_cycles", "ui.widgets:PomodoroCyclesWidget", priority=1),
+    # New widgets
+    WidgetSpec("calendar", "ui.widgets.calendar_widget:CalendarWidget", 280, optional=True, priority=2),
+    WidgetSpec("weather", "ui.widgets.weather_widget:WeatherWidget", 220, optional=True, priority=2),
+    WidgetSpec("habit_tracker", "ui.widgets.habit_tracker_widget:HabitTrackerWidget", 250, optional=True),
+    WidgetSpec("motivational_quote", "ui.widgets.motivational_quote_widget:MotivationalQuoteWidget", 250, optional=True),
+    WidgetSpec("system_stats", "ui.widgets.system_stats_widget:SystemStatsWidget", 250, optional=True),
+    WidgetSpec("countdown", "ui.widgets.countdown_widget:CountdownWidget", 280, optional=True),
+    WidgetSpec("sticky_notes", "ui.widgets.sticky_notes_widget:StickyNotesWidget", 280, optional=True, priority=1),
+    WidgetSpec("media_controls", "ui.widgets.media_controls_widget:MediaControlsWidget", 220, optional=True),
+    WidgetSpec("focus_music", "ui.widgets.focus_music_widget:FocusMusicWidget", 220, optional=True),
+    WidgetSpec("github_notifications", "ui.widgets.github_notifications_widget:GitHubNotificationsWidget", 220, optional=True, priority=2),
+    WidgetSpec("fan_speed", "ui.widgets.fan_speed_widget:FanSpeedWidget"),
+    WidgetSpec("cpu_cores", "ui.widgets.cpu_cores_widget:CpuCoresWidget", 250),
+    WidgetSpec("top_processes", "ui.widgets.top_processes_widget:TopProcessesWidget", 250),
+)
+
+WIDGET_REGISTRY: dict[str, WidgetSpec] = {spec.name: spec for spec in _SPECS}
+
+# The config validates layouts against app.config.WIDGET_TYPES; the two lists must agree
+_missing = [name for name in WIDGET_TYPES if name not in WIDGET_REGISTRY]
+_unknown = [name for name in WIDGET_REGISTRY if name not in WIDGET_TYPES]
+if _missing or _unknown:
+    raise RuntimeError(f"widget registry out of sync with WIDGET_TYPES: missing {_missing}, unknown {_unknown}")
+
+
+def widget_types() -> list[str]:
+    """Registered type names, in app.config.WIDGET_TYPES order."""
+    return list(WIDGET_TYPES)
+
+
+def get_spec(name: str) -> Optional[WidgetSpec]:
+    return WIDGET_REGISTRY.get(name)
@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+from typing import Any, Callable, Optional
+
+from PySide6.QtCore import QEvent, QObject, QTimer
+from PySide6.QtWidgets import QAbstractScrollArea, QWidget
+
+# Events on watched objects that can change what is on screen
+_TRIGGERS = {
+    QEvent.Type.Show,
+    QEvent.Type.Hide,
+    QEvent.Type.Move,
+    QEvent.Type.Resize,
+    QEvent.Type.WindowStateChange,
+    QEvent.Type.Expose,
+}
+
+
+class _Entry:
+    __slots__ = ("widget", "visible", "alive", "pending")
+
+    def __init__(self, widget: QWidget) -> None:
+        self.widget = widget
+        self.visible = False
+        self.alive = True
+        # gated function -> (callback, args) of the newest call made while hidden
+        self.pending: dict[int, tuple[Callable[..., Any], tuple]] = {}
+
+
+class VisibilityGate(QObject):
+    """
+    Tracks whether registered widgets are actually on screen: shown, inside
+    their scroll area's viewport, and in a window that is neither minimised
+    nor covered (not exposed). Refresh callbacks wrapped with gated() are
+    skipped while their widget is off screen; when it comes back, the newest
+    skipped call runs once as a catch-up.
+
+    Visibility is recomputed once per event-loop pass after a scroll,
+    resize, show/hide or window state change, never per update.
+    """
+
+    def __init__(self, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self._entries: dict[int, _Entry] = {}
+        self._watched: set[int] = set()
+        self.suppressed = 0  # refresh calls skipped so far
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(0)
+        self._refresh_timer.timeout.connect(self.refresh)
+
+    def _entry(self, widget: QWidget) -> _Entry:
+        key = id(widget)
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = self._entries[key] = _Entry(widget)
+            widget.destroyed.connect(lambda *_: self._forget(key))
+            self._watch(widget)
+            entry.visible = self._compute(widget)
+        return entry
+
+    def _forget(self, key: int) -> None:
+        # Signal connections to gated callbacks can outlive the widget
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            entry.alive = False
+            entry.visible = False
+            entry.pending.clear()
+
+    def is_visible(self, widget: QWidget) -> bool:
+        return self._entry(widget).visible
+
+    def gated(self, widget: QWidget, callback: Callable[..., Any],
+              catch_up: Optional[Callable[..., Any]] = None) -> Callable[..., None]:
+        """
+        Wrap callback so it only runs while widget is on screen. Calls made
+        while it is scrolled off screen or covered are dropped except the
+        newest, which runs once when the widget comes back. catch_up, if
+        given, replaces callback for that deferred call (e.g. to reseed a
+        chart rather than append a single point).
+        """
+        entry = self._entry(widget)
+        deferred = catch_up or callback
+
+        def run(*args: Any) -> None:
+            if entry.visible:
+                callback(*args)
+            elif entry.alive:
+                entry.pending[id(run)] = (deferred, args)
+                self.suppressed += 1
+
+        return run
+
+    def connect_gated(self, signal: Any, widget: QWidget, callback: Callable[..., Any],
+                      catch_up: Optional[Callable[..., Any]] = None) -> Callable[..., None]:
+        """
+        Connect signal (e.g. the sensor hub's snapshot) to gated(widget,
+        callback) and disconnect it again when widget is destroyed.
+        """
+        run = self.gated(widget, callback, catch_up)
+        signal.connect(run)
+
+        def disconnect(*_: Any) -> None:
+            try:
+                signal.disconnect(run)
+            except (RuntimeError, TypeError):
+                pass  # the sender went first
+
+        widget.destroyed.connect(disconnect)
+        return run
+
+    def _watch(self, widget: QWidget) -> None:
+        # The widget, every ancestor (scroll viewports included) and the window
+        obj: Optional[QWidget] = widget
+        while obj is not None:
+            self._watch_object(obj)
+            if isinstance(obj, QAbstractScrollArea):
+                self._watch_object(obj.viewport())
+                for bar in (obj.verticalScrollBar(), obj.horizontalScrollBar()):
+                    if id(bar) not in self._watched:
+                        self._watched.add(id(bar))
+                        bar.valueChanged.connect(self.schedule)
+            obj = obj.parentWidget()
+        handle = widget.window().windowHandle()
+        if handle is not None:
+            self._watch_object(handle)
+
+    def _watch_object(self, obj: QObject) -> None:
+        key = id(obj)
+        if key in self._watched:
+            return
+        self._watched.add(key)
+        obj.installEventFilter(self)
+        obj.destroyed.connect(lambda *_: self._watched.discard(key))
+
+    def eventFilter(self, obj: QObject, event: QEvent) -> bool:
+        if event.type() in _TRIGGERS:
+            self.schedule()
+        return False
+
+    def schedule(self, *_: Any) -> None:
+        if not self._refresh_timer.isActive():
+            self._refresh_timer.start()
+
+    @staticmethod
+    def _compute(widget: QWidget) -> bool:
+        if not widget.isVisible():
+            return False
+        window = widget.window()
+        if window.isMinimized():
+            return False
+        handle = window.windowHandle()
+        if handle is not None and not handle.isExposed():
+            return False
+        # Clipped by the scroll viewport (and any other ancestor) -> empty
+        return not widget.visibleRegion().isEmpty()
+
+    def refresh(self) -> None:
+        for entry in list(self._entries.values()):
+            widget = entry.widget
+            # Reparenting or a first show can add ancestors / a window handle
+            self._watch(widget)
+            visible = self._compute(widget)
+            if visible == entry.visible:
+                continue
+            entry.visible = visible
+            if visible and entry.pending:
+                pending, entry.pending = entry.pending, {}
+                for callback, args in pending.values():
+                    callback(*args)
+
+
+# Global singleton instance (created lazily on the GUI thread)
+_gate: Optional[VisibilityGate] = None
+
+
+def get_visibility_gate() -> VisibilityGate:
+    global _gate
+    if _gate is None:
+        _gate = VisibilityGate()
+    return _gate
@@ -2,12 +2,13 @@ from __future__ import annotations
 
 import json
 import math
+from collections import deque
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Iterable, Optional
 
 from PySide6.QtCore import Qt, QTimer, QDateTime, QPropertyAnimation, QEasingCurve, QSequentialAnimationGroup
-from PySide6.QtGui import QColor, QFont
+from PySide6.QtGui import QColor, QFont, QPainter, QPainterPath, QPen, QTransform
 from PySide6.QtWidgets import (
     QCheckBox,
     QComboBox,
@@ -30,10 +31,14 @@ from PySide6.QtWidgets import (
     QStackedWidget,
 )
 
+from app.alerts import FIRING
+from app.logger import get_logger
+from app.tickbus import get_tick_bus
+from app.window_style import set_style_state
+from ui.visibility import get_visibility_gate
 from app.state import (
     TodoItem,
-    save_state,
-    AppState,
+    get_state_store,
     BreakReminderState,
     FocusStreakState,
     DistractionBlockerState,
@@ -88,10 +93,122 @@ class Panel(QFrame):
 # Widgets
 # =========================
 
+class Sparkline(QWidget):
+    """
+    Line chart of the last N samples.
+    The path is built in (sample index, value) space and kept between paints;
+    each new sample appends one segment and the painter transform does the
+    scrolling and scaling, so resizes never rebuild it. Points that have
+    scrolled off are dropped by an occasional compaction (amortised O(1)).
+    """
+
+    def __init__(
+        self,
+        points: int = 60,
+        y_range: Optional[tuple[float, float]] = None,
+        parent: QWidget | None = None,
+    ) -> None:
+        super().__init__(parent)
+
+        self.setObjectName("sparkline")
+        self.setMinimumHeight(28)
+
+        self._points = max(2, points)
+        self._y_range = y_range
+        self._values: deque[float] = deque(maxlen=self._points)
+        self._path = QPainterPath()
+        self._path_len = 0
+        self._next = 0  # sample index of the next value
+
+        self._pen = QPen(QColor("#4aa3ff"))
+        self._pen.setWidthF(1.5)
+        self._pen.setCosmetic(True)  # width independent of the transform
+
+    def append(self, value: float) -> None:
+        """Add the newest sample and schedule a repaint."""
+        self._append(float(value))
+        self.update()
+
+    def set_values(self, values: Iterable[float]) -> None:
+        """Replace the series (e.g. when seeding from history)."""
+        self._values.clear()
+        self._path = QPainterPath()
+        self._path_len = 0
+        for v in values:
+            self._append(float(v))
+        self.update()
+
+    def values(self) -> list[float]:
+        return list(self._values)
+
+    def _append(self, v: float) -> None:
+        self._values.append(v)
+        if self._path_len == 0:
+            self._path.moveTo(self._next, v)
+        else:
+            self._path.lineTo(self._next, v)
+        self._next += 1
+        self._path_len += 1
+        if self._path_len >= 2 * self._points:
+            self._compact()
+
+    def _compact(self) -> None:
+        path = QPainterPath()
+        start = self._next - len(self._values)
+        for i, v in enumerate(self._values):
+            if i == 0:
+                path.moveTo(start, v)
+            else:
+                path.lineTo(start + i, v)
+        self._path = path
+        self._path_len = len(self._values)
+
+    def paintEvent(self, event) -> None:
+        if len(self._values) < 2:
+            return
+
+        if self._y_range is not None:
+            lo, hi = self._y_range
+        else:
+            lo, hi = min(self._values), max(self._values)
+        if hi - lo < 1e-9:
+            hi = lo + 1.0
+
+        rect = self.contentsRect().adjusted(1, 1, -1, -1)
+        if rect.width() <= 0 or rect.height() <= 0:
+            return
+
+        # Newest sample on the right edge, N samples across the full width
+        newest = self._next - 1
+        sx = rect.width() / (self._points - 1)
+        sy = -rect.height() / (hi - lo)
+        dx = rect.right() - sx * newest
+        dy = rect.bottom() - sy * lo
+
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setClipRect(rect)
+        painter.setTransform(QTransform(sx, 0.0, 0.0, sy, dx, dy))
+        painter.setPen(self._pen)
+        painter.drawPath(self._path)
+        painter.end()
+
+
 class MetricTile(QWidget):
-    """Displays a metric label with value and unit."""
+    """
+    Displays a metric label with value and unit.
+    Pass history_points > 0 to show a sparkline of the last N numeric values.
+    """
     
-    def __init__(self, label: str, value: str = "--", unit: str = "", parent: QWidget | None = None):
+    def __init__(
+        self,
+        label: str,
+        value: str = "--",
+        unit: str = "",
+        parent: QWidget | None = None,
+        history_points: int = 0,
+        history_range: Optional[tuple[float, float]] = None,
+    ):
         super().__init__(parent)
 
         self.setObjectName("metricTile")
@@ -115,15 +232,30 @@ class MetricTile(QWidget):
         layout.addWidget(self.value)
         layout.addWidget(self.unit)
 
-    def set_value(self, value: Any) -> None:
-        """Update the metric value with proper formatting."""
+        self.sparkline: Optional[Sparkline] = None
+        if history_points > 0:
+            self.sparkline = Sparkline(history_points, history_range, self)
+            layout.addWidget(self.sparkline)
+
+    def set_value(self, value: Any, sample: Optional[float] = None) -> None:
+        """
+        Update the metric value with proper formatting. sample is the raw
+        reading for the sparkline when value is a derived figure (EMA, p95).
+        """
         if isinstance(value, (int, float)):
             # Format numeric values with 1 decimal place
             formatted = f"{float(value):.1f}"
+            if self.sparkline is not None:
+                self.sparkline.append(float(value if sample is None else sample))
         else:
             formatted = str(value)
         self.value.setText(formatted)
 
+    def set_history(self, values: Iterable[float]) -> None:
+        """Seed the sparkline with past samples."""
+        if self.sparkline is not None:
+            self.sparkline.set_values(values)
+
 
 class ClockWidget(QLabel):
     def __init__(self, parent: QWidget | None = None):
@@ -132,9 +264,8 @@ class ClockWidget(QLabel):
         self.setObjectName("clock")
         self.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update_time)
-        self.timer.start(1000)
+        # Nothing to redraw while off screen
+        self._tick = get_tick_bus().subscribe(get_visibility_gate().gated(self, self.update_time), 1, owner=self)
 
         self.update_time()
 
@@ -154,6 +285,45 @@ class StatusList(QListWidget):
         self.scrollToBottom()
 
 
+class AlertBanner(QLabel):
+    """
+    On-screen strip listing the alerts that are currently firing.
+    Hidden while nothing is active.
+    """
+
+    def __init__(self, parent: QWidget | None = None):
+        super().__init__(parent)
+        self.setObjectName("alertBanner")
+        self.setWordWrap(True)
+        self.setStyleSheet(
+            """
+            QLabel#alertBanner {
+                background-color: rgba(248, 81, 73, 0.18);
+                color: #ff7b72;
+                border: 1px solid rgba(248, 81, 73, 0.5);
+                border-radius: 4px;
+                font-size: 14px;
+                font-weight: bold;
+                padding: 6px 10px;
+            }
+            """
+        )
+        self._active: dict[str, str] = {}
+        self.hide()
+
+    def active(self) -> list[str]:
+        return list(self._active)
+
+    def show_alert(self, event) -> None:
+        """Apply an alerts.AlertEvent: add it when firing, drop it when resolved or stale."""
+        if event.state == FIRING:
+            self._active[event.rule] = event.message
+        else:
+            self._active.pop(event.rule, None)
+        self.setText("⚠ " + "   ·   ".join(self._active.values()) if self._active else "")
+        self.setVisible(bool(self._active))
+
+
 @dataclass
 class ToggleOption:
     label: str
@@ -391,11 +561,9 @@ class TodoListWidget(QWidget):
     def _persist_state(self) -> None:
         """Save current state to state.json."""
         try:
-            todos = self.get_items()
-            state = AppState(todos=todos)
-            save_state(state)
+            get_state_store().update("todos", self.get_items())
         except Exception as e:
-            print(f"Error persisting todo state: {e}")
+            get_logger().error("todo", f"Error persisting todo state: {e}")
 
 
 class UniTasksWidget(TodoTable):
@@ -440,7 +608,7 @@ class UniTasksWidget(TodoTable):
             else:
                 self._use_fallback_data()
         except Exception as e:
-            print(f"Error loading uni_tasks.json: {e}")
+            get_logger().error("university", f"Error loading uni_tasks.json: {e}")
             self._use_fallback_data()
 
     def _use_fallback_data(self) -> None:
@@ -481,9 +649,9 @@ class UniTasksWidget(TodoTable):
             tasks_file = Path(__file__).resolve().parents[2] / "uni_tasks.json"
             items = self.get_items()
             tasks_file.write_text(json.dumps(items, indent=2), encoding="utf-8")
-            print(f"Saved {len(items)} tasks to uni_tasks.json")
+            get_logger().info("university", f"Saved {len(items)} tasks to uni_tasks.json")
         except Exception as e:
-            print(f"Error saving uni_tasks.json: {e}")
+            get_logger().error("university", f"Error saving uni_tasks.json: {e}")
             QMessageBox.critical(self, "Error", f"Failed to save tasks: {e}")
 
 
@@ -513,7 +681,7 @@ class FocusTimerWidget(QWidget):
         # Timer display
         self.label = QLabel("25:00", self)
         self.label.setObjectName("timerLabel")
-        self.label.setStyleSheet("font-size: 28px; font-weight: bold; color: #333;")
+        self.label.setStyleSheet("font-size: 28px; font-weight: bold;")
         self.label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         timer_layout.addWidget(self.label)
         
@@ -578,8 +746,9 @@ class FocusTimerWidget(QWidget):
         self.remaining_seconds = self.total_seconds
         self.is_running = False
         
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self._update_timer)
+        # Ticks only while running; the countdown keeps going off screen, the label doesn't
+        self._tick = get_tick_bus().subscribe(self._update_timer, 1, owner=self, active=False)
+        self._refresh_display = get_visibility_gate().gated(self, self._update_display)
         
         # Celebration timer and animation
         self.celebration_timer = QTimer(self)
@@ -627,19 +796,19 @@ class FocusTimerWidget(QWidget):
         
         # Change color based on time remaining (visual feedback)
         if self.remaining_seconds <= 0:
-            self.label.setStyleSheet("font-size: 28px; font-weight: bold; color: #f44336;")  # Red
+            set_style_state(self.label, "alert")  # Red
         elif self.remaining_seconds <= 5 * 60:  # Last 5 minutes
-            self.label.setStyleSheet("font-size: 28px; font-weight: bold; color: #FF9800;")  # Orange
+            set_style_state(self.label, "warn")  # Orange
         else:
-            self.label.setStyleSheet("font-size: 28px; font-weight: bold; color: #4CAF50;")  # Green
+            set_style_state(self.label, "ok")  # Green
 
     def _update_timer(self) -> None:
         """Called every second while timer is running."""
         if self.remaining_seconds > 0:
             self.remaining_seconds -= 1
-            self._update_display()
+            self._refresh_display()
         else:
-            self.timer.stop()
+            self._tick.set_active(False)
             self.is_running = False
             self._show_celebration()
 
@@ -671,8 +840,8 @@ class FocusTimerWidget(QWidget):
 
     def _start(self) -> None:
         """Start the timer."""
-        if not self.timer.isActive() and self.remaining_seconds > 0:
-            self.timer.start(1000)
+        if not self._tick.active and self.remaining_seconds > 0:
+            self._tick.set_active(True)
             self.is_running = True
             self.start_btn.setEnabled(False)
             self.pause_btn.setEnabled(True)
@@ -680,7 +849,7 @@ class FocusTimerWidget(QWidget):
 
     def _pause(self) -> None:
         """Pause the timer."""
-        self.timer.stop()
+        self._tick.set_active(False)
         self.is_running = False
         self.start_btn.setEnabled(True)
         self.pause_btn.setEnabled(False)
@@ -688,7 +857,7 @@ class FocusTimerWidget(QWidget):
 
     def _reset(self) -> None:
         """Reset the timer."""
-        self.timer.stop()
+        self._tick.set_active(False)
         self.celebration_timer.stop()
         self.is_running = False
         self.remaining_seconds = self.total_seconds
@@ -718,13 +887,13 @@ class BreakReminderWidget(QWidget):
         # Status indicator
         self.status_label = QLabel("break status")
         self.status_label.setObjectName("breakStatus")
-        self.status_label.setStyleSheet("font-size: 12px; color: #666; font-weight: bold;")
+        self.status_label.setStyleSheet("font-size: 12px; font-weight: bold;")
         layout.addWidget(self.status_label)
 
         # Time display
         self.time_label = QLabel("0 min")
         self.time_label.setObjectName("breakTime")
-        self.time_label.setStyleSheet("font-size: 24px; font-weight: bold; color: #2196F3;")
+        self.time_label.setStyleSheet("font-size: 24px; font-weight: bold;")
         self.time_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(self.time_label)
 
@@ -742,24 +911,20 @@ class BreakReminderWidget(QWidget):
         self.break_btn.clicked.connect(self._take_break)
         layout.addWidget(self.break_btn)
 
-        # Timer for updating display
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self._update_display)
-        self.timer.start(60000)  # Update every minute
+        # Update every minute (minute precision is plenty)
+        self._tick = get_tick_bus().subscribe(
+            get_visibility_gate().gated(self, self._update_display), 60, coarse=True, owner=self
+        )
 
         self._state = BreakReminderState()
         self._load_state()
         self._update_display()
 
     def _load_state(self) -> None:
-        """Load break reminder state from state.json."""
-        try:
-            from app.state import load_state
-            state = load_state()
-            if state.break_reminder:
-                self._state = state.break_reminder
-        except Exception:
-            pass
+        """Take this widget's break reminder section from the shared state store."""
+        section = get_state_store().section("break_reminder")
+        if section:
+            self._state = section
 
     def _update_display(self) -> None:
         """Update the display based on elapsed time."""
@@ -768,7 +933,7 @@ class BreakReminderWidget(QWidget):
         if not self._state.last_break_time:
             self.time_label.setText("0 min")
             self.status_label.setText("no break yet")
-            self.status_label.setStyleSheet("font-size: 12px; color: #FF5722; font-weight: bold;")
+            set_style_state(self.status_label, "alert")
             return
             
         try:
@@ -780,13 +945,13 @@ class BreakReminderWidget(QWidget):
             
             if minutes < 30:
                 self.status_label.setText(f"last break: {minutes} min ago")
-                self.status_label.setStyleSheet("font-size: 12px; color: #4CAF50; font-weight: bold;")
-                self.time_label.setStyleSheet("font-size: 24px; font-weight: bold; color: #4CAF50;")
+                set_style_state(self.status_label, "ok")
+                set_style_state(self.time_label, "ok")
                 self.message_label.setText("You're in the zone! Keep going 🚀")
             else:
                 self.status_label.setText("break recommended!")
-                self.status_label.setStyleSheet("font-size: 12px; color: #FF5722; font-weight: bold;")
-                self.time_label.setStyleSheet("font-size: 24px; font-weight: bold; color: #FF5722;")
+                set_style_state(self.status_label, "alert")
+                set_style_state(self.time_label, "alert")
                 self.message_label.setText("Time for a break! Rest your eyes and mind 👁️")
         except Exception:
             pass
@@ -800,14 +965,8 @@ class BreakReminderWidget(QWidget):
         self._update_display()
 
     def _save_state(self) -> None:
-        """Save state to state.json."""
-        try:
-            from app.state import load_state
-            state = load_state()
-            state.break_reminder = self._state
-            save_state(state)
-        except Exception as e:
-            print(f"Error saving break reminder state: {e}")
+        """Hand the section back to the state store; it is written shortly after."""
+        get_state_store().update("break_reminder", self._state)
 
     def get_state(self) -> BreakReminderState:
         """Get current state."""
@@ -842,7 +1001,7 @@ class FocusStreakWidget(QWidget):
         # Big number
         self.streak_number = QLabel("0")
         self.streak_number.setObjectName("streakNumber")
-        self.streak_number.setStyleSheet("font-size: 32px; font-weight: bold; color: #FF6F00;")
+        self.streak_number.setStyleSheet("font-weight: bold;")
         self.streak_number.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(self.streak_number)
 
@@ -881,14 +1040,10 @@ class FocusStreakWidget(QWidget):
         self._update_display()
 
     def _load_state(self) -> None:
-        """Load focus streak state from state.json."""
-        try:
-            from app.state import load_state
-            state = load_state()
-            if state.focus_streak:
-                self._state = state.focus_streak
-        except Exception:
-            pass
+        """Take this widget's focus streak section from the shared state store."""
+        section = get_state_store().section("focus_streak")
+        if section:
+            self._state = section
 
     def _update_display(self) -> None:
         """Update the display based on streak."""
@@ -911,10 +1066,10 @@ class FocusStreakWidget(QWidget):
         
         if milestone_msg:
             self.milestone_label.setText(milestone_msg)
-            self.streak_number.setStyleSheet("font-size: 36px; font-weight: bold; color: #FFD700;")
+            set_style_state(self.streak_number, "milestone")
         else:
             self.streak_label.setText(f"current streak: {self._state.current_streak} sessions")
-            self.streak_number.setStyleSheet("font-size: 32px; font-weight: bold; color: #FF6F00;")
+            set_style_state(self.streak_number, "ok")
 
     def _add_session(self) -> None:
         """Add a completed session."""
@@ -935,14 +1090,8 @@ class FocusStreakWidget(QWidget):
         self._update_display()
 
     def _save_state(self) -> None:
-        """Save state to state.json."""
-        try:
-            from app.state import load_state
-            state = load_state()
-            state.focus_streak = self._state
-            save_state(state)
-        except Exception as e:
-            print(f"Error saving focus streak state: {e}")
+        """Hand the section back to the state store; it is written shortly after."""
+        get_state_store().update("focus_streak", self._state)
 
     def get_state(self) -> FocusStreakState:
         """Get current state."""
@@ -971,13 +1120,13 @@ class DistractionBlockerWidget(QWidget):
         # Status indicator
         self.status_label = QLabel("dnd mode")
         self.status_label.setObjectName("dndStatus")
-        self.status_label.setStyleSheet("font-size: 12px; color: #666; font-weight: bold;")
+        self.status_label.setStyleSheet("font-size: 12px; font-weight: bold;")
         layout.addWidget(self.status_label)
 
         # Timer display
         self.timer_label = QLabel("OFF")
         self.timer_label.setObjectName("dndTimer")
-        self.timer_label.setStyleSheet("font-size: 28px; font-weight: bold; color: #4CAF50;")
+        self.timer_label.setStyleSheet("font-size: 28px; font-weight: bold;")
         self.timer_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(self.timer_label)
 
@@ -1009,24 +1158,19 @@ class DistractionBlockerWidget(QWidget):
         categories_label.setWordWrap(True)
         layout.addWidget(categories_label)
 
-        # Update timer
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self._update_timer)
-        self.timer.start(1000)
+        # Update every second (the countdown label only while on screen)
+        self._refresh_timer_label = get_visibility_gate().gated(self, self._update_timer)
+        self._tick = get_tick_bus().subscribe(self._on_tick, 1, owner=self)
 
         self._state = DistractionBlockerState()
         self._load_state()
         self._update_display()
 
     def _load_state(self) -> None:
-        """Load distraction blocker state from state.json."""
-        try:
-            from app.state import load_state
-            state = load_state()
-            if state.distraction_blocker:
-                self._state = state.distraction_blocker
-        except Exception:
-            pass
+        """Take this widget's distraction blocker section from the shared state store."""
+        section = get_state_store().section("distraction_blocker")
+        if section:
+            self._state = section
 
     def _activate_dnd(self, minutes: int) -> None:
         """Activate Do Not Disturb mode for specified minutes."""
@@ -1045,13 +1189,27 @@ class DistractionBlockerWidget(QWidget):
         self._save_state()
         self._update_display()
 
+    def _on_tick(self) -> None:
+        """Expire DND even while off screen; only the label refresh is gated."""
+        from datetime import datetime
+
+        if self._state.is_active:
+            try:
+                expired = datetime.now() >= datetime.fromisoformat(self._state.blocked_until)
+            except ValueError:
+                expired = False
+            if expired:
+                self._deactivate_dnd()
+                return
+        self._refresh_timer_label()
+
     def _update_timer(self) -> None:
         """Update the timer display."""
         from datetime import datetime
         
         if not self._state.is_active:
             self.timer_label.setText("OFF")
-            self.timer_label.setStyleSheet("font-size: 28px; font-weight: bold; color: #4CAF50;")
+            set_style_state(self.timer_label, "ok")
             self.status_label.setText("dnd mode: off")
             return
         
@@ -1068,7 +1226,7 @@ class DistractionBlockerWidget(QWidget):
             seconds = int(remaining.total_seconds() % 60)
             
             self.timer_label.setText(f"{minutes:02d}:{seconds:02d}")
-            self.timer_label.setStyleSheet("font-size: 28px; font-weight: bold; color: #FF5722;")
+            set_style_state(self.timer_label, "alert")
             self.status_label.setText(f"dnd mode: on ({self._state.block_reason})")
         except Exception:
             pass
@@ -1078,14 +1236,8 @@ class DistractionBlockerWidget(QWidget):
         self._update_timer()
 
     def _save_state(self) -> None:
-        """Save state to state.json."""
-        try:
-            from app.state import load_state
-            state = load_state()
-            state.distraction_blocker = self._state
-            save_state(state)
-        except Exception as e:
-            print(f"Error saving distraction blocker state: {e}")
+        """Hand the section back to the state store; it is written shortly after."""
+        get_state_store().update("distraction_blocker", self._state)
 
     def get_state(self) -> DistractionBlockerState:
         """Get current state."""
@@ -1114,7 +1266,7 @@ class HydrationReminderWidget(QWidget):
         # Status label
         self.status_label = QLabel("hydration")
         self.status_label.setObjectName("hydrationStatus")
-        self.status_label.setStyleSheet("font-size: 12px; color: #666; font-weight: bold;")
+        self.status_label.setStyleSheet("font-size: 12px; font-weight: bold;")
         layout.addWidget(self.status_label)
 
         # Water count display
@@ -1154,24 +1306,20 @@ class HydrationReminderWidget(QWidget):
         self.water_btn.clicked.connect(self._log_water)
         layout.addWidget(self.water_btn)
 
-        # Update timer (30 minute interval)
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self._check_reminder)
-        self.timer.start(30000)  # Every 30 seconds for demo, use 1800000 for production
+        # Re-check every 30 seconds, offset from the minute tick
+        self._tick = get_tick_bus().subscribe(
+            get_visibility_gate().gated(self, self._check_reminder), 30, phase_s=15, coarse=True, owner=self
+        )
 
         self._state = HydrationReminderState()
         self._load_state()
         self._update_display()
 
     def _load_state(self) -> None:
-        """Load hydration reminder state from state.json."""
-        try:
-            from app.state import load_state
-            state = load_state()
-            if state.hydration_reminder:
-                self._state = state.hydration_reminder
-        except Exception:
-            pass
+        """Take this widget's hydration reminder section from the shared state store."""
+        section = get_state_store().section("hydration_reminder")
+        if section:
+            self._state = section
 
     def _check_reminder(self) -> None:
         """Check if it's time to remind about water."""
@@ -1179,7 +1327,7 @@ class HydrationReminderWidget(QWidget):
         
         if not self._state.last_water_time:
             self.status_label.setText("time to drink water! 💧")
-            self.status_label.setStyleSheet("font-size: 12px; color: #FF5722; font-weight: bold;")
+            set_style_state(self.status_label, "alert")
             return
         
         try:
@@ -1188,10 +1336,10 @@ class HydrationReminderWidget(QWidget):
             
             if elapsed > timedelta(minutes=30):
                 self.status_label.setText("time to drink water! 💧")
-                self.status_label.setStyleSheet("font-size: 12px; color: #FF5722; font-weight: bold;")
+                set_style_state(self.status_label, "alert")
             else:
                 self.status_label.setText("hydration on track ✓")
-                self.status_label.setStyleSheet("font-size: 12px; color: #4CAF50; font-weight: bold;")
+                set_style_state(self.status_label, "ok")
         except Exception:
             pass
 
@@ -1226,14 +1374,8 @@ class HydrationReminderWidget(QWidget):
         self._check_reminder()
 
     def _save_state(self) -> None:
-        """Save state to state.json."""
-        try:
-            from app.state import load_state
-            state = load_state()
-            state.hydration_reminder = self._state
-            save_state(state)
-        except Exception as e:
-            print(f"Error saving hydration reminder state: {e}")
+        """Hand the section back to the state store; it is written shortly after."""
+        get_state_store().update("hydration_reminder", self._state)
 
     def get_state(self) -> HydrationReminderState:
         """Get current state."""
@@ -1312,14 +1454,10 @@ class PomodoroCyclesWidget(QWidget):
         self._update_display()
 
     def _load_state(self) -> None:
-        """Load pomodoro cycles state from state.json."""
-        try:
-            from app.state import load_state
-            state = load_state()
-            if state.pomodoro_cycles:
-                self._state = state.pomodoro_cycles
-        except Exception:
-            pass
+        """Take this widget's pomodoro cycles section from the shared state store."""
+        section = get_state_store().section("pomodoro_cycles")
+        if section:
+            self._state = section
 
     def _log_cycle(self) -> None:
         """Log a completed pomodoro cycle (25 minutes by default)."""
@@ -1358,14 +1496,8 @@ class PomodoroCyclesWidget(QWidget):
         self.recommendation_label.setText(rec)
 
     def _save_state(self) -> None:
-        """Save state to state.json."""
-        try:
-            from app.state import load_state
-            state = load_state()
-            state.pomodoro_cycles = self._state
-            save_state(state)
-        except Exception as e:
-            print(f"Error saving pomodoro cycles state: {e}")
+        """Hand the section back to the state store; it is written shortly after."""
+        get_state_store().update("pomodoro_cycles", self._state)
 
     def get_state(self) -> PomodoroCyclesState:
         """Get current state."""
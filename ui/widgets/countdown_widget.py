@@ -1,7 +1,10 @@
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel, QDateTimeEdit, QPushButton
-from PySide6.QtCore import QTimer, QDateTime
+from PySide6.QtCore import QDateTime
 import datetime
 
+from app.tickbus import get_tick_bus
+from ui.visibility import get_visibility_gate
+
 class CountdownWidget(QWidget):
     """
     Lets you set a countdown to a specific date/time and shows time remaining.
@@ -19,12 +22,13 @@ class CountdownWidget(QWidget):
         self.layout().addWidget(self.start_btn)
         self.remaining_label = QLabel("")
         self.layout().addWidget(self.remaining_label)
-        self.timer = QTimer()
-        self.timer.timeout.connect(self.update_remaining)
+        self._tick = get_tick_bus().subscribe(
+            get_visibility_gate().gated(self, self.update_remaining), 1, owner=self, active=False
+        )
 
     def start_countdown(self):
         self.target_dt = self.datetime_edit.dateTime().toPython()
-        self.timer.start(1000)
+        self._tick.set_active(True)
         self.update_remaining()
 
     def update_remaining(self):
@@ -32,7 +36,7 @@ class CountdownWidget(QWidget):
         delta = self.target_dt - now
         if delta.total_seconds() <= 0:
             self.remaining_label.setText("Time's up!")
-            self.timer.stop()
+            self._tick.set_active(False)
         else:
             days = delta.days
             hours, rem = divmod(delta.seconds, 3600)
@@ -0,0 +1,107 @@
+import math
+
+from PySide6.QtCore import QRectF, Qt
+from PySide6.QtGui import QColor, QFont, QPainter
+from PySide6.QtWidgets import QLabel, QVBoxLayout, QWidget
+
+from app.sensors import SensorSnapshot, get_sensor_hub
+from ui.visibility import get_visibility_gate
+
+
+def _build_color_lut() -> list[QColor]:
+    # One colour per whole percent: green -> yellow -> red
+    lut = []
+    for pct in range(101):
+        t = pct / 100.0
+        if t < 0.5:
+            r, g = int(510 * t), 204
+        else:
+            r, g = 255, int(204 * (2.0 - 2.0 * t))
+        lut.append(QColor(r, g, 48))
+    return lut
+
+
+COLOR_LUT = _build_color_lut()
+
+
+class CoreHeatmap(QWidget):
+    """
+    Per-core utilisation grid painted in one widget (no child widget per core).
+    Repaints only when at least one core changes colour bucket.
+    """
+
+    def __init__(self, parent: QWidget | None = None) -> None:
+        super().__init__(parent)
+        self._levels: tuple[int, ...] = ()
+        self._font = QFont()
+        self._font.setPointSize(8)
+        self.setMinimumHeight(60)
+
+    def set_loads(self, loads: tuple[float, ...]) -> bool:
+        """Store per-core loads; returns True when a repaint was scheduled."""
+        levels = tuple(min(100, max(0, int(v + 0.5))) for v in loads)
+        if levels == self._levels:
+            return False
+        self._levels = levels
+        self.update()
+        return True
+
+    def levels(self) -> tuple[int, ...]:
+        return self._levels
+
+    def _grid(self, n: int) -> tuple[int, int]:
+        # Roughly square cells for the current aspect ratio
+        w = max(1, self.width())
+        h = max(1, self.height())
+        cols = max(1, min(n, round(math.sqrt(n * w / h))))
+        rows = math.ceil(n / cols)
+        return cols, rows
+
+    def paintEvent(self, event) -> None:
+        n = len(self._levels)
+        if not n:
+            return
+
+        cols, rows = self._grid(n)
+        gap = 3.0
+        cell_w = (self.width() - gap * (cols - 1)) / cols
+        cell_h = (self.height() - gap * (rows - 1)) / rows
+        show_text = cell_w >= 28 and cell_h >= 16
+
+        painter = QPainter(self)
+        painter.setFont(self._font)
+        painter.setPen(QColor("#0b0f14"))
+        for i, level in enumerate(self._levels):
+            row, col = divmod(i, cols)
+            rect = QRectF(col * (cell_w + gap), row * (cell_h + gap), cell_w, cell_h)
+            painter.fillRect(rect, COLOR_LUT[level])
+            if show_text:
+                painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, str(level))
+        painter.end()
+
+
+class CpuCoresWidget(QWidget):
+    """
+    Shows per-core CPU utilisation as a heatmap grid, fed by the shared sensor hub.
+    """
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setLayout(QVBoxLayout())
+        self.title = QLabel("CPU Cores")
+        self.title.setStyleSheet("font-size: 16px; font-weight: bold;")
+        self.layout().addWidget(self.title)
+        self.heatmap = CoreHeatmap(self)
+        self.layout().addWidget(self.heatmap, 1)
+        hub = get_sensor_hub()
+        get_visibility_gate().connect_gated(hub.snapshot, self, self.update_cores)
+        if hub.latest is not None:
+            self.update_cores(hub.latest)
+
+    def update_cores(self, snap: SensorSnapshot):
+        self.heatmap.set_loads(snap.cpu_per_core)
+
+    def get_state(self):
+        return {}
+
+    def set_state(self, state):
+        pass
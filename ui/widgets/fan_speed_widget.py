@@ -1,13 +1,108 @@
-import psutil
-from PySide6.QtCore import QTimer, Qt
+from PySide6.QtCore import Qt
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel, QHBoxLayout, QProgressBar
 from PySide6.QtGui import QFont
 
+from app.sensors import SensorSnapshot, get_sensor_hub
+from app.utils import unique_labels
+from app.window_style import set_style_state
+from ui.visibility import get_visibility_gate
+
+
+def _format_temp(temp_c: float) -> str:
+    return f"{temp_c:.1f}°C"
+
+
+def _format_rpm(rpm: float) -> str:
+    return f"{int(rpm):,} RPM"
+
+
+def _temp_state(temp_c: float) -> str:
+    """Colour band for a temperature (see STATE_STYLE in app/window_style.py)."""
+    if temp_c < 40:
+        return "ok"  # Green
+    if temp_c < 60:
+        return "warm"  # Yellow
+    if temp_c < 80:
+        return "hot"  # Orange
+    return "alert"  # Red
+
+
+class _Row:
+    __slots__ = ("container", "name_label", "value_label")
+
+    def __init__(self, name: str, value_object_name: str) -> None:
+        self.container = QWidget()
+        layout = QHBoxLayout(self.container)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(10)
+
+        self.name_label = QLabel(name[:30])
+        self.name_label.setMinimumWidth(120)
+        self.name_label.setStyleSheet("color: #aaaaaa; font-size: 10px;")
+        layout.addWidget(self.name_label)
+
+        self.value_label = QLabel("")
+        self.value_label.setObjectName(value_object_name)
+        self.value_label.setMinimumWidth(80)
+        self.value_label.setAlignment(Qt.AlignmentFlag.AlignRight)
+        self.value_label.setStyleSheet("font-weight: bold; font-size: 10px;")
+        layout.addWidget(self.value_label)
+
+        layout.addStretch()
+
+
+class _RowPool:
+    """
+    One row per sensor, kept across snapshots. Rows are keyed by
+    utils.unique_labels(), so sensors sharing a label ("Composite" on two
+    drives) each keep a row; the label itself is only the row's text.
+    A refresh only rewrites value text and colour state; rows are created
+    or deleted only when the sensor set changes, so the widget tree stays
+    the same size while it runs.
+    """
+
+    def __init__(self, layout: QVBoxLayout, format_value, state_for, value_object_name: str) -> None:
+        self._layout = layout
+        self._format = format_value
+        self._state_for = state_for
+        self._object_name = value_object_name
+        self._rows: dict[str, _Row] = {}
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def row(self, key: str) -> _Row | None:
+        return self._rows.get(key)
+
+    def sync(self, readings) -> None:
+        keys = unique_labels(name for name, _ in readings)
+        for index, (key, (name, value)) in enumerate(zip(keys, readings)):
+            row = self._rows.get(key)
+            if row is None:
+                row = self._rows[key] = _Row(name, self._object_name)
+                self._layout.insertWidget(index, row.container)
+            elif self._layout.indexOf(row.container) != index:
+                # Sensor order changed: move the existing row
+                self._layout.removeWidget(row.container)
+                self._layout.insertWidget(index, row.container)
+
+            text = self._format(value)
+            if row.value_label.text() != text:
+                row.value_label.setText(text)
+            if self._state_for is not None:
+                set_style_state(row.value_label, self._state_for(value))
+
+        seen = set(keys)
+        for key in [k for k in self._rows if k not in seen]:
+            row = self._rows.pop(key)
+            self._layout.removeWidget(row.container)
+            row.container.deleteLater()
+
 
 class FanSpeedWidget(QWidget):
     """
-    Displays current PC system temperature and hardware status.
-    Uses psutil for cross-platform temperature monitoring.
+    Displays current PC system temperatures, fan speeds and hardware status.
+    Readings come from the shared SensorHub (hwmon or psutil, sampled off the GUI thread).
     No WMI dependency - works on all systems.
     """
     
@@ -52,6 +147,18 @@ class FanSpeedWidget(QWidget):
         self.temps_container = QVBoxLayout()
         self.temps_container.setSpacing(8)
         layout.addLayout(self.temps_container)
+        self.temp_rows = _RowPool(self.temps_container, _format_temp, _temp_state, "tempValue")
+        
+        # Fans container (hidden until a fan reports)
+        self.fan_label_header = QLabel("Fans")
+        self.fan_label_header.setStyleSheet("color: #aaaaaa; font-size: 10px; font-weight: bold; margin-top: 12px;")
+        self.fan_label_header.setVisible(False)
+        layout.addWidget(self.fan_label_header)
+        
+        self.fans_container = QVBoxLayout()
+        self.fans_container.setSpacing(8)
+        layout.addLayout(self.fans_container)
+        self.fan_rows = _RowPool(self.fans_container, _format_rpm, None, "fanValue")
         
         # Status label
         self.status_label = QLabel("Initializing...")
@@ -64,119 +171,39 @@ class FanSpeedWidget(QWidget):
         
         layout.addStretch()
         
-        # Timer for updates
-        self.update_timer = QTimer(self)
-        self.update_timer.timeout.connect(self.update_data)
-        self.update_timer.start(2000)  # Update every 2 seconds
+        # Updates arrive from the shared sensor hub
+        hub = get_sensor_hub()
+        get_visibility_gate().connect_gated(hub.snapshot, self, self.update_data)
         
-        # Initial update
-        self.update_data()
+        # Initial update from the last sample, if any
+        if hub.latest is not None:
+            self.update_data(hub.latest)
     
-    def update_data(self) -> None:
-        """Fetch and update system temperature data using psutil."""
+    def update_data(self, snap: SensorSnapshot) -> None:
+        """Render the latest sensor snapshot."""
         try:
-            # Clear old temp items
-            while self.temps_container.count():
-                self.temps_container.takeAt(0).widget().deleteLater()
+            # CPU load
+            self.cpu_label.setText(f"CPU Load: {snap.cpu_percent:.1f}%")
+            self.cpu_bar.setValue(int(snap.cpu_percent))
             
-            # Get CPU load
-            cpu_percent = psutil.cpu_percent(interval=0.1)
-            self.cpu_label.setText(f"CPU Load: {cpu_percent:.1f}%")
-            self.cpu_bar.setValue(int(cpu_percent))
+            # Temperature sensors (first reading per sensor)
+            self.temp_rows.sync(snap.temperatures)
             
-            # Try to get temperature sensors
-            temps_found = False
-            try:
-                temps = psutil.sensors_temperatures()
-                if temps:
-                    for sensor_name, sensor_temps in temps.items():
-                        if sensor_temps:
-                            # Use the first reading for each sensor
-                            for reading in sensor_temps:
-                                label = reading.label or sensor_name
-                                current_temp = reading.current
-                                temps_found = True
-                                self._add_temp_item(label, current_temp)
-                                # Only show first sensor per type
-                                break
-            except Exception:
-                pass
+            # Fan speeds
+            self.fan_rows.sync(snap.fans)
+            self.fan_label_header.setVisible(bool(snap.fans))
             
-            if temps_found:
+            if snap.temperatures:
                 self.status_label.setText("Live monitoring")
-            else:
+            elif snap.cpu_freq_mhz:
                 # Fallback: show CPU frequency
-                try:
-                    freq = psutil.cpu_freq()
-                    if freq:
-                        self.status_label.setText(f"CPU Freq: {freq.current:.0f} MHz (no sensors)")
-                    else:
-                        self.status_label.setText("No temperature sensors available")
-                except Exception:
-                    self.status_label.setText("No temperature sensors available")
+                self.status_label.setText(f"CPU Freq: {snap.cpu_freq_mhz:.0f} MHz (no sensors)")
+            else:
+                self.status_label.setText("No temperature sensors available")
         
         except Exception as e:
             self.status_label.setText(f"Error: {str(e)[:40]}")
     
-    def _add_fan_item(self, name: str, rpm: int) -> None:
-        """Add a fan speed item to the display."""
-        container = QWidget()
-        layout = QHBoxLayout(container)
-        layout.setContentsMargins(0, 0, 0, 0)
-        layout.setSpacing(10)
-        
-        # Fan name
-        name_label = QLabel(name[:30])
-        name_label.setMinimumWidth(120)
-        name_label.setStyleSheet("color: #aaaaaa; font-size: 10px;")
-        layout.addWidget(name_label)
-        
-        # RPM value
-        rpm_label = QLabel(f"{rpm:,} RPM")
-        rpm_label.setMinimumWidth(80)
-        rpm_label.setAlignment(Qt.AlignmentFlag.AlignRight)
-        rpm_label.setStyleSheet("color: #00cc00; font-weight: bold; font-size: 10px;")
-        layout.addWidget(rpm_label)
-        
-        layout.addStretch()
-        
-        self.fans_container.addWidget(container)
-    
-    def _add_temp_item(self, name: str, temp_c: float) -> None:
-        """Add a temperature item to the display."""
-        container = QWidget()
-        layout = QHBoxLayout(container)
-        layout.setContentsMargins(0, 0, 0, 0)
-        layout.setSpacing(10)
-        
-        # Temperature name
-        name_label = QLabel(name[:30])
-        name_label.setMinimumWidth(120)
-        name_label.setStyleSheet("color: #aaaaaa; font-size: 10px;")
-        layout.addWidget(name_label)
-        
-        # Temperature value with color coding
-        temp_label = QLabel(f"{temp_c:.1f}°C")
-        temp_label.setMinimumWidth(80)
-        temp_label.setAlignment(Qt.AlignmentFlag.AlignRight)
-        
-        # Color based on temperature
-        if temp_c < 40:
-            color = "#00cc00"  # Green
-        elif temp_c < 60:
-            color = "#ffcc00"  # Yellow
-        elif temp_c < 80:
-            color = "#ff6600"  # Orange
-        else:
-            color = "#ff0000"  # Red
-        
-        temp_label.setStyleSheet(f"color: {color}; font-weight: bold; font-size: 10px;")
-        layout.addWidget(temp_label)
-        
-        layout.addStretch()
-        
-        self.temps_container.addWidget(container)
-    
     def get_state(self) -> dict:
         """Return widget state (read-only widget, no state to persist)."""
         return {}
@@ -1,9 +1,13 @@
-import psutil
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel, QProgressBar
 
+from app.io_rates import format_rate
+from app.sensors import get_sensor_hub
+from ui.visibility import get_visibility_gate
+
 class SystemStatsWidget(QWidget):
     """
-    Shows CPU, RAM, GPU, and network usage (minimal, with small bars).
+    Shows CPU, RAM, GPU, and network/disk throughput (minimal, with small bars).
+    Refreshes on every sensor hub snapshot.
     """
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -17,11 +21,30 @@ class SystemStatsWidget(QWidget):
         self.ram_bar = QProgressBar()
         self.ram_bar.setFormat("RAM: %p%")
         self.layout().addWidget(self.ram_bar)
-        self.update_stats()
+        self.gpu_bar = QProgressBar()
+        self.gpu_bar.setFormat("GPU: %p%")
+        self.gpu_bar.setVisible(False)
+        self.layout().addWidget(self.gpu_bar)
+        self.net_label = QLabel("NET  ↓ --  ↑ --")
+        self.layout().addWidget(self.net_label)
+        self.disk_label = QLabel("DISK  R --  W --")
+        self.layout().addWidget(self.disk_label)
+        hub = get_sensor_hub()
+        get_visibility_gate().connect_gated(hub.snapshot, self, self.update_stats)
+        if hub.latest is not None:
+            self.update_stats(hub.latest)
 
-    def update_stats(self):
-        self.cpu_bar.setValue(int(psutil.cpu_percent()))
-        self.ram_bar.setValue(int(psutil.virtual_memory().percent))
+    def update_stats(self, snap):
+        self.cpu_bar.setValue(int(snap.cpu_percent))
+        self.ram_bar.setValue(int(snap.ram_percent))
+        if snap.gpu is not None:
+            self.gpu_bar.setVisible(True)
+            self.gpu_bar.setValue(int(snap.gpu.load_percent))
+        io = snap.io
+        if io.net:
+            self.net_label.setText(f"NET  ↓ {format_rate(io.net_rx_bps)}  ↑ {format_rate(io.net_tx_bps)}")
+        if io.disk:
+            self.disk_label.setText(f"DISK  R {format_rate(io.disk_read_bps)}  W {format_rate(io.disk_write_bps)}")
 
     def get_state(self):
         return {}
@@ -0,0 +1,71 @@
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel
+
+from app.sensors import get_sensor_hub
+from ui.visibility import get_visibility_gate
+
+TOP_N = 5
+
+
+def _format_bytes(n: float) -> str:
+    for unit in ("B", "KB", "MB", "GB"):
+        if n < 1024.0:
+            return f"{n:.0f} {unit}" if unit == "B" else f"{n:.1f} {unit}"
+        n /= 1024.0
+    return f"{n:.1f} TB"
+
+
+class TopProcessesWidget(QWidget):
+    """
+    Heaviest processes by CPU and by resident memory. The process scan runs
+    on the sensor hub thread; this widget only relabels a fixed set of rows.
+    """
+    def __init__(self, parent=None, top_n: int = TOP_N):
+        super().__init__(parent)
+        self.setLayout(QVBoxLayout())
+        self.title = QLabel("Top Processes")
+        self.title.setStyleSheet("font-size: 16px; font-weight: bold;")
+        self.layout().addWidget(self.title)
+
+        columns = QHBoxLayout()
+        self.cpu_rows = self._add_column(columns, "CPU", top_n)
+        self.mem_rows = self._add_column(columns, "Memory", top_n)
+        self.layout().addLayout(columns)
+
+        hub = get_sensor_hub()
+        hub.enable_processes(top_n)
+        get_visibility_gate().connect_gated(hub.snapshot, self, self.update_processes)
+        if hub.latest is not None:
+            self.update_processes(hub.latest)
+
+    def _add_column(self, parent_layout, heading, rows):
+        column = QVBoxLayout()
+        header = QLabel(heading)
+        header.setStyleSheet("font-size: 13px; font-weight: bold; color: #8aa0b5;")
+        column.addWidget(header)
+        labels = []
+        for _ in range(rows):
+            label = QLabel("")
+            label.setStyleSheet("font-size: 13px; font-family: monospace;")
+            column.addWidget(label)
+            labels.append(label)
+        column.addStretch()
+        parent_layout.addLayout(column)
+        return labels
+
+    @staticmethod
+    def _fill(labels, lines):
+        for i, label in enumerate(labels):
+            text = lines[i] if i < len(lines) else ""
+            if label.text() != text:
+                label.setText(text)
+
+    def update_processes(self, snap):
+        top = snap.processes
+        self._fill(self.cpu_rows, [f"{p.name[:18]:<18} {p.cpu_percent:5.1f}%" for p in top.by_cpu])
+        self._fill(self.mem_rows, [f"{p.name[:18]:<18} {_format_bytes(p.rss_bytes):>9}" for p in top.by_rss])
+
+    def get_state(self):
+        return {}
+
+    def set_state(self, state):
+        pass